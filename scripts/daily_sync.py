@@ -136,6 +136,7 @@ def sync(
                 channel_id=channel,
                 days=days,
                 dry_run=dry_run,
+                full=init,
             )
             results["slack"] = result
             print_result("Slack", result)
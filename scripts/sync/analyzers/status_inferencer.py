@@ -13,6 +13,7 @@ from models_v2 import (
     VendorStatus, EmailThread, StatusTransition, VendorState
 )
 from config_models import ProjectConfig, StatusTransitionRule
+from keyword_matcher import KeywordMatcher
 
 
 class StatusInferencer:
@@ -47,10 +48,29 @@ class StatusInferencer:
         "제외": VendorStatus.EXCLUDED,
     }
 
+    # Fallback keyword groups (used when no config rule matches)
+    FALLBACK_KEYWORDS = {
+        "quote_received": ["견적 수령", "견적 도착", "견적서"],
+        "negotiation": ["협상", "미팅", "회의"],
+        "contract": ["계약", "법무", "contract"],
+    }
+
     def __init__(self, config: Optional[ProjectConfig] = None):
         """Initialize with optional project config."""
         self.config = config
 
+        # Rule triggers (category = rule index) + fallback groups in one automaton
+        rules = config.status_rules if config else []
+        self._matcher = KeywordMatcher.from_status_rules(rules)
+        for category, keywords in self.FALLBACK_KEYWORDS.items():
+            for keyword in keywords:
+                self._matcher.add(category, keyword)
+
+    def _matched_categories(self, signals: List[str]) -> set:
+        """Rule indices / fallback groups with a trigger in any signal (one pass)."""
+        # Triggers never contain newlines, so hits cannot span two signals
+        return {hit.category for hit in self._matcher.iter_hits("\n".join(signals))}
+
     def _parse_status(self, status_str: str) -> Optional[VendorStatus]:
         """Convert status string to VendorStatus enum."""
         status_lower = status_str.lower().replace(" ", "_")
@@ -88,10 +108,12 @@ class StatusInferencer:
                     requires_approval=False,
                 )
 
+        matched = self._matched_categories(keyword_signals)
+
         # Priority 2: Config-based rules
         if self.config and self.config.status_rules:
-            for rule in self.config.status_rules:
-                if self._rule_matches(rule, current, keyword_signals):
+            for index, rule in enumerate(self.config.status_rules):
+                if index in matched and self._rule_matches(rule, current):
                     to_status = self._parse_status(rule.to_status)
                     if to_status and to_status != current:
                         return StatusTransition(
@@ -104,7 +126,7 @@ class StatusInferencer:
                         )
 
         # Priority 3: Keyword-based inference (fallback)
-        transition = self._infer_from_keywords(current, keyword_signals)
+        transition = self._infer_from_keywords(current, matched)
         if transition:
             return transition
 
@@ -114,37 +136,22 @@ class StatusInferencer:
         self,
         rule: StatusTransitionRule,
         current: VendorStatus,
-        signals: List[str],
     ) -> bool:
-        """Check if a rule matches current state and signals."""
-        # Check from_status
+        """Check if a rule applies to the current state (triggers are matched by _matcher)."""
         if rule.from_status != "*":
             from_status = self._parse_status(rule.from_status)
             if from_status != current:
                 return False
-
-        # Check triggers
-        signals_lower = [s.lower() for s in signals]
-        for trigger in rule.triggers:
-            if trigger.lower() in signals_lower:
-                return True
-            # Partial match
-            for signal in signals_lower:
-                if trigger.lower() in signal:
-                    return True
-
-        return False
+        return True
 
     def _infer_from_keywords(
         self,
         current: VendorStatus,
-        signals: List[str],
+        matched: set,
     ) -> Optional[StatusTransition]:
         """Fallback keyword-based inference."""
-        signals_text = " ".join(signals).lower()
-
         # Quote received signals
-        if any(kw in signals_text for kw in ["견적 수령", "견적 도착", "견적서"]):
+        if "quote_received" in matched:
             if current in [VendorStatus.QUOTE_WAITING, VendorStatus.RFP_SENT]:
                 return StatusTransition(
                     from_status=current,
@@ -155,7 +162,7 @@ class StatusInferencer:
                 )
 
         # Negotiation signals
-        if any(kw in signals_text for kw in ["협상", "미팅", "회의"]):
+        if "negotiation" in matched:
             if current in [VendorStatus.REVIEWING, VendorStatus.QUOTE_RECEIVED]:
                 return StatusTransition(
                     from_status=current,
@@ -166,7 +173,7 @@ class StatusInferencer:
                 )
 
         # Contract signals
-        if any(kw in signals_text for kw in ["계약", "법무", "contract"]):
+        if "contract" in matched:
             if current == VendorStatus.NEGOTIATING:
                 return StatusTransition(
                     from_status=current,
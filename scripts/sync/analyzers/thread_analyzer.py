@@ -3,7 +3,7 @@
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # Add root for lib imports
 sys.path.insert(0, str(Path(__file__).parents[4]))
@@ -14,6 +14,12 @@ from lib.gmail import GmailClient
 sys.path.insert(0, str(Path(__file__).parents[1]))
 from models_v2 import EmailThread, CommunicationDirection
 from config_models import ProjectConfig
+try:
+    from ..collectors.gmail_batch import GmailBatchFetcher
+    from ..client_registry import get_api_scheduler, get_gmail_client, get_user_email
+except ImportError:
+    from collectors.gmail_batch import GmailBatchFetcher
+    from client_registry import get_api_scheduler, get_gmail_client, get_user_email
 
 
 class ThreadAnalyzer:
@@ -21,7 +27,7 @@ class ThreadAnalyzer:
 
     def __init__(self, gmail_client: Optional[GmailClient] = None, config: Optional[ProjectConfig] = None):
         """Initialize with Gmail client and project config."""
-        self.gmail_client = gmail_client or GmailClient()
+        self.gmail_client = gmail_client or get_gmail_client()
         self.config = config
         self._user_email = None
 
@@ -29,8 +35,7 @@ class ThreadAnalyzer:
     def user_email(self) -> str:
         """Get current user's email address."""
         if self._user_email is None:
-            profile = self.gmail_client.get_profile()
-            self._user_email = profile.get("emailAddress", "").lower()
+            self._user_email = get_user_email(self.gmail_client)
         return self._user_email
 
     def analyze(self, thread_id: str) -> EmailThread:
@@ -43,8 +48,51 @@ class ThreadAnalyzer:
         Returns:
             EmailThread with analysis results
         """
-        thread = self.gmail_client.get_thread(thread_id)
+        thread = get_api_scheduler().call("gmail", "threads.get", self.gmail_client.get_thread, thread_id)
+        return self._build_thread(
+            thread_id,
+            [(msg.sender, msg.date) for msg in thread.messages],
+        )
+
+    def analyze_many(self, thread_ids: Iterable[str]) -> Dict[str, EmailThread]:
+        """
+        Analyze multiple threads using batched Gmail requests.
+
+        Threads that fail in the batch are retried individually.
+
+        Args:
+            thread_ids: Gmail thread IDs
 
+        Returns:
+            Dict mapping thread ID to EmailThread (failed threads omitted)
+        """
+        thread_ids = list(dict.fromkeys(thread_ids))
+        fetcher = GmailBatchFetcher(self.gmail_client)
+        raw_threads, _errors = fetcher.get_threads(thread_ids)
+
+        results: Dict[str, EmailThread] = {}
+        for tid in thread_ids:
+            try:
+                raw = raw_threads.get(tid)
+                if raw is None:
+                    results[tid] = self.analyze(tid)
+                    continue
+                messages = [
+                    (GmailBatchFetcher.get_header(m, "From"), GmailBatchFetcher.get_date(m))
+                    for m in raw.get("messages", [])
+                ]
+                results[tid] = self._build_thread(tid, messages)
+            except Exception as e:
+                print(f"Error analyzing thread {tid}: {e}")
+
+        return results
+
+    def _build_thread(
+        self,
+        thread_id: str,
+        messages: List[Tuple[str, Optional[datetime]]],
+    ) -> EmailThread:
+        """Build EmailThread from (sender, date) pairs in thread order."""
         inbound = 0
         outbound = 0
         first_date = None
@@ -55,8 +103,8 @@ class ThreadAnalyzer:
         prev_date = None
         prev_direction = None
 
-        for msg in thread.messages:
-            sender_lower = msg.sender.lower()
+        for sender, date in messages:
+            sender_lower = (sender or "").lower()
             is_from_user = self.user_email in sender_lower
 
             if is_from_user:
@@ -68,25 +116,25 @@ class ThreadAnalyzer:
 
                 # Detect vendor from sender
                 if self.config and not vendor_name:
-                    vendor = self.config.get_vendor_by_domain(msg.sender)
+                    vendor = self.config.get_vendor_by_domain(sender_lower)
                     if vendor:
                         vendor_name = vendor.name
 
             # Track dates
-            if msg.date:
-                if first_date is None or msg.date < first_date:
-                    first_date = msg.date
-                if last_date is None or msg.date > last_date:
-                    last_date = msg.date
+            if date:
+                if first_date is None or date < first_date:
+                    first_date = date
+                if last_date is None or date > last_date:
+                    last_date = date
                     last_direction = direction
 
                 # Calculate response time (if direction changed)
                 if prev_date and prev_direction and prev_direction != direction:
-                    delta = (msg.date - prev_date).total_seconds() / 3600  # hours
+                    delta = (date - prev_date).total_seconds() / 3600  # hours
                     if delta > 0:
                         response_times.append(delta)
 
-                prev_date = msg.date
+                prev_date = date
                 prev_direction = direction
 
         # Calculate average response time
@@ -97,7 +145,7 @@ class ThreadAnalyzer:
         return EmailThread(
             thread_id=thread_id,
             vendor=vendor_name,
-            message_count=len(thread.messages),
+            message_count=len(messages),
             inbound_count=inbound,
             outbound_count=outbound,
             first_date=first_date,
@@ -122,22 +170,16 @@ class ThreadAnalyzer:
         cutoff = datetime.now() - timedelta(days=days)
         query = f"from:{vendor_domain} OR to:{vendor_domain} after:{cutoff.strftime('%Y/%m/%d')}"
 
-        messages = self.gmail_client.list_emails(query=query, max_results=100)
+        messages = get_api_scheduler().call(
+            "gmail", "messages.list", self.gmail_client.list_emails, query=query, max_results=100
+        )
 
         # Group by thread_id
         thread_ids = set()
         for msg in messages:
             thread_ids.add(msg.thread_id)
 
-        threads = []
-        for tid in thread_ids:
-            try:
-                thread = self.analyze(tid)
-                threads.append(thread)
-            except Exception as e:
-                print(f"Error analyzing thread {tid}: {e}")
-
-        return threads
+        return list(self.analyze_many(thread_ids).values())
 
     def detect_active_negotiations(self, threads: List[EmailThread]) -> List[EmailThread]:
         """
@@ -0,0 +1,393 @@
+"""Rate-limit-aware scheduling for Slack and Gmail API calls."""
+
+import random
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+# Gmail 403 reasons that are quota (not permission) errors
+GMAIL_RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket (rate tokens/sec, up to capacity tokens of burst)."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, borrowing against future refills if needed.
+
+        Returns:
+            Seconds the caller must wait before using them (0 if available now)
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def pause(self, seconds: float):
+        """Hold back all callers for `seconds` (e.g. after a Retry-After)."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+@dataclass
+class MethodStats:
+    """Per-method call and throttling counters."""
+
+    calls: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    throttled_seconds: float = 0.0  # Bucket waits + backoff sleeps
+
+
+def rate_limit_info(error) -> Tuple[bool, Optional[float]]:
+    """
+    Classify a failed call (exception or HTTP response).
+
+    Understands slack_sdk SlackApiError, googleapiclient HttpError and
+    requests responses/HTTPError.
+
+    Returns:
+        (retryable, Retry-After seconds or None)
+    """
+    status, headers, reason = None, {}, ""
+    if getattr(error, "resp", None) is not None and hasattr(error, "content"):
+        # googleapiclient HttpError - checked first: 2.x also has a status_code property,
+        # but headers (httplib2 response, lowercase keys) and the error reason live on resp/content
+        status = getattr(error.resp, "status", None)
+        headers = error.resp
+        content = error.content or b""
+        reason = content.decode("utf-8", "replace") if isinstance(content, bytes) else str(content)
+    else:
+        response = getattr(error, "response", None)
+        if response is None and hasattr(error, "status_code"):
+            response = error  # requests.Response
+        if response is not None:
+            status = getattr(response, "status_code", None)
+            headers = getattr(response, "headers", None) or {}
+            data = getattr(response, "data", None)
+            if isinstance(data, dict) and data.get("error") == "ratelimited":
+                status = 429
+
+    try:
+        status = int(status) if status is not None else None
+    except (TypeError, ValueError):
+        status = None
+
+    retryable = status in RETRYABLE_STATUS or (
+        status == 403 and any(r in reason for r in GMAIL_RATE_LIMIT_REASONS)
+    )
+
+    retry_after = None
+    value = (headers.get("Retry-After") or headers.get("retry-after")) if hasattr(headers, "get") else None
+    if value is not None:
+        try:
+            retry_after = max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+
+    return retryable, retry_after
+
+
+class ApiScheduler:
+    """
+    Central pacing and retry for Slack / Gmail requests.
+
+    - Slack: one token bucket per method, sized by the method's rate tier
+      (limits are per method per workspace).
+    - Gmail: one shared bucket of per-user quota units; each method costs
+      its documented units.
+    - Retryable failures (429, 5xx, Gmail rate-limit 403) are retried with
+      full-jitter exponential backoff, or after Retry-After when given;
+      a Retry-After also pauses the method's bucket for every other thread.
+    """
+
+    # Slack Web API tiers: requests per minute
+    SLACK_TIER_RPM = {1: 1, 2: 20, 3: 50, 4: 100}
+    SLACK_METHOD_TIERS = {
+        "users.list": 2,
+        "users.info": 4,
+        "conversations.list": 2,
+        "conversations.info": 3,
+        "conversations.history": 3,
+        "conversations.replies": 3,
+        "chat.update": 3,
+        "slackLists.items.list": 3,
+        "slackLists.items.update": 3,
+    }
+    # Special-rate methods (requests per minute)
+    SLACK_METHOD_RPM = {"chat.postMessage": 60}
+    SLACK_DEFAULT_TIER = 3
+
+    # Gmail per-user quota: 250 units/sec, cost per method
+    GMAIL_UNITS_PER_SECOND = 250
+    GMAIL_QUOTA_UNITS = {
+        "users.getProfile": 1,
+        "history.list": 2,
+        "messages.list": 5,
+        "messages.get": 5,
+        "messages.attachments.get": 5,
+        "threads.list": 10,
+        "threads.get": 10,
+        "messages.send": 100,
+    }
+    GMAIL_DEFAULT_UNITS = 5
+
+    MAX_RETRIES = 5
+    BASE_DELAY = 1.0
+    MAX_DELAY = 60.0
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_retries: Retries per call after a retryable failure
+            base_delay: First backoff ceiling in seconds (doubles per attempt)
+            max_delay: Backoff ceiling in seconds
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, MethodStats] = {}
+
+    def _bucket(self, api: str, method: str) -> Tuple[TokenBucket, float]:
+        """Bucket and per-call cost for a method."""
+        if api == "gmail":
+            key, cost = "gmail", float(self.GMAIL_QUOTA_UNITS.get(method, self.GMAIL_DEFAULT_UNITS))
+        else:
+            key, cost = f"{api}:{method}", 1.0
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if api == "gmail":
+                    bucket = TokenBucket(self.GMAIL_UNITS_PER_SECOND)
+                else:
+                    rpm = self.SLACK_METHOD_RPM.get(method) or self.SLACK_TIER_RPM[
+                        self.SLACK_METHOD_TIERS.get(method, self.SLACK_DEFAULT_TIER)
+                    ]
+                    # Slack tolerates short bursts; allow ~5% of a minute's budget at once
+                    bucket = TokenBucket(rpm / 60.0, capacity=rpm / 20.0)
+                self._buckets[key] = bucket
+        return bucket, cost
+
+    def _method_stats(self, api: str, method: str) -> MethodStats:
+        with self._lock:
+            return self._stats.setdefault(f"{api}:{method}", MethodStats())
+
+    def _wait(self, stats: MethodStats, seconds: float):
+        if seconds > 0:
+            with self._lock:
+                stats.throttled_seconds += seconds
+            self._sleep(seconds)
+
+    def acquire(self, api: str, method: str, count: int = 1):
+        """
+        Block until `count` calls of a method fit the rate limit.
+
+        Use directly for requests sent outside call(), e.g. Gmail batches.
+        """
+        bucket, cost = self._bucket(api, method)
+        stats = self._method_stats(api, method)
+        with self._lock:
+            stats.calls += count
+        self._wait(stats, bucket.reserve(cost * count))
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Retry-After if given, else full-jitter exponential backoff."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def backoff(self, api: str, method: str, attempt: int, retry_after: Optional[float] = None):
+        """
+        Wait before retry `attempt` (0-based) of a rate-limited request.
+
+        A Retry-After pauses the whole bucket instead, so the retry (and every
+        other caller of the method) waits for it in the next acquire().
+        """
+        stats = self._method_stats(api, method)
+        with self._lock:
+            stats.rate_limited += 1
+            stats.retries += 1
+        if retry_after is not None:
+            self._bucket(api, method)[0].pause(retry_after)
+        else:
+            self._wait(stats, self.backoff_delay(attempt))
+
+    def call(self, api: str, method: str, fn: Callable, *args, **kwargs):
+        """
+        Call fn(*args, **kwargs) within the method's rate limit, retrying throttled calls.
+
+        Args:
+            api: "slack" or "gmail"
+            method: API method name (e.g. "conversations.history", "messages.get")
+            fn: Function performing the request
+
+        Returns:
+            fn's result (an HTTP response that is still throttled after all
+            retries is returned as-is for the caller to raise)
+        """
+        attempt = 0
+        while True:
+            self.acquire(api, method)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                retryable, retry_after = rate_limit_info(e)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+            else:
+                if getattr(result, "status_code", 200) not in RETRYABLE_STATUS or attempt >= self.max_retries:
+                    return result
+                retry_after = rate_limit_info(result)[1]
+
+            self.backoff(api, method, attempt, retry_after)
+            attempt += 1
+
+    def stats(self) -> Dict[str, dict]:
+        """Counters per "api:method"."""
+        with self._lock:
+            return {key: asdict(value) for key, value in sorted(self._stats.items())}
+
+    def throttled_seconds(self) -> float:
+        """Total time spent waiting on rate limits."""
+        with self._lock:
+            return sum(s.throttled_seconds for s in self._stats.values())
+
+    def summary(self) -> str:
+        """One line per throttled method ("" if nothing was throttled)."""
+        lines = []
+        for key, s in self.stats().items():
+            if s["throttled_seconds"] or s["rate_limited"]:
+                lines.append(
+                    f"{key}: {s['calls']} calls, {s['rate_limited']} rate-limited, "
+                    f"{s['throttled_seconds']:.1f}s throttled"
+                )
+        return "\n".join(lines)
+
+
+def _run_tests() -> bool:
+    """인라인 테스트 (fake HttpError, 주입된 sleep)."""
+    passed = 0
+    failed = 0
+
+    def _assert(test_name, condition, detail=""):
+        nonlocal passed, failed
+        if condition:
+            print(f"  PASS: {test_name}")
+            passed += 1
+        else:
+            print(f"  FAIL: {test_name} - {detail}")
+            failed += 1
+
+    class FakeResp(dict):
+        """httplib2.Response: dict of lowercase headers + status."""
+
+        def __init__(self, status, headers=None):
+            super().__init__(headers or {})
+            self.status = status
+
+    class FakeHttpError(Exception):
+        """googleapiclient.errors.HttpError (2.x) shape."""
+
+        def __init__(self, status, content=b"", headers=None):
+            super().__init__(f"HttpError {status}")
+            self.resp = FakeResp(status, headers)
+            self.content = content
+
+        @property
+        def status_code(self):
+            return self.resp.status
+
+    print("=== ApiScheduler Tests ===\n")
+
+    print("[Test 1] HttpError 분류")
+    quota = b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}'
+    info = rate_limit_info(FakeHttpError(403, quota, {"retry-after": "7"}))
+    _assert("403 userRateLimitExceeded 재시도 + Retry-After", info == (True, 7.0), f"실제: {info}")
+    info = rate_limit_info(FakeHttpError(429, b"", {"retry-after": "3"}))
+    _assert("429 Retry-After 유지", info == (True, 3.0), f"실제: {info}")
+    info = rate_limit_info(FakeHttpError(403, b'{"reason": "insufficientPermissions"}'))
+    _assert("권한 403은 재시도 안 함", info == (False, None), f"실제: {info}")
+    info = rate_limit_info(FakeHttpError(404))
+    _assert("404는 재시도 안 함", info == (False, None), f"실제: {info}")
+
+    print("\n[Test 2] call() 재시도 (Retry-After)")
+    slept = []
+    scheduler = ApiScheduler(sleep=slept.append)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise FakeHttpError(429, b"", {"retry-after": "5"})
+        return "ok"
+
+    result = scheduler.call("gmail", "messages.get", flaky)
+    _assert("재시도 후 성공", result == "ok" and len(attempts) == 2, f"실제: {result}, {len(attempts)}회")
+    _assert("Retry-After만큼 대기", sum(slept) >= 4.9, f"실제: {slept}")
+    stats = scheduler.stats()["gmail:messages.get"]
+    _assert("통계 집계", stats["rate_limited"] == 1 and stats["calls"] == 2, f"실제: {stats}")
+
+    print("\n[Test 3] call() 재시도 한도")
+    slept.clear()
+    scheduler = ApiScheduler(max_retries=2, base_delay=1.0, sleep=slept.append)
+
+    def always_limited():
+        raise FakeHttpError(403, quota)
+
+    try:
+        scheduler.call("gmail", "messages.list", always_limited)
+        _assert("한도 초과 시 예외", False, "예외 없음")
+    except FakeHttpError:
+        _assert("한도 초과 시 예외", True)
+    _assert("jitter 백오프 (<= base*2^n)", len(slept) == 2 and slept[0] <= 1.0 and slept[1] <= 2.0, f"실제: {slept}")
+
+    print("\n[Test 4] 권한 오류는 즉시 전파")
+    slept.clear()
+    attempts.clear()
+
+    def forbidden():
+        attempts.append(1)
+        raise FakeHttpError(403, b'{"reason": "forbidden"}')
+
+    try:
+        scheduler.call("gmail", "messages.get", forbidden)
+    except FakeHttpError:
+        pass
+    _assert("1회만 호출", len(attempts) == 1 and not slept, f"실제: {len(attempts)}회, {slept}")
+
+    print(f"\n=== Results: {passed}/{passed + failed} passed ===")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if _run_tests() else 1)
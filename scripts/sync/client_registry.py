@@ -0,0 +1,169 @@
+"""Process-wide registry of authenticated API clients."""
+
+import threading
+from typing import Optional
+
+_lock = threading.RLock()
+_local = threading.local()
+
+_slack_client = None
+_slack_user_client = None
+_slack_user_error: Optional[Exception] = None
+_slack_channels = None
+_api_scheduler = None
+_gmail_profile: Optional[dict] = None
+_session = None
+_session_pool_size = 0
+
+
+def get_gmail_client():
+    """
+    Get the GmailClient for the current thread.
+
+    googleapiclient's httplib2 transport is not thread-safe, so each thread
+    gets one client that is reused by every stage running on it (the main
+    thread's client is shared by all sync entry points).
+    """
+    client = getattr(_local, "gmail_client", None)
+    if client is None:
+        from lib.gmail import GmailClient
+        client = GmailClient()
+        _local.gmail_client = client
+    return client
+
+
+def get_gmail_profile(gmail_client=None) -> dict:
+    """
+    Gmail profile of the authenticated account (fetched once per process).
+
+    Use gmail_client.get_profile() directly for values that change between
+    calls, such as historyId checkpoints.
+    """
+    global _gmail_profile
+    with _lock:
+        if _gmail_profile is None:
+            _gmail_profile = (gmail_client or get_gmail_client()).get_profile() or {}
+        return dict(_gmail_profile)
+
+
+def get_user_email(gmail_client=None) -> str:
+    """Authenticated user's email address (lowercase)."""
+    return get_gmail_profile(gmail_client).get("emailAddress", "").lower()
+
+
+def get_authorized_session(gmail_client=None, pool_maxsize: int = 10):
+    """
+    Shared authorized requests session for Gmail REST calls.
+
+    requests.Session is safe to share across threads and keeps a pool of
+    open TLS connections. The pool grows to the largest pool_maxsize
+    requested so far.
+
+    Returns:
+        AuthorizedSession, or None if google-auth/requests or the client
+        credentials are unavailable
+    """
+    global _session, _session_pool_size
+    with _lock:
+        if _session is None:
+            try:
+                from google.auth.transport.requests import AuthorizedSession
+            except ImportError:
+                _session = False
+                return None
+
+            client = gmail_client or get_gmail_client()
+            http = getattr(client.service, "_http", None)
+            credentials = getattr(http, "credentials", None)
+            if credentials is None:
+                return None
+            _session = AuthorizedSession(credentials)
+
+        if _session and pool_maxsize > _session_pool_size:
+            from requests.adapters import HTTPAdapter
+            _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+            _session_pool_size = pool_maxsize
+
+        return _session or None
+
+
+def get_slack_client():
+    """Shared SlackClient (bot token)."""
+    global _slack_client
+    with _lock:
+        if _slack_client is None:
+            from lib.slack import SlackClient
+            _slack_client = SlackClient()
+        return _slack_client
+
+
+def get_slack_user_client():
+    """
+    Shared SlackUserClient (user token, required for the Lists API).
+
+    Raises:
+        The original construction error on every call if the user token is
+        unavailable (not retried within the process)
+    """
+    global _slack_user_client, _slack_user_error
+    with _lock:
+        if _slack_user_client is None and _slack_user_error is None:
+            try:
+                from lib.slack import SlackUserClient
+                _slack_user_client = SlackUserClient()
+            except Exception as e:
+                _slack_user_error = e
+        if _slack_user_error is not None:
+            raise _slack_user_error
+        return _slack_user_client
+
+
+def get_slack_channel_directory():
+    """
+    Shared SlackChannelDirectory (bot token, cache in docs/management).
+
+    Used by SLACK-LOG sync and by LISTS_CONFIG["channel_id"] users so a
+    channel is resolved once per TTL across all entry points.
+    """
+    global _slack_channels
+    with _lock:
+        if _slack_channels is None:
+            try:
+                from .slack_directory import DEFAULT_CACHE_DIR, SlackChannelDirectory
+            except ImportError:
+                from slack_directory import DEFAULT_CACHE_DIR, SlackChannelDirectory
+            _slack_channels = SlackChannelDirectory(
+                get_slack_client(), DEFAULT_CACHE_DIR / SlackChannelDirectory.CACHE_FILE
+            )
+        return _slack_channels
+
+
+def get_api_scheduler():
+    """Shared ApiScheduler (rate limits are per workspace / per Gmail user, not per client)."""
+    global _api_scheduler
+    with _lock:
+        if _api_scheduler is None:
+            try:
+                from .api_scheduler import ApiScheduler
+            except ImportError:
+                from api_scheduler import ApiScheduler
+            _api_scheduler = ApiScheduler()
+        return _api_scheduler
+
+
+def reset():
+    """Drop cached clients, session and profile (e.g. after re-auth; Gmail: current thread only)."""
+    global _slack_client, _slack_user_client, _slack_user_error, _slack_channels, _api_scheduler
+    global _gmail_profile, _session, _session_pool_size
+    with _lock:
+        _slack_client = None
+        _slack_user_client = None
+        _slack_user_error = None
+        _slack_channels = None
+        _api_scheduler = None
+        _gmail_profile = None
+        if _session:
+            _session.close()
+        _session = None
+        _session_pool_size = 0
+        _local.__dict__.clear()
@@ -1,4 +1,6 @@
 """Data collectors for sync operations."""
 from .attachment_downloader import AttachmentDownloader
+from .attachment_filter import AttachmentFilter
+from .gmail_batch import GmailBatchFetcher
 
-__all__ = ["AttachmentDownloader"]
+__all__ = ["AttachmentDownloader", "AttachmentFilter", "GmailBatchFetcher"]
@@ -3,10 +3,13 @@
 import base64
 import hashlib
 import json
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 # Add root for lib imports
 sys.path.insert(0, str(Path(__file__).parents[4]))
@@ -15,17 +18,41 @@ from lib.gmail import GmailClient
 
 sys.path.insert(0, str(Path(__file__).parents[1]))
 from models_v2 import Attachment
+try:
+    from .attachment_filter import AttachmentFilter
+    from .gmail_batch import GmailBatchFetcher
+    from ..client_registry import get_api_scheduler, get_authorized_session, get_gmail_client
+except ImportError:
+    from collectors.attachment_filter import AttachmentFilter
+    from collectors.gmail_batch import GmailBatchFetcher
+    from client_registry import get_api_scheduler, get_authorized_session, get_gmail_client
 
 
 class AttachmentDownloader:
-    """Download and cache email attachments."""
+    """
+    Download and cache email attachments.
+
+    The cache is content-addressed: each distinct file is stored once
+    under its SHA-256, and (email_id, attachment_id) pairs map onto it.
+    A proposal re-sent in a reply or forward reuses the same blob.
+    """
 
     CACHE_INDEX_FILE = ".attachment_cache.json"
+    CACHE_INDEX_VERSION = "2.0"
+    # 내용 해시별 1개 파일 (blobs/ab/abcdef....pdf)
+    BLOB_DIR = "blobs"
+    DEFAULT_CACHE_BUDGET_MB = 1024
+    ATTACHMENT_URL = (
+        "https://gmail.googleapis.com/gmail/v1/users/me/messages/{email_id}/attachments/{attachment_id}"
+    )
+    REQUEST_TIMEOUT = 60
 
     def __init__(
         self,
         gmail_client: Optional[GmailClient] = None,
         cache_dir: Optional[Path] = None,
+        max_workers: int = 4,
+        attachment_filter: Optional[AttachmentFilter] = None,
     ):
         """
         Initialize downloader.
@@ -33,43 +60,159 @@ class AttachmentDownloader:
         Args:
             gmail_client: Gmail API client
             cache_dir: Directory to store downloaded files
+            max_workers: Parallel attachment downloads (1 = sequential)
+            attachment_filter: Metadata rules for quote attachments
         """
-        self.gmail_client = gmail_client or GmailClient()
+        self.gmail_client = gmail_client or get_gmail_client()
         self.cache_dir = cache_dir or Path("./attachments")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max(1, max_workers)
+        self.attachment_filter = attachment_filter or AttachmentFilter()
+        self._index_dirty = False
         self._cache_index = self._load_cache_index()
+        # 파일 경로 예약 + 캐시 인덱스 갱신 보호
+        self._lock = threading.Lock()
 
     def _load_cache_index(self) -> dict:
-        """Load cache index from disk."""
+        """Load cache index from disk (v1 indexes are migrated)."""
         index_path = self.cache_dir / self.CACHE_INDEX_FILE
         if index_path.exists():
             try:
-                return json.loads(index_path.read_text(encoding="utf-8"))
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+                if index.get("version") == self.CACHE_INDEX_VERSION:
+                    return index
+                return self._migrate_cache_index(index)
             except Exception:
                 pass
-        return {"version": "1.0", "files": {}}
+        return {"version": self.CACHE_INDEX_VERSION, "blobs": {}, "files": {}}
+
+    def _migrate_cache_index(self, legacy: dict) -> dict:
+        """
+        Convert a v1 index (one file per email/attachment pair) to blobs.
+
+        Existing files are hashed and kept in place; byte-identical
+        duplicates are removed and mapped onto the first copy.
+        """
+        index = {"version": self.CACHE_INDEX_VERSION, "blobs": {}, "files": {}}
+        for cache_key, info in legacy.get("files", {}).items():
+            path = Path(info.get("path", ""))
+            if not path.is_file():
+                continue
+            data = path.read_bytes()
+            content_hash = hashlib.sha256(data).hexdigest()
+            blob = index["blobs"].get(content_hash)
+            if blob is None:
+                downloaded_at = info.get("downloaded_at") or datetime.now().isoformat()
+                blob = {
+                    "path": str(path),
+                    "size": len(data),
+                    "refs": [],
+                    "created_at": downloaded_at,
+                    "last_access": downloaded_at,
+                }
+                index["blobs"][content_hash] = blob
+            elif Path(blob["path"]) != path:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            blob["refs"].append(cache_key)
+            index["files"][cache_key] = {**info, "sha256": content_hash, "path": blob["path"]}
+
+        self._index_dirty = True
+        return index
 
     def _save_cache_index(self):
         """Save cache index to disk."""
         index_path = self.cache_dir / self.CACHE_INDEX_FILE
-        index_path.write_text(
+        tmp_path = index_path.with_suffix(".tmp")
+        tmp_path.write_text(
             json.dumps(self._cache_index, indent=2, ensure_ascii=False),
             encoding="utf-8",
         )
+        os.replace(tmp_path, index_path)
+
+    def flush_cache_index(self):
+        """Save cache index if downloads changed it since the last flush."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_cache_index()
+                self._index_dirty = False
+
+    def _get_session(self):
+        """
+        Shared authorized HTTP session with a connection pool.
+
+        requests.Session is safe to share across download threads, unlike
+        the httplib2 transport behind the discovery service. The session is
+        process-wide (client_registry), so TLS connections are reused by
+        every downloader. Returns None if google-auth/requests or the
+        client credentials are unavailable.
+        """
+        return get_authorized_session(self.gmail_client, pool_maxsize=self.max_workers)
+
+    def _worker_service(self):
+        """Gmail service for the current thread (fallback when no shared session)."""
+        if threading.current_thread() is threading.main_thread():
+            return self.gmail_client.service
+        return get_gmail_client().service
+
+    def _fetch_attachment_data(self, email_id: str, attachment_id: str) -> bytes:
+        """Fetch and decode attachment bytes."""
+        scheduler = get_api_scheduler()
+        session = self._get_session()
+        if session is not None:
+            response = scheduler.call(
+                "gmail",
+                "messages.attachments.get",
+                session.get,
+                self.ATTACHMENT_URL.format(email_id=email_id, attachment_id=attachment_id),
+                timeout=self.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            data = response.json().get("data", "")
+        else:
+            request = self._worker_service().users().messages().attachments().get(
+                userId="me",
+                messageId=email_id,
+                id=attachment_id,
+            )
+            data = scheduler.call("gmail", "messages.attachments.get", request.execute).get("data", "")
+
+        return base64.urlsafe_b64decode(data)
 
     def _get_cache_key(self, email_id: str, attachment_id: str) -> str:
         """Generate cache key from email and attachment IDs."""
         return hashlib.md5(f"{email_id}:{attachment_id}".encode()).hexdigest()[:16]
 
     def _get_cached_path(self, email_id: str, attachment_id: str) -> Optional[Path]:
-        """Get cached file path if exists."""
+        """Get cached blob path if exists (marks the blob as recently used)."""
         cache_key = self._get_cache_key(email_id, attachment_id)
-        if cache_key in self._cache_index.get("files", {}):
-            cached = self._cache_index["files"][cache_key]
-            path = Path(cached["path"])
-            if path.exists():
-                return path
-        return None
+        with self._lock:
+            entry = self._cache_index["files"].get(cache_key)
+            if not entry:
+                return None
+            blob = self._cache_index["blobs"].get(entry.get("sha256", ""))
+            if not blob:
+                return None
+            path = Path(blob["path"])
+            if not path.exists():
+                return None
+            blob["last_access"] = datetime.now().isoformat()
+            self._index_dirty = True
+            return path
+
+    def get_content_hash(self, email_id: str, attachment_id: str) -> Optional[str]:
+        """SHA-256 of a cached attachment (None if not cached)."""
+        entry = self._cache_index["files"].get(self._get_cache_key(email_id, attachment_id))
+        return entry.get("sha256") if entry else None
+
+    def _blob_path(self, content_hash: str, filename: str) -> Path:
+        """Blob location for a content hash (keeps the extension for parsers)."""
+        suffix = Path(filename).suffix.lower()
+        if not suffix.replace(".", "").isalnum():
+            suffix = ""
+        return self.cache_dir / self.BLOB_DIR / content_hash[:2] / f"{content_hash}{suffix}"
 
     def download(
         self,
@@ -88,150 +231,275 @@ class AttachmentDownloader:
         Returns:
             Path to downloaded file
         """
+        output_path = self._download(email_id, attachment_id, filename)
+        self.flush_cache_index()
+        return output_path
+
+    def _download(
+        self,
+        email_id: str,
+        attachment_id: str,
+        filename: Optional[str] = None,
+    ) -> Path:
+        """Download a single attachment without flushing the cache index."""
         # Check cache first
         cached = self._get_cached_path(email_id, attachment_id)
         if cached:
             return cached
 
         # Download via Gmail API
-        service = self.gmail_client.service
-        attachment = service.users().messages().attachments().get(
-            userId="me",
-            messageId=email_id,
-            id=attachment_id,
-        ).execute()
-
-        data = attachment.get("data", "")
-        file_data = base64.urlsafe_b64decode(data)
+        file_data = self._fetch_attachment_data(email_id, attachment_id)
 
-        # Generate safe filename
+        content_hash = hashlib.sha256(file_data).hexdigest()
+        cache_key = self._get_cache_key(email_id, attachment_id)
         if not filename:
             filename = f"attachment_{email_id[:8]}_{attachment_id[:8]}"
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            blob = self._cache_index["blobs"].get(content_hash)
+            if blob is None or not Path(blob["path"]).exists():
+                output_path = self._blob_path(content_hash, filename)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                # Atomic write so an interrupted run never leaves a partial blob
+                tmp_path = output_path.with_name(f"{output_path.name}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(file_data)
+                os.replace(tmp_path, output_path)
+                blob = {
+                    "path": str(output_path),
+                    "size": len(file_data),
+                    "refs": (blob or {}).get("refs", []),
+                    "created_at": now,
+                }
+                self._cache_index["blobs"][content_hash] = blob
+
+            blob["last_access"] = now
+            if cache_key not in blob["refs"]:
+                blob["refs"].append(cache_key)
+
+            # Update cache index (flushed by caller)
+            self._cache_index["files"][cache_key] = {
+                "email_id": email_id,
+                "attachment_id": attachment_id,
+                "filename": filename,
+                "sha256": content_hash,
+                "path": blob["path"],
+                "size": len(file_data),
+                "downloaded_at": now,
+            }
+            self._index_dirty = True
+
+        return Path(blob["path"])
+
+    def _download_many(self, attachments: List[Attachment]):
+        """
+        Download attachments in parallel, setting local_path on success.
 
-        # Sanitize filename
-        safe_filename = "".join(
-            c for c in filename if c.isalnum() or c in "._- "
-        ).strip()
-        if not safe_filename:
-            safe_filename = f"file_{attachment_id[:12]}"
-
-        # Add date prefix for organization
-        date_prefix = datetime.now().strftime("%Y%m%d")
-        output_path = self.cache_dir / f"{date_prefix}_{safe_filename}"
-
-        # Handle duplicates
-        counter = 1
-        base_path = output_path
-        while output_path.exists():
-            stem = base_path.stem
-            suffix = base_path.suffix
-            output_path = base_path.with_name(f"{stem}_{counter}{suffix}")
-            counter += 1
-
-        # Write file
-        output_path.write_bytes(file_data)
-
-        # Update cache index
-        cache_key = self._get_cache_key(email_id, attachment_id)
-        self._cache_index["files"][cache_key] = {
-            "email_id": email_id,
-            "attachment_id": attachment_id,
-            "filename": filename,
-            "path": str(output_path),
-            "size": len(file_data),
-            "downloaded_at": datetime.now().isoformat(),
-        }
-        self._save_cache_index()
+        Runs on a bounded thread pool sharing one pooled HTTP session.
+        The cache index is not flushed here.
+        """
+        def fetch(att: Attachment):
+            try:
+                att.local_path = str(self._download(
+                    email_id=att.email_id,
+                    attachment_id=att.id,
+                    filename=att.filename,
+                ))
+            except Exception as e:
+                # Still add to results without local_path
+                print(f"Error downloading {att.filename}: {e}")
 
-        return output_path
+        workers = min(self.max_workers, len(attachments))
+        if workers <= 1:
+            for att in attachments:
+                fetch(att)
+            return
+
+        # 세션 초기화는 워커 시작 전에 한 번만
+        self._get_session()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(fetch, attachments))
+
+    def _list_attachments(self, email_id: str) -> List[Attachment]:
+        """Fetch attachment metadata for a single email."""
+        email = get_api_scheduler().call("gmail", "messages.get", self.gmail_client.get_email, email_id)
+        return [
+            Attachment(
+                id=att.id,
+                email_id=email_id,
+                filename=att.filename,
+                mime_type=att.mime_type,
+                size=att.size,
+                parsed=False,
+            )
+            for att in email.attachments
+        ]
 
-    def download_all(self, email_id: str) -> List[Attachment]:
+    def download_all(
+        self,
+        email_id: str,
+        attachments: Optional[List[Attachment]] = None,
+    ) -> List[Attachment]:
         """
         Download all attachments from an email.
 
         Args:
             email_id: Gmail message ID
+            attachments: Prefetched attachment metadata (fetched if None)
 
         Returns:
             List of Attachment objects with local_path set
         """
-        # Get email with attachments
-        email = self.gmail_client.get_email(email_id)
+        if attachments is None:
+            attachments = self._list_attachments(email_id)
 
-        results = []
-        for att in email.attachments:
-            try:
-                local_path = self.download(
-                    email_id=email_id,
-                    attachment_id=att.id,
-                    filename=att.filename,
-                )
+        for att in attachments:
+            att.email_id = att.email_id or email_id
 
-                results.append(Attachment(
-                    id=att.id,
-                    email_id=email_id,
-                    filename=att.filename,
-                    mime_type=att.mime_type,
-                    size=att.size,
-                    local_path=str(local_path),
-                    parsed=False,
-                ))
-            except Exception as e:
-                print(f"Error downloading {att.filename}: {e}")
-                # Still add to results without local_path
-                results.append(Attachment(
-                    id=att.id,
-                    email_id=email_id,
-                    filename=att.filename,
-                    mime_type=att.mime_type,
-                    size=att.size,
-                    parsed=False,
-                ))
+        self._download_many(attachments)
+        self.flush_cache_index()
+
+        return attachments
+
+    def download_all_batch(self, email_ids: Iterable[str]) -> Dict[str, List[Attachment]]:
+        """
+        Download all attachments from multiple emails.
+
+        Attachment metadata is fetched with batched Gmail requests instead
+        of one get_email call per message, then all files are downloaded
+        through one worker pool and the cache index is saved once.
+
+        Args:
+            email_ids: Gmail message IDs
+
+        Returns:
+            Dict mapping email ID to Attachment list. Emails whose metadata
+            could not be fetched are omitted so callers can retry them with
+            download_all().
+        """
+        fetcher = GmailBatchFetcher(self.gmail_client)
+        metadata, _errors = fetcher.get_attachment_metadata(email_ids)
+
+        for email_id, attachments in metadata.items():
+            for att in attachments:
+                att.email_id = att.email_id or email_id
+
+        self._download_many([att for atts in metadata.values() for att in atts])
+        self.flush_cache_index()
+
+        return metadata
 
-        return results
+    def _select_quote_attachments(self, attachments: List[Attachment]) -> List[Attachment]:
+        """Pick quote attachments from metadata, logging skipped files."""
+        selected, skipped = self.attachment_filter.select(attachments)
+        for att, reason in skipped:
+            print(f"Skipping {att.filename}: {reason}")
+        return selected
 
     def get_quote_attachments(self, email_id: str) -> List[Attachment]:
         """
         Download only quote-related attachments (PDF, Excel).
 
+        Attachments are selected from metadata first, so skipped files
+        are never fetched.
+
         Args:
             email_id: Gmail message ID
 
         Returns:
             List of quote-related Attachment objects
         """
-        all_attachments = self.download_all(email_id)
+        selected = self._select_quote_attachments(self._list_attachments(email_id))
 
-        return [
-            att for att in all_attachments
-            if att.file_type in ["pdf", "excel"] or att.is_quote_file
-        ]
+        return self.download_all(email_id, selected)
 
-    def clear_cache(self, older_than_days: int = 30):
+    def get_quote_attachments_batch(self, email_ids: Iterable[str]) -> Dict[str, List[Attachment]]:
         """
-        Clear cached files older than specified days.
+        Download quote-related attachments from multiple emails.
 
         Args:
-            older_than_days: Remove files older than this many days
+            email_ids: Gmail message IDs
+
+        Returns:
+            Dict mapping email ID to quote-related Attachment list
+            (emails whose metadata could not be fetched are omitted)
         """
-        from datetime import timedelta
+        fetcher = GmailBatchFetcher(self.gmail_client)
+        metadata, _errors = fetcher.get_attachment_metadata(email_ids)
 
-        cutoff = datetime.now() - timedelta(days=older_than_days)
-        files_to_remove = []
+        selected = {
+            email_id: self._select_quote_attachments(attachments)
+            for email_id, attachments in metadata.items()
+        }
+
+        self._download_many([att for atts in selected.values() for att in atts])
+        self.flush_cache_index()
 
-        for cache_key, info in list(self._cache_index.get("files", {}).items()):
-            downloaded_at = datetime.fromisoformat(info.get("downloaded_at", "2000-01-01"))
-            if downloaded_at < cutoff:
-                files_to_remove.append(cache_key)
-                path = Path(info.get("path", ""))
-                if path.exists():
-                    try:
-                        path.unlink()
-                    except Exception:
-                        pass
+        return selected
 
-        for key in files_to_remove:
-            del self._cache_index["files"][key]
+    def release(self, email_id: str, attachment_id: str):
+        """
+        Drop an (email_id, attachment_id) mapping.
 
-        self._save_cache_index()
-        print(f"Cleared {len(files_to_remove)} cached files")
+        The blob is deleted once no mapping references it.
+        """
+        cache_key = self._get_cache_key(email_id, attachment_id)
+        with self._lock:
+            entry = self._cache_index["files"].pop(cache_key, None)
+            if entry is None:
+                return
+            content_hash = entry.get("sha256", "")
+            blob = self._cache_index["blobs"].get(content_hash)
+            if blob is not None:
+                if cache_key in blob["refs"]:
+                    blob["refs"].remove(cache_key)
+                if not blob["refs"]:
+                    self._remove_blob(content_hash)
+            self._index_dirty = True
+        self.flush_cache_index()
+
+    def _remove_blob(self, content_hash: str) -> int:
+        """Delete a blob and every mapping onto it. Returns bytes freed."""
+        blob = self._cache_index["blobs"].pop(content_hash, None)
+        if blob is None:
+            return 0
+        for cache_key in blob.get("refs", []):
+            self._cache_index["files"].pop(cache_key, None)
+        path = Path(blob.get("path", ""))
+        if path.exists():
+            try:
+                path.unlink()
+            except Exception:
+                pass
+        return blob.get("size", 0)
+
+    def cache_size(self) -> int:
+        """Total bytes stored in cached blobs."""
+        return sum(blob.get("size", 0) for blob in self._cache_index["blobs"].values())
+
+    def clear_cache(self, max_size_mb: float = DEFAULT_CACHE_BUDGET_MB):
+        """
+        Evict least recently used blobs until the cache fits the budget.
+
+        Args:
+            max_size_mb: Cache size budget in MB (0 = clear everything)
+        """
+        budget = max_size_mb * 1024 * 1024
+        removed = 0
+
+        with self._lock:
+            total = self.cache_size()
+            by_last_access = sorted(
+                self._cache_index["blobs"].items(),
+                key=lambda item: item[1].get("last_access", ""),
+            )
+            for content_hash, _blob in by_last_access:
+                if total <= budget:
+                    break
+                total -= self._remove_blob(content_hash)
+                removed += 1
+            if removed:
+                self._index_dirty = True
+
+        self.flush_cache_index()
+        print(f"Cleared {removed} cached files ({total / 1024 / 1024:.1f}MB kept)")
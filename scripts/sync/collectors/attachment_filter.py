@@ -0,0 +1,79 @@
+"""Metadata-based attachment selection (before download)."""
+
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+from config_models import AttachmentFilterConfig
+from models_v2 import Attachment
+
+MB = 1024 * 1024
+
+
+class AttachmentFilter:
+    """
+    Decide which attachments to download from MIME type, filename and size.
+
+    Gmail returns these fields with the message metadata, so logos,
+    screenshots and videos can be skipped without fetching their data.
+    """
+
+    def __init__(self, config: Optional[AttachmentFilterConfig] = None):
+        """
+        Initialize filter.
+
+        Args:
+            config: Filter rules (defaults: PDF/Excel + quote-named files)
+        """
+        self.config = config or AttachmentFilterConfig()
+        self._blocked_mime = tuple(p.lower() for p in self.config.blocked_mime_prefixes)
+        self._blocked_ext = tuple(e.lower() for e in self.config.blocked_extensions)
+
+    def _size_limit(self, file_type: str) -> Optional[float]:
+        """Size cap in MB for a file type (None = no cap)."""
+        return self.config.type_max_size_mb.get(file_type, self.config.max_size_mb)
+
+    def skip_reason(self, att: Attachment) -> Optional[str]:
+        """
+        Check an attachment against the rules.
+
+        Args:
+            att: Attachment metadata (no local file needed)
+
+        Returns:
+            Reason string if skipped, None if it should be downloaded
+        """
+        mime_type = (att.mime_type or "").lower()
+        filename = (att.filename or "").lower()
+
+        if mime_type.startswith(self._blocked_mime) or filename.endswith(self._blocked_ext):
+            return f"blocked type ({att.mime_type or filename})"
+
+        file_type = att.file_type
+        if file_type not in self.config.allowed_types:
+            if not (self.config.include_quote_named and att.is_quote_file):
+                return f"type not allowed ({file_type})"
+
+        limit = self._size_limit(file_type)
+        if limit is not None and att.size > limit * MB:
+            return f"too large ({att.size / MB:.1f}MB > {limit}MB)"
+
+        return None
+
+    def select(self, attachments: Iterable[Attachment]) -> Tuple[List[Attachment], List[Tuple[Attachment, str]]]:
+        """
+        Split attachments into download targets and skipped ones.
+
+        Returns:
+            (selected attachments, [(skipped attachment, reason), ...])
+        """
+        selected = []
+        skipped = []
+        for att in attachments:
+            reason = self.skip_reason(att)
+            if reason is None:
+                selected.append(att)
+            else:
+                skipped.append((att, reason))
+        return selected, skipped
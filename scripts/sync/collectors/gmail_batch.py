@@ -0,0 +1,223 @@
+"""Batched Gmail fetcher for threads, messages and attachment metadata."""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Add root for lib imports
+sys.path.insert(0, str(Path(__file__).parents[4]))
+
+from lib.gmail import GmailClient
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+from models_v2 import Attachment
+try:
+    from ..client_registry import get_api_scheduler, get_gmail_client
+    from ..api_scheduler import rate_limit_info
+except ImportError:
+    from client_registry import get_api_scheduler, get_gmail_client
+    from api_scheduler import rate_limit_info
+
+
+class GmailBatchFetcher:
+    """Group Gmail get requests into batch HTTP calls."""
+
+    # Gmail batch endpoint limit (sub-requests per HTTP call)
+    MAX_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        gmail_client: Optional[GmailClient] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize fetcher.
+
+        Args:
+            gmail_client: Gmail API client
+            batch_size: Sub-requests per batch call (capped at 100)
+        """
+        self.gmail_client = gmail_client or get_gmail_client()
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+
+    def _execute(
+        self,
+        ids: Iterable[str],
+        build_request: Callable[[str], object],
+        method: str,
+    ) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+        """
+        Execute one get request per ID in batches.
+
+        Every sub-request is charged to the shared Gmail quota bucket, and
+        sub-requests rejected by rate limits are retried with backoff.
+
+        Args:
+            ids: Resource IDs (duplicates are fetched once)
+            build_request: Builds an HttpRequest for an ID
+            method: Gmail method for quota accounting (e.g. "threads.get")
+
+        Returns:
+            (responses by ID, errors by ID)
+        """
+        unique_ids = list(dict.fromkeys(i for i in ids if i))
+        responses: Dict[str, dict] = {}
+        errors: Dict[str, Exception] = {}
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        scheduler = get_api_scheduler()
+        service = self.gmail_client.service
+        pending = unique_ids
+        attempt = 0
+
+        while pending:
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                scheduler.acquire("gmail", method, count=len(chunk))
+                batch = service.new_batch_http_request(callback=callback)
+                for resource_id in chunk:
+                    batch.add(build_request(resource_id), request_id=resource_id)
+                try:
+                    batch.execute()
+                except Exception as e:
+                    # Whole batch failed (network, auth, rate limit) - report every ID in chunk
+                    for resource_id in chunk:
+                        if resource_id not in responses:
+                            errors.setdefault(resource_id, e)
+
+            # Retry only the sub-requests rejected by rate limits
+            limited = {i: rate_limit_info(errors[i]) for i in pending if i in errors}
+            throttled = [i for i, (retryable, _) in limited.items() if retryable]
+            if not throttled or attempt >= scheduler.max_retries:
+                break
+            retry_after = max((limited[i][1] or 0.0 for i in throttled), default=0.0)
+            scheduler.backoff("gmail", method, attempt, retry_after or None)
+            for resource_id in throttled:
+                del errors[resource_id]
+            pending = throttled
+            attempt += 1
+
+        return responses, errors
+
+    def get_threads(
+        self,
+        thread_ids: Iterable[str],
+        format: str = "metadata",
+        metadata_headers: Tuple[str, ...] = ("From", "Date"),
+    ) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+        """
+        Fetch threads in batches.
+
+        Args:
+            thread_ids: Gmail thread IDs
+            format: Gmail response format (metadata, full, minimal)
+            metadata_headers: Headers to include in metadata format
+
+        Returns:
+            (raw thread resources by ID, errors by ID)
+        """
+        threads = self.gmail_client.service.users().threads()
+
+        def build(thread_id):
+            kwargs = {"userId": "me", "id": thread_id, "format": format}
+            if format == "metadata":
+                kwargs["metadataHeaders"] = list(metadata_headers)
+            return threads.get(**kwargs)
+
+        return self._execute(thread_ids, build, "threads.get")
+
+    def get_messages(
+        self,
+        message_ids: Iterable[str],
+        format: str = "metadata",
+        metadata_headers: Tuple[str, ...] = ("From", "To", "Subject", "Date"),
+    ) -> Tuple[Dict[str, dict], Dict[str, Exception]]:
+        """
+        Fetch messages in batches.
+
+        Args:
+            message_ids: Gmail message IDs
+            format: Gmail response format (metadata, full, minimal)
+            metadata_headers: Headers to include in metadata format
+
+        Returns:
+            (raw message resources by ID, errors by ID)
+        """
+        messages = self.gmail_client.service.users().messages()
+
+        def build(message_id):
+            kwargs = {"userId": "me", "id": message_id, "format": format}
+            if format == "metadata":
+                kwargs["metadataHeaders"] = list(metadata_headers)
+            return messages.get(**kwargs)
+
+        return self._execute(message_ids, build, "messages.get")
+
+    def get_attachment_metadata(
+        self,
+        message_ids: Iterable[str],
+    ) -> Tuple[Dict[str, List[Attachment]], Dict[str, Exception]]:
+        """
+        Fetch attachment metadata (no file data) for messages in batches.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            (Attachment lists without local_path by message ID, errors by ID)
+        """
+        raw_messages, errors = self.get_messages(message_ids, format="full")
+
+        attachments = {
+            message_id: self.extract_attachments(raw)
+            for message_id, raw in raw_messages.items()
+        }
+        return attachments, errors
+
+    @staticmethod
+    def extract_attachments(raw_message: dict) -> List[Attachment]:
+        """Collect attachment parts from a raw message payload."""
+        email_id = raw_message.get("id", "")
+        results = []
+        stack = [raw_message.get("payload", {})]
+
+        while stack:
+            part = stack.pop(0)
+            body = part.get("body", {})
+            if part.get("filename") and body.get("attachmentId"):
+                results.append(Attachment(
+                    id=body["attachmentId"],
+                    email_id=email_id,
+                    filename=part["filename"],
+                    mime_type=part.get("mimeType", ""),
+                    size=body.get("size", 0),
+                ))
+            stack.extend(part.get("parts", []))
+
+        return results
+
+    @staticmethod
+    def get_header(raw_message: dict, name: str) -> str:
+        """Get a header value from a raw message (case-insensitive)."""
+        name_lower = name.lower()
+        for header in raw_message.get("payload", {}).get("headers", []):
+            if header.get("name", "").lower() == name_lower:
+                return header.get("value", "")
+        return ""
+
+    @staticmethod
+    def get_date(raw_message: dict) -> Optional[datetime]:
+        """Get message received time from internalDate (epoch ms)."""
+        internal_date = raw_message.get("internalDate")
+        if not internal_date:
+            return None
+        try:
+            return datetime.fromtimestamp(int(internal_date) / 1000)
+        except (ValueError, OverflowError, OSError):
+            return None
@@ -4,7 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 
 class VendorMapping(BaseModel):
@@ -34,6 +34,23 @@ class StatusTransitionRule(BaseModel):
     auto_apply: bool = True
 
 
+class AttachmentFilterConfig(BaseModel):
+    """첨부파일 다운로드 필터 (메타데이터로 다운로드 전 판단)"""
+    # 다운로드 대상 타입 (Attachment.file_type: pdf | excel | other)
+    allowed_types: List[str] = Field(default_factory=lambda: ["pdf", "excel"])
+    # 파일명에 견적 키워드가 있으면 타입 무관 허용
+    include_quote_named: bool = True
+    # 기본 크기 상한 (MB, None = 무제한)
+    max_size_mb: Optional[float] = 25
+    # 타입별 크기 상한 (MB) - max_size_mb보다 우선
+    type_max_size_mb: Dict[str, float] = Field(default_factory=dict)
+    # 항상 제외 (로고, 스크린샷, 데모 영상 등)
+    blocked_mime_prefixes: List[str] = Field(
+        default_factory=lambda: ["image/", "video/", "audio/"]
+    )
+    blocked_extensions: List[str] = Field(default_factory=list)
+
+
 class ProjectConfig(BaseModel):
     """프로젝트별 설정 (YAML 파일에서 로드)"""
     project_name: str
@@ -48,10 +65,23 @@ class ProjectConfig(BaseModel):
     attachments_dir: Path = Path("./attachments")
     state_file: Path = Path("./.sync_state_v2.json")
 
+    # 업체별 Gmail 검색 동시 실행 수 (1 = 순차)
+    max_concurrency: int = Field(default=4, ge=1)
+
+    # 첨부파일 파싱 워커 (None = CPU 수, 0 = 프로세스 분리 없이 실행)
+    parse_workers: Optional[int] = Field(default=None, ge=0)
+    parse_timeout_sec: float = Field(default=120, gt=0)
+    parse_memory_limit_mb: Optional[int] = 1024
+
+    # 첨부파일 다운로드 필터
+    attachment_filter: AttachmentFilterConfig = Field(default_factory=AttachmentFilterConfig)
+
     # AI 설정
     enable_ai_analysis: bool = False
     ai_model: str = "claude-3-haiku"
 
+    _vendor_resolver: Optional[object] = PrivateAttr(default=None)
+
     @classmethod
     def from_yaml(cls, path: Path) -> "ProjectConfig":
         """YAML 파일에서 설정 로드"""
@@ -66,6 +96,8 @@ class ProjectConfig(BaseModel):
             data["slack_lists"] = SlackListsConfig(**data["slack_lists"])
         if "status_rules" in data:
             data["status_rules"] = [StatusTransitionRule(**r) for r in data["status_rules"]]
+        if "attachment_filter" in data:
+            data["attachment_filter"] = AttachmentFilterConfig(**(data["attachment_filter"] or {}))
         if "attachments_dir" in data:
             data["attachments_dir"] = Path(data["attachments_dir"])
         if "state_file" in data:
@@ -73,14 +105,20 @@ class ProjectConfig(BaseModel):
 
         return cls(**data)
 
+    @property
+    def vendor_resolver(self):
+        """vendors 기반 VendorResolver (최초 접근 시 1회 생성)"""
+        if self._vendor_resolver is None:
+            try:
+                from .vendor_resolver import VendorResolver
+            except ImportError:
+                from vendor_resolver import VendorResolver
+            self._vendor_resolver = VendorResolver(self.vendors)
+        return self._vendor_resolver
+
     def get_vendor_by_domain(self, email: str) -> Optional[VendorMapping]:
         """이메일 도메인으로 업체 찾기"""
-        email_lower = email.lower()
-        for vendor in self.vendors:
-            for domain in vendor.domains:
-                if domain.lower() in email_lower:
-                    return vendor
-        return None
+        return self.vendor_resolver.resolve_address(email)
 
     def get_vendor_by_name(self, name: str) -> Optional[VendorMapping]:
         """업체명으로 찾기"""
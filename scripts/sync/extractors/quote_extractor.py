@@ -1,10 +1,11 @@
 """Quote extractor for parsing pricing information from documents."""
 
 import re
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Union
 
 import sys
 sys.path.insert(0, str(Path(__file__).parents[1]))
@@ -17,21 +18,66 @@ except ImportError:
     HAS_PANDAS = False
 
 
+def _keyword_pattern(keywords: List[str]) -> str:
+    """Regex alternation matching any keyword literally."""
+    return "|".join(re.escape(kw.lower()) for kw in keywords)
+
+
+def _to_numeric(column: "pd.Series") -> "pd.Series":
+    """Coerce a column to numbers ("48,000,000" strings included, others NaN)."""
+    if pd.api.types.is_numeric_dtype(column.dtype):
+        return column
+    return pd.to_numeric(column.astype(str).str.replace(",", "", regex=False), errors="coerce")
+
+
+def row_text_lower(df: "pd.DataFrame") -> "pd.Series":
+    """
+    Lowercased row text, built column-wise.
+
+    Equivalent to " ".join(str(v).lower() for v in row if pd.notna(v))
+    for every row, without iterating rows in Python.
+    """
+    text = pd.Series("", index=df.index, dtype=object)
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        present = column.notna()
+        piece = column.astype(str).str.lower().where(present, "")
+        separator = pd.Series(" ", index=df.index).where(present & (text != ""), "")
+        text = text + separator + piece
+    return text
+
+
+class AmountToken(NamedTuple):
+    """Monetary amount found in text."""
+    amount: Decimal
+    text: str
+    start: int
+    end: int
+    unit: str  # 억 | 만 | 원 | $ | M
+    currency: Optional[str]  # KRW | USD | None (unknown)
+
+
 class QuoteExtractor:
     """Extract quote/pricing information from text and tables."""
 
-    # Korean amount patterns
+    # Bump when extraction rules change (invalidates cached QuoteOptions)
+    VERSION = "4"
+
+    # Amount patterns: (regex with one number group, multiplier, unit, currency)
+    # Order is the overlap priority when two patterns match at the same position.
     AMOUNT_PATTERNS = [
         # 48억원, 3.74억원
-        (r'(\d+(?:\.\d+)?)\s*억\s*(?:원)?', 100_000_000),
+        (r'(\d+(?:\.\d+)?)\s*억\s*(?:원)?', 100_000_000, "억", "KRW"),
         # 6,600만원, 3,000만원
-        (r'(\d{1,3}(?:,\d{3})*)\s*만\s*(?:원)?', 10_000),
+        (r'(\d{1,3}(?:,\d{3})*)\s*만\s*(?:원)?', 10_000, "만", "KRW"),
         # 66,000,000원
-        (r'(\d{1,3}(?:,\d{3})+)\s*원', 1),
-        # $48,000,000
-        (r'\$\s*(\d{1,3}(?:,\d{3})+)', 1),
+        (r'(\d{1,3}(?:,\d{3})+)\s*원', 1, "원", "KRW"),
+        # $48M, $3.5 million (USD millions - must rank before plain $)
+        (r'\$\s*(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*[Mm](?:illion)?(?![A-Za-z])', 1_000_000, "M", "USD"),
+        # $48,000,000, $500, $1,250.50
+        (r'\$\s*(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)', 1, "$", "USD"),
         # 48M, 3.74M (millions)
-        (r'(\d+(?:\.\d+)?)\s*[Mm](?:illion)?', 1_000_000),
+        (r'(\d+(?:\.\d+)?)\s*[Mm](?:illion)?', 1_000_000, "M", None),
     ]
 
     # Keywords for total/summary rows
@@ -40,6 +86,9 @@ class QuoteExtractor:
         "소계", "subtotal", "전체", "최종"
     ]
 
+    # Max distance (chars) between a total keyword and its amount
+    TOTAL_WINDOW = 200
+
     # Keywords for quote options
     OPTION_KEYWORDS = [
         "옵션", "option", "안", "plan", "패키지", "package",
@@ -48,10 +97,54 @@ class QuoteExtractor:
 
     def __init__(self):
         """Initialize extractor."""
-        self._compiled_patterns = [
-            (re.compile(pattern, re.IGNORECASE), multiplier)
-            for pattern, multiplier in self.AMOUNT_PATTERNS
-        ]
+        # One alternation: each pattern becomes (?P<pN>...) wrapping its number group
+        self._amount_scanner = re.compile(
+            "|".join(
+                f"(?P<p{i}>{pattern})"
+                for i, (pattern, _mult, _unit, _cur) in enumerate(self.AMOUNT_PATTERNS)
+            ),
+            re.IGNORECASE,
+        )
+        # Longest first so "grand total" wins over "total" at the same position
+        self._total_scanner = re.compile("|".join(
+            re.escape(kw) for kw in sorted(self.TOTAL_KEYWORDS, key=len, reverse=True)
+        ))
+
+    def scan_amounts(self, text: str) -> List[AmountToken]:
+        """
+        Scan text once for monetary amounts.
+
+        Tokens never overlap: the leftmost match wins, and at the same
+        position the earlier AMOUNT_PATTERNS entry wins.
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            AmountTokens in text order
+        """
+        tokens = []
+
+        for match in self._amount_scanner.finditer(text):
+            index = int(match.lastgroup[1:])
+            _pattern, multiplier, unit, currency = self.AMOUNT_PATTERNS[index]
+            # Number group follows its pattern's named group
+            number = match.group(match.re.groupindex[match.lastgroup] + 1)
+            try:
+                num = float(number.replace(",", ""))
+            except ValueError:
+                continue
+
+            tokens.append(AmountToken(
+                amount=Decimal(str(num * multiplier)),
+                text=match.group(0),
+                start=match.start(),
+                end=match.end(),
+                unit=unit,
+                currency=currency,
+            ))
+
+        return tokens
 
     def extract_amounts(self, text: str) -> List[tuple]:
         """
@@ -63,32 +156,50 @@ class QuoteExtractor:
         Returns:
             List of (amount_decimal, original_text, position) tuples
         """
-        results = []
-
-        for pattern, multiplier in self._compiled_patterns:
-            for match in pattern.finditer(text):
-                try:
-                    # Parse the number
-                    num_str = match.group(1).replace(",", "")
-                    num = float(num_str)
-                    amount = Decimal(str(num * multiplier))
-
-                    results.append((
-                        amount,
-                        match.group(0),
-                        match.start(),
-                    ))
-                except (ValueError, IndexError):
-                    continue
-
-        # Sort by position
-        results.sort(key=lambda x: x[2])
-        return results
+        return [(t.amount, t.text, t.start) for t in self.scan_amounts(text)]
+
+    def _index_total_keywords(self, text_lower: str) -> Dict[str, List[int]]:
+        """Positions of every TOTAL_KEYWORDS occurrence (sorted per keyword)."""
+        positions: Dict[str, List[int]] = {}
+        for match in self._total_scanner.finditer(text_lower):
+            positions.setdefault(match.group(0), []).append(match.start())
+        return positions
+
+    def _totals_near(
+        self,
+        amounts: List[AmountToken],
+        starts: List[int],
+        keyword_positions: List[int],
+    ) -> List[AmountToken]:
+        """
+        Resolve one total per keyword occurrence.
+
+        Amounts are split between neighbouring occurrences at the midpoint,
+        so each option's total is only matched to its own keyword. Within
+        that range (and TOTAL_WINDOW), the largest amount is the total.
+        """
+        totals = []
+        window = self.TOTAL_WINDOW
+
+        for i, pos in enumerate(keyword_positions):
+            lo = bisect_right(starts, pos - window)
+            hi = bisect_left(starts, pos + window)
+            if i > 0:
+                lo = max(lo, bisect_right(starts, (keyword_positions[i - 1] + pos) / 2))
+            if i + 1 < len(keyword_positions):
+                hi = min(hi, bisect_right(starts, (pos + keyword_positions[i + 1]) / 2))
+            if lo < hi:
+                totals.append(max(amounts[lo:hi], key=lambda t: t.amount))
+
+        return totals
 
     def extract_from_text(self, text: str) -> List[QuoteOption]:
         """
         Extract quote options from plain text.
 
+        Every occurrence of the highest-priority total keyword yields a
+        total, so multi-option proposals return one option per total.
+
         Args:
             text: Text content (e.g., from PDF)
 
@@ -96,46 +207,45 @@ class QuoteExtractor:
             List of QuoteOption objects
         """
         options = []
-        amounts = self.extract_amounts(text)
+        amounts = self.scan_amounts(text)
 
         if not amounts:
             return options
 
-        # Look for total/summary amounts
-        text_lower = text.lower()
-
-        # Find the largest amount (often the total)
-        max_amount = max(amounts, key=lambda x: x[0])
+        starts = [t.start for t in amounts]
+        keyword_index = self._index_total_keywords(text.lower())
 
-        # Check if there's a clear total indicator
+        # Check if there's a clear total indicator (TOTAL_KEYWORDS order = priority)
         for keyword in self.TOTAL_KEYWORDS:
-            if keyword in text_lower:
-                # Find amounts near the keyword
-                keyword_pos = text_lower.find(keyword)
-                nearby_amounts = [
-                    a for a in amounts
-                    if abs(a[2] - keyword_pos) < 200  # Within 200 chars
-                ]
-                if nearby_amounts:
-                    total = max(nearby_amounts, key=lambda x: x[0])
-                    options.append(QuoteOption(
-                        option_id="total",
-                        option_name="합계",
-                        total_amount=total[0],
-                        currency="KRW",
-                        source_file=None,
-                        extracted_at=datetime.now(),
-                        extraction_method="rule_based",
-                        confidence=0.8,
-                    ))
-                    return options
+            positions = keyword_index.get(keyword)
+            if not positions:
+                continue
+
+            totals = self._totals_near(amounts, starts, positions)
+            if not totals:
+                continue
+
+            for n, total in enumerate(totals, start=1):
+                multiple = len(totals) > 1
+                options.append(QuoteOption(
+                    option_id=f"total_{n}" if multiple else "total",
+                    option_name=f"합계 {n}" if multiple else "합계",
+                    total_amount=total.amount,
+                    currency=total.currency or "KRW",
+                    source_file=None,
+                    extracted_at=datetime.now(),
+                    extraction_method="rule_based",
+                    confidence=0.8,
+                ))
+            return options
 
         # Fallback: use largest amount as primary quote
+        max_amount = max(amounts, key=lambda t: t.amount)
         options.append(QuoteOption(
             option_id="primary",
             option_name="견적",
-            total_amount=max_amount[0],
-            currency="KRW",
+            total_amount=max_amount.amount,
+            currency=max_amount.currency or "KRW",
             source_file=None,
             extracted_at=datetime.now(),
             extraction_method="rule_based",
@@ -166,70 +276,64 @@ class QuoteExtractor:
         return self._extract_from_list(data)
 
     def _extract_from_dataframe(self, df: "pd.DataFrame") -> List[QuoteOption]:
-        """Extract from pandas DataFrame."""
+        """Extract from pandas DataFrame (column-wise, no per-row Python loop)."""
         options = []
+        if df.empty:
+            return options
 
-        # Find amount columns
-        amount_cols = []
-        for col in df.columns:
-            col_str = str(col).lower()
-            if any(kw in col_str for kw in ["금액", "amount", "가격", "price", "비용", "cost"]):
-                amount_cols.append(col)
+        # Find amount columns (by position - headers may repeat)
+        amount_cols = [
+            i for i, col in enumerate(df.columns)
+            if any(kw in str(col).lower() for kw in ["금액", "amount", "가격", "price", "비용", "cost"])
+        ]
 
-        # If no explicit amount column, try all numeric columns
+        # If no explicit amount column, try all numeric columns (bool/checkbox columns excluded)
         if not amount_cols:
-            amount_cols = df.select_dtypes(include=['number']).columns.tolist()
-
-        # Find total row
-        for idx, row in df.iterrows():
-            row_str = " ".join(str(v).lower() for v in row.values if pd.notna(v))
+            amount_cols = [
+                i for i, dtype in enumerate(df.dtypes)
+                if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            ]
+        if not amount_cols:
+            return options
 
-            if any(kw in row_str for kw in self.TOTAL_KEYWORDS):
-                # Extract amount from this row
-                for col in amount_cols:
-                    val = row.get(col)
-                    if pd.notna(val):
-                        try:
-                            amount = Decimal(str(val))
-                            if amount > 0:
-                                options.append(QuoteOption(
-                                    option_id="total",
-                                    option_name="합계",
-                                    total_amount=amount,
-                                    currency="KRW",
-                                    extracted_at=datetime.now(),
-                                    extraction_method="rule_based",
-                                    confidence=0.9,
-                                ))
-                                break
-                        except (ValueError, TypeError):
-                            pass
-
-        # Look for option rows
-        for idx, row in df.iterrows():
-            row_str = " ".join(str(v).lower() for v in row.values if pd.notna(v))
-
-            if any(kw in row_str for kw in self.OPTION_KEYWORDS):
-                for col in amount_cols:
-                    val = row.get(col)
-                    if pd.notna(val):
-                        try:
-                            amount = Decimal(str(val))
-                            if amount > 0:
-                                # Extract option name from first column
-                                option_name = str(row.iloc[0]) if len(row) > 0 else f"Option {len(options) + 1}"
-                                options.append(QuoteOption(
-                                    option_id=f"opt_{len(options) + 1}",
-                                    option_name=option_name[:50],
-                                    total_amount=amount,
-                                    currency="KRW",
-                                    extracted_at=datetime.now(),
-                                    extraction_method="rule_based",
-                                    confidence=0.85,
-                                ))
-                                break
-                        except (ValueError, TypeError):
-                            pass
+        row_text = row_text_lower(df)
+        total_rows = row_text.str.contains(_keyword_pattern(self.TOTAL_KEYWORDS), regex=True)
+        option_rows = row_text.str.contains(_keyword_pattern(self.OPTION_KEYWORDS), regex=True)
+
+        # First positive amount per row, in amount column order
+        amounts = pd.concat(
+            [_to_numeric(df.iloc[:, i]) for i in amount_cols],
+            axis=1,
+            ignore_index=True,
+        )
+        first_amount = amounts.where(amounts > 0).bfill(axis=1).iloc[:, 0]
+        has_amount = first_amount.notna().to_numpy()
+
+        # Total rows
+        for value in first_amount[total_rows.to_numpy() & has_amount]:
+            options.append(QuoteOption(
+                option_id="total",
+                option_name="합계",
+                total_amount=Decimal(str(value)),
+                currency="KRW",
+                extracted_at=datetime.now(),
+                extraction_method="rule_based",
+                confidence=0.9,
+            ))
+
+        # Option rows (option name from first column)
+        mask = option_rows.to_numpy() & has_amount
+        names = df.iloc[:, 0].astype(str)[mask]
+        for name, value in zip(names, first_amount[mask]):
+            options.append(QuoteOption(
+                option_id=f"opt_{len(options) + 1}",
+                option_name=name[:50],
+                total_amount=Decimal(str(value)),
+                currency="KRW",
+                extracted_at=datetime.now(),
+                extraction_method="rule_based",
+                confidence=0.85,
+            ))
 
         return options
 
@@ -247,13 +351,13 @@ class QuoteExtractor:
             if any(kw in row_str for kw in self.TOTAL_KEYWORDS):
                 # Find numeric values in row
                 for cell in row:
-                    amounts = self.extract_amounts(str(cell) if cell else "")
+                    amounts = self.scan_amounts(str(cell) if cell else "")
                     if amounts:
                         options.append(QuoteOption(
                             option_id="total",
                             option_name="합계",
-                            total_amount=amounts[0][0],
-                            currency="KRW",
+                            total_amount=amounts[0].amount,
+                            currency=amounts[0].currency or "KRW",
                             extracted_at=datetime.now(),
                             extraction_method="rule_based",
                             confidence=0.85,
@@ -303,3 +407,88 @@ def get_quote_extractor() -> QuoteExtractor:
     if _extractor is None:
         _extractor = QuoteExtractor()
     return _extractor
+
+
+def _run_tests() -> bool:
+    """인라인 테스트."""
+    sys.stdout.reconfigure(encoding="utf-8")
+
+    extractor = QuoteExtractor()
+    passed = 0
+    failed = 0
+
+    def _assert(test_name, condition, detail=""):
+        nonlocal passed, failed
+        if condition:
+            print(f"  PASS: {test_name}")
+            passed += 1
+        else:
+            print(f"  FAIL: {test_name} - {detail}")
+            failed += 1
+
+    print("=== QuoteExtractor Tests ===\n")
+
+    # 1. 단위별 금액 (억/만/원/$/M)
+    print("[Test 1] scan_amounts 단위/통화")
+    cases = [
+        ("3.74억원", Decimal("374000000"), "억", "KRW"),
+        ("6,600만원", Decimal("66000000"), "만", "KRW"),
+        ("66,000,000원", Decimal("66000000"), "원", "KRW"),
+        ("$1,250.50", Decimal("1250.5"), "$", "USD"),
+        ("$ 500", Decimal("500"), "$", "USD"),
+        ("48M", Decimal("48000000"), "M", None),
+        ("2.5 million", Decimal("2500000"), "M", None),
+    ]
+    for text, amount, unit, currency in cases:
+        tokens = extractor.scan_amounts(text)
+        _assert(
+            text,
+            len(tokens) == 1 and tokens[0].amount == amount
+            and (tokens[0].unit, tokens[0].currency) == (unit, currency)
+            and tokens[0].text.strip() == text,
+            f"실제: {tokens}",
+        )
+
+    # 2. 겹치는 매치 없음 - 가장 왼쪽 매치 우선, 같은 위치면 앞선 패턴 우선
+    print("\n[Test 2] scan_amounts 비중첩/우선순위")
+    for text, amount in [("$48M", "48000000"), ("$3.5 million", "3500000"), ("총 $1.2M 견적", "1200000")]:
+        tokens = extractor.scan_amounts(text)
+        _assert(
+            f"{text} → USD 백만 단위 한 번",
+            [(t.amount, t.currency) for t in tokens] == [(Decimal(amount), "USD")],
+            f"실제: {tokens}",
+        )
+    tokens = extractor.scan_amounts("$500 max")
+    _assert("$500 max → $", [(t.unit, t.amount) for t in tokens] == [("$", Decimal("500"))], f"실제: {tokens}")
+    tokens = extractor.scan_amounts("1,000원")
+    _assert("만 패턴 실패 → 원", [(t.unit, t.amount) for t in tokens] == [("원", Decimal("1000"))], f"실제: {tokens}")
+    tokens = extractor.scan_amounts("옵션 A 48억원, 옵션 B 6,600만원 (합계 $3.5M)")
+    _assert(
+        "텍스트 순서/위치",
+        [(t.unit, t.amount) for t in tokens] == [
+            ("억", Decimal("4800000000")), ("만", Decimal("66000000")), ("M", Decimal("3500000")),
+        ]
+        and all(a.end <= b.start for a, b in zip(tokens, tokens[1:])),
+        f"실제: {tokens}",
+    )
+    _assert("extract_amounts 호환", extractor.extract_amounts("48억원") == [(Decimal("4800000000"), "48억원", 0)])
+    _assert("금액 없음", extractor.scan_amounts("2024년 1월 회의") == [], f"실제: {extractor.scan_amounts('2024년 1월 회의')}")
+
+    if HAS_PANDAS:
+        # 3. 금액 컬럼명 없음 + bool(체크박스) 컬럼 → 숫자 컬럼만 사용
+        print("\n[Test 3] DataFrame bool 컬럼 제외")
+        df = pd.DataFrame({"항목": ["합계", "옵션 A"], "포함": [True, True], "수량": [3, 5]})
+        try:
+            options = extractor.extract_from_table(df)
+            amounts = {opt.option_id: opt.total_amount for opt in options}
+            _assert("total=3", amounts.get("total") == Decimal("3"), f"실제: {amounts}")
+            _assert("option=5", Decimal("5") in amounts.values(), f"실제: {amounts}")
+        except Exception as e:
+            _assert("예외 없음", False, repr(e))
+
+    print(f"\n=== Results: {passed}/{passed + failed} passed ===")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if _run_tests() else 1)
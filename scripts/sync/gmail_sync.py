@@ -20,34 +20,17 @@ _wsoptv_root = _script_dir.parents[1]
 _claude_root = _script_dir.parents[2]
 sys.path.insert(0, str(_claude_root))
 
-from lib.gmail import GmailClient, GmailMessage  # noqa: E402
+from lib.gmail import GmailMessage  # noqa: E402
 
 # Import models from same directory
 try:
     from .models import SyncResult, EmailDirection
+    from .vendor_resolver import get_vendor_resolver
+    from .client_registry import get_api_scheduler, get_gmail_client, get_gmail_profile
 except ImportError:
     from models import SyncResult, EmailDirection
-
-
-# Company detection patterns
-COMPANY_PATTERNS = {
-    "brightcove": {
-        "name": "Brightcove",
-        "domains": ["brightcove.com"],
-    },
-    "megazone": {
-        "name": "메가존클라우드",
-        "domains": ["megazone.com", "megazonecloud.com"],
-    },
-    "vimeo": {
-        "name": "Vimeo",
-        "domains": ["vimeo.com"],
-    },
-    "malgum": {
-        "name": "맑음소프트",
-        "domains": ["malgum.com", "malgumsoft.com"],
-    },
-}
+    from vendor_resolver import get_vendor_resolver
+    from client_registry import get_api_scheduler, get_gmail_client, get_gmail_profile
 
 
 class CompanyDetector:
@@ -64,19 +47,8 @@ class CompanyDetector:
         Returns:
             Company name if detected, None otherwise
         """
-        # Extract email from "Name <email>" format
-        match = re.search(r"<([^>]+)>", email)
-        if match:
-            email = match.group(1)
-
-        email = email.lower()
-
-        for key, info in COMPANY_PATTERNS.items():
-            for domain in info["domains"]:
-                if domain in email:
-                    return info["name"]
-
-        return None
+        vendor = get_vendor_resolver().resolve_address(email)
+        return vendor.name if vendor else None
 
 
 class MarkdownParser:
@@ -243,8 +215,8 @@ def sync_gmail_to_log(
     result = SyncResult()
 
     # Initialize client
-    client = GmailClient()
-    profile = client.get_profile()
+    client = get_gmail_client()
+    profile = get_gmail_profile(client)
     user_email = profile.get("emailAddress", "")
 
     formatter = EmailLogFormatter(user_email)
@@ -255,7 +227,7 @@ def sync_gmail_to_log(
     full_query = f"{query} {date_query}"
 
     print(f"Fetching emails with query: {full_query}")
-    messages = client.list_emails(query=full_query, max_results=100)
+    messages = get_api_scheduler().call("gmail", "messages.list", client.list_emails, query=full_query, max_results=100)
 
     print(f"Found {len(messages)} messages")
 
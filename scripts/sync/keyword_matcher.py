@@ -0,0 +1,258 @@
+"""Multi-keyword matcher (Aho-Corasick) for status/quote/action detection."""
+
+import sys
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+
+class KeywordHit(NamedTuple):
+    """One keyword occurrence (offsets refer to the lowercased text)."""
+
+    start: int
+    end: int
+    keyword: str
+    category: Hashable
+    priority: int  # Registration order within the category (0 = highest)
+
+
+class KeywordMatcher:
+    """
+    Match many keywords against a text in a single pass.
+
+    Keywords are registered per category (e.g. "positive", "negative",
+    "quote", "action") and compiled into one Aho-Corasick automaton, so
+    the cost per message depends on the text length and the number of
+    hits, not on the size of the keyword tables. Overlapping hits are all
+    reported; a keyword may belong to several categories.
+
+    Matching is case-insensitive by default (text and keywords are
+    lowercased), like the `keyword in text.lower()` checks it replaces.
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[Dict[Hashable, Iterable[str]]] = None,
+        case_sensitive: bool = False,
+    ):
+        """
+        Initialize matcher.
+
+        Args:
+            keywords: Category -> keywords in priority order
+            case_sensitive: Match without lowercasing
+        """
+        self.case_sensitive = case_sensitive
+        self._entries: Dict[str, list] = {}  # normalized keyword -> [(keyword, category, priority)]
+        self._counts: Dict[Hashable, int] = {}
+        self._goto: Optional[List[dict]] = None
+        self._fail: List[int] = []
+        self._out: List[list] = []
+
+        for category, words in (keywords or {}).items():
+            for word in words:
+                self.add(category, word)
+
+    @classmethod
+    def from_status_rules(cls, rules: Sequence) -> "KeywordMatcher":
+        """
+        Build a matcher from config status_rules.
+
+        Each rule's triggers are registered under the rule's index, so
+        rules can be evaluated in config order from one scan.
+
+        Args:
+            rules: StatusTransitionRule list (or dicts with 'triggers')
+        """
+        matcher = cls()
+        for index, rule in enumerate(rules):
+            triggers = rule.get("triggers", []) if isinstance(rule, dict) else rule.triggers
+            for trigger in triggers:
+                matcher.add(index, trigger)
+        return matcher
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def add(self, category: Hashable, keyword: str):
+        """Register a keyword (priority = registration order in its category)."""
+        if not keyword:
+            return
+        priority = self._counts.get(category, 0)
+        self._counts[category] = priority + 1
+        self._entries.setdefault(self._normalize(keyword), []).append((keyword, category, priority))
+        self._goto = None  # Rebuild on next scan
+
+    def _build(self):
+        """Compile the trie with failure links and merged outputs."""
+        goto: List[dict] = [{}]
+        fail = [0]
+        out: List[list] = [[]]
+
+        for word, entries in self._entries.items():
+            node = 0
+            for ch in word:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                node = nxt
+            out[node] = [(len(word), keyword, category, priority) for keyword, category, priority in entries]
+
+        # BFS: failure links point to the longest proper suffix in the trie
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def iter_hits(self, text: str) -> Iterator[KeywordHit]:
+        """
+        Yield every keyword occurrence in one pass, ordered by end offset.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            KeywordHit per (occurrence, category)
+        """
+        if self._goto is None:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+
+        node = 0
+        for i, ch in enumerate(self._normalize(text or "")):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, keyword, category, priority in out[node]:
+                yield KeywordHit(i + 1 - length, i + 1, keyword, category, priority)
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """All keyword occurrences in the text."""
+        return list(self.iter_hits(text))
+
+    @staticmethod
+    def categories(hits: Iterable[KeywordHit]) -> Dict[Hashable, List[str]]:
+        """
+        Group hits by category.
+
+        Returns:
+            Category -> distinct keywords found, in priority order
+        """
+        found: Dict[Hashable, Dict[int, str]] = {}
+        for hit in hits:
+            found.setdefault(hit.category, {})[hit.priority] = hit.keyword
+        return {
+            category: [keywords[p] for p in sorted(keywords)]
+            for category, keywords in found.items()
+        }
+
+    @staticmethod
+    def first(hits: Iterable[KeywordHit], categories: Sequence[Hashable]) -> Optional[KeywordHit]:
+        """
+        Pick the highest-priority hit.
+
+        Categories are ranked by their order in `categories`, then by
+        keyword registration order - the same result as checking each
+        keyword table in order with `keyword in text`.
+
+        Args:
+            hits: Hits from iter_hits/find_all
+            categories: Categories to consider, highest priority first
+
+        Returns:
+            Winning hit (earliest occurrence of that keyword) or None
+        """
+        rank = {category: i for i, category in enumerate(categories)}
+        best = None
+        best_key = None
+        for hit in hits:
+            if hit.category not in rank:
+                continue
+            key = (rank[hit.category], hit.priority, hit.start)
+            if best_key is None or key < best_key:
+                best, best_key = hit, key
+        return best
+
+
+def _run_tests() -> bool:
+    """인라인 테스트."""
+    sys.stdout.reconfigure(encoding="utf-8")
+
+    passed = 0
+    failed = 0
+
+    def _assert(test_name, condition, detail=""):
+        nonlocal passed, failed
+        if condition:
+            print(f"  PASS: {test_name}")
+            passed += 1
+        else:
+            print(f"  FAIL: {test_name} - {detail}")
+            failed += 1
+
+    print("=== KeywordMatcher Tests ===\n")
+
+    # 1. 겹치는 키워드 (접미사/포함 관계) 모두 보고
+    print("[Test 1] 겹치는 키워드")
+    matcher = KeywordMatcher({"k": ["he", "she", "his", "hers"]})
+    hits = [(h.start, h.keyword) for h in matcher.find_all("ushers")]
+    _assert("ushers", sorted(hits) == [(1, "she"), (2, "he"), (2, "hers")], f"실제: {hits}")
+    matcher = KeywordMatcher({"quote": ["견적", "견적서", "최종 견적서"]})
+    found = {h.keyword for h in matcher.find_all("최종 견적서 첨부")}
+    _assert("한글 포함 관계", found == {"견적", "견적서", "최종 견적서"}, f"실제: {found}")
+
+    # 2. 대소문자 무시 (기본) / 구분 옵션
+    print("\n[Test 2] 대소문자")
+    matcher = KeywordMatcher({"k": ["RFP", "Quote"]})
+    found = {h.keyword for h in matcher.find_all("rfp QUOTE attached")}
+    _assert("기본 무시", found == {"RFP", "Quote"}, f"실제: {found}")
+    matcher = KeywordMatcher({"k": ["RFP"]}, case_sensitive=True)
+    _assert("구분", not matcher.find_all("rfp") and len(matcher.find_all("RFP")) == 1)
+
+    # 3. first: 카테고리 순서 → 등록 순서 → 먼저 나온 위치
+    print("\n[Test 3] first 우선순위")
+    matcher = KeywordMatcher({"positive": ["진행", "협상"], "negative": ["보류", "거절"]})
+    text = "거절 후 협상 진행, 다시 진행"
+    hits = matcher.find_all(text)
+    best = KeywordMatcher.first(hits, ["negative", "positive"])
+    _assert("카테고리 순서", best is not None and best.keyword == "거절", f"실제: {best}")
+    best = KeywordMatcher.first(hits, ["positive"])
+    _assert("등록 순서/첫 위치", best is not None and (best.keyword, best.start) == ("진행", text.index("진행")), f"실제: {best}")
+    _assert("대상 카테고리 없음", KeywordMatcher.first(hits, ["action"]) is None)
+
+    # 4. categories: 중복 제거 + 우선순위 순, 여러 카테고리 등록
+    print("\n[Test 4] categories")
+    matcher = KeywordMatcher({"a": ["x", "y"], "b": ["y"]})
+    groups = KeywordMatcher.categories(matcher.find_all("y x y"))
+    _assert("그룹", groups == {"a": ["x", "y"], "b": ["y"]}, f"실제: {groups}")
+
+    # 5. 등록 후 재컴파일 / 빈 입력
+    print("\n[Test 5] 재컴파일/빈 입력")
+    matcher = KeywordMatcher({"k": ["a"]})
+    matcher.find_all("a")
+    matcher.add("k", "b")
+    matcher.add("k", "")
+    _assert("추가 키워드 반영", [h.keyword for h in matcher.find_all("ab")] == ["a", "b"])
+    _assert("빈 텍스트", matcher.find_all("") == [] and matcher.find_all(None) == [])
+    matcher = KeywordMatcher.from_status_rules([{"triggers": ["계약"]}, {"triggers": ["견적", "계약"]}])
+    groups = KeywordMatcher.categories(matcher.find_all("계약 견적"))
+    _assert("from_status_rules", groups == {0: ["계약"], 1: ["견적", "계약"]}, f"실제: {groups}")
+
+    print(f"\n=== Results: {passed}/{passed + failed} passed ===")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if _run_tests() else 1)
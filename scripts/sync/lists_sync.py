@@ -6,10 +6,14 @@ Also updates pinned messages in the project channel.
 """
 
 import json
+import re
 import sys
-from datetime import datetime
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 # Windows cp949 인코딩 에러 방지
 if sys.stdout and hasattr(sys.stdout, "reconfigure"):
@@ -18,38 +22,73 @@ if sys.stdout and hasattr(sys.stdout, "reconfigure"):
     except Exception:
         pass
 
-# Add C:\claude to path for lib.slack import
+# Add C:\claude to path for lib.slack/lib.gmail (loaded by client_registry)
 _script_dir = Path(__file__).resolve().parent
 _wsoptv_root = _script_dir.parents[1]
 _claude_root = _script_dir.parents[2]
 sys.path.insert(0, str(_claude_root))
 
-from lib.slack import SlackClient, SlackUserClient  # noqa: E402
-
 # Import models from same directory
 try:
     from .models import SyncResult
+    from .state_store import SqliteStateStore, KIND_EMAIL, KIND_SLACK
+    from .keyword_matcher import KeywordMatcher
+    from .vendor_resolver import get_vendor_resolver
+    from .client_registry import (
+        get_api_scheduler, get_gmail_client, get_slack_client, get_slack_user_client,
+    )
+    from .slack_history import fetch_history, newest_ts, to_slack_ts
 except ImportError:
     from models import SyncResult
+    from state_store import SqliteStateStore, KIND_EMAIL, KIND_SLACK
+    from keyword_matcher import KeywordMatcher
+    from vendor_resolver import get_vendor_resolver
+    from client_registry import (
+        get_api_scheduler, get_gmail_client, get_slack_client, get_slack_user_client,
+    )
+    from slack_history import fetch_history, newest_ts, to_slack_ts
 
 # Import attachment/parser/extractor modules
 try:
     from .collectors.attachment_downloader import AttachmentDownloader
-    from .parsers.pdf_parser import get_pdf_parser
+    from .parsers.pdf_parser import PDFParser, get_pdf_parser
     from .parsers.excel_parser import get_excel_parser
     from .extractors.quote_extractor import get_quote_extractor
 except ImportError:
     try:
         from collectors.attachment_downloader import AttachmentDownloader
-        from parsers.pdf_parser import get_pdf_parser
+        from parsers.pdf_parser import PDFParser, get_pdf_parser
         from parsers.excel_parser import get_excel_parser
         from extractors.quote_extractor import get_quote_extractor
     except ImportError:
         AttachmentDownloader = None
+        PDFParser = None
         get_pdf_parser = None
         get_excel_parser = None
         get_quote_extractor = None
 
+# GmailBatchFetcher import (history scope filtering)
+try:
+    from .collectors.gmail_batch import GmailBatchFetcher
+except ImportError:
+    try:
+        from collectors.gmail_batch import GmailBatchFetcher
+    except ImportError:
+        GmailBatchFetcher = None
+
+# ParseCache / ParseExecutor import
+try:
+    from .parsers.parse_cache import ParseCache
+    from .parsers.parse_executor import ParseExecutor, parse_pdf
+except ImportError:
+    try:
+        from parsers.parse_cache import ParseCache
+        from parsers.parse_executor import ParseExecutor, parse_pdf
+    except ImportError:
+        ParseCache = None
+        ParseExecutor = None
+        parse_pdf = None
+
 # QuoteFormatter import
 try:
     from .formatters.quote_formatter import QuoteFormatter
@@ -104,11 +143,26 @@ STATUS_PRIORITY = {
 class QuoteAnalyzer:
     """첨부파일 AI 분석 기반 견적 추론 파이프라인."""
 
-    def __init__(self, cache_dir: Path = None, gmail_client=None):
+    # _scan_excel_quotes 규칙 변경 시 증가 (캐시된 QuoteOption 무효화)
+    EXCEL_EXTRACT_VERSION = "1"
+
+    # 워커 프로세스 파싱 제한 (파일당)
+    PARSE_TIMEOUT = 120
+    PARSE_MEMORY_LIMIT_MB = 1024
+
+    def __init__(
+        self,
+        cache_dir: Path = None,
+        gmail_client=None,
+        parse_workers: int = None,
+        full_tables: bool = False,
+    ):
         """
         Args:
             cache_dir: 첨부파일 저장 디렉토리
             gmail_client: GmailClient 인스턴스 (없으면 자동 생성)
+            parse_workers: 파싱 워커 프로세스 수 (None = CPU 수, 0 = 프로세스 분리 없이 실행)
+            full_tables: PDF 전체 페이지 테이블 추출 (기본: 금액/합계 키워드가 있는 페이지만)
         """
         self.cache_dir = cache_dir or Path("C:/claude/wsoptv_ott/attachments")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -117,6 +171,25 @@ class QuoteAnalyzer:
         self._pdf_parser = None
         self._excel_parser = None
         self._quote_extractor = None
+        self._parse_cache = None
+        self.parse_workers = parse_workers
+        self.full_tables = full_tables
+        # 로컬 경로 → 원본 첨부파일명 (캐시 blob 이름은 해시)
+        self._display_names: dict[Path, str] = {}
+
+    def _get_parse_cache(self):
+        """ParseCache lazy init (None if unavailable)."""
+        if self._parse_cache is None and ParseCache is not None:
+            try:
+                self._parse_cache = ParseCache(self.cache_dir)
+            except Exception as e:
+                print(f"  [WARN] ParseCache unavailable: {e}")
+                self._parse_cache = False
+        return self._parse_cache or None
+
+    def _display_name(self, path: Path) -> str:
+        """첨부파일 표시용 이름 (원본 파일명 우선)."""
+        return self._display_names.get(path, path.name)
 
     def _get_downloader(self):
         """AttachmentDownloader lazy init."""
@@ -134,7 +207,7 @@ class QuoteAnalyzer:
         if self._pdf_parser is None:
             if get_pdf_parser is None:
                 raise ImportError("PDFParser not available")
-            self._pdf_parser = get_pdf_parser()
+            self._pdf_parser = PDFParser(full_tables=True) if self.full_tables else get_pdf_parser()
         return self._pdf_parser
 
     def _get_excel_parser(self):
@@ -189,28 +262,52 @@ class QuoteAnalyzer:
             if eid:
                 email_map[eid] = email
 
-        # vendor별 분석 대상 email 수집
+        # change의 email_id로 직접 조인 (email_id 없는 change만 vendor 인덱스 사용)
+        vendor_index = None
         vendor_emails = {}
         for change in quote_changes:
             vendor = change.get("vendor", "")
             if not vendor:
                 continue
 
-            # 같은 vendor의 email 중 quote_detected인 것 찾기
-            # change에 직접 email_id가 없으면 subject로 매칭
-            matched_email_ids = []
-            for eid, email in email_map.items():
-                email_vendor = self._detect_vendor_from_email(email)
-                if email_vendor == vendor and email.get("has_attachments"):
-                    matched_email_ids.append(eid)
+            email_ids = vendor_emails.setdefault(vendor, set())
+            eid = change.get("email_id")
+            if eid:
+                email = email_map.get(eid)
+                if email and email.get("has_attachments"):
+                    email_ids.add(eid)
+                continue
 
-            if vendor not in vendor_emails:
-                vendor_emails[vendor] = set()
-            vendor_emails[vendor].update(matched_email_ids)
+            if vendor_index is None:
+                vendor_index = self._index_emails_by_vendor(email_map)
+            email_ids.update(vendor_index.get(vendor, ()))
 
-        # vendor별 첨부파일 다운로드 및 분석
-        results = {}
+        # vendor별 첨부파일 다운로드
+        downloads = {}
         for vendor, email_ids in vendor_emails.items():
+            batched = self._download_attachments_batch(email_ids)
+            entries = []
+            for email_id in sorted(email_ids):
+                try:
+                    attachments = batched.get(email_id)
+                    if attachments is None:
+                        attachments = self._download_attachments(email_id)
+                    entries.append((email_id, attachments, None))
+                except Exception as e:
+                    entries.append((email_id, [], e))
+            downloads[vendor] = entries
+
+        # 캐시에 없는 파일은 워커 프로세스에서 파싱 (타임아웃/메모리 제한/크래시 격리)
+        parse_errors = self._parse_in_workers(
+            att_path
+            for entries in downloads.values()
+            for _email_id, attachments, _error in entries
+            for att_path in attachments
+        )
+
+        # vendor별 분석
+        results = {}
+        for vendor, entries in downloads.items():
             vendor_result = {
                 "files_analyzed": 0,
                 "quote_summary": "N/A",
@@ -219,33 +316,38 @@ class QuoteAnalyzer:
                 "errors": [],
             }
 
-            for email_id in email_ids:
-                try:
-                    attachments = self._download_attachments(email_id)
-                    for att_path in attachments:
-                        try:
-                            # Excel 파일은 직접 추출, PDF는 파싱 후 추출
-                            if att_path.suffix.lower() in (".xlsx", ".xls"):
-                                quotes = self._extract_quotes_from_excel(att_path)
-                                vendor_result["files_analyzed"] += 1
-                                vendor_result["options"].extend(quotes)
-                            else:
-                                parsed_text = self._parse_file(att_path)
-                                if parsed_text:
-                                    vendor_result["raw_texts"].append(parsed_text)
-                                    vendor_result["files_analyzed"] += 1
-
-                                    # 금액 추출
-                                    quotes = self._extract_quotes(parsed_text, vendor)
-                                    vendor_result["options"].extend(quotes)
-                        except Exception as e:
-                            vendor_result["errors"].append(
-                                f"Parse error ({att_path.name}): {e}"
-                            )
-                except Exception as e:
+            for email_id, attachments, download_error in entries:
+                if download_error is not None:
                     vendor_result["errors"].append(
-                        f"Download error (email {email_id[:8]}): {e}"
+                        f"Download error (email {email_id[:8]}): {download_error}"
                     )
+                    continue
+
+                for att_path in attachments:
+                    if att_path in parse_errors:
+                        vendor_result["errors"].append(
+                            f"Parse error ({self._display_name(att_path)}): {parse_errors[att_path]}"
+                        )
+                        continue
+                    try:
+                        # Excel 파일은 직접 추출, PDF는 파싱 후 추출
+                        if att_path.suffix.lower() in (".xlsx", ".xls"):
+                            quotes = self._extract_quotes_from_excel(att_path)
+                            vendor_result["files_analyzed"] += 1
+                            vendor_result["options"].extend(quotes)
+                        else:
+                            parsed_text = self._parse_file(att_path)
+                            if parsed_text:
+                                vendor_result["raw_texts"].append(parsed_text)
+                                vendor_result["files_analyzed"] += 1
+
+                                # 금액 추출
+                                quotes = self._extract_quotes(parsed_text, vendor)
+                                vendor_result["options"].extend(quotes)
+                    except Exception as e:
+                        vendor_result["errors"].append(
+                            f"Parse error ({self._display_name(att_path)}): {e}"
+                        )
 
             # 견적 요약 생성
             vendor_result["quote_summary"] = self._generate_ai_summary(
@@ -258,27 +360,63 @@ class QuoteAnalyzer:
 
         return results
 
-    def _detect_vendor_from_email(self, email: dict) -> Optional[str]:
-        """이메일에서 vendor 감지 (VendorChangeDetector 로직 재사용)."""
-        sender = email.get("sender", "")
-        subject = email.get("subject", "")
-        email_domain = sender.split("@")[-1].lower() if "@" in sender else ""
-
-        vendor_domains = {
-            "brightcove": "Brightcove",
-            "megazone": "메가존클라우드",
-            "megazonecloud": "메가존클라우드",
-            "mz.co.kr": "메가존클라우드",
-            "vimeo": "Vimeo OTT",
-            "jrmax": "Vimeo OTT",
-            "wecandeo": "맑음소프트 (WECANDEO)",
-            "malgum": "맑음소프트 (WECANDEO)",
-        }
+    def _parse_in_workers(self, paths) -> dict[Path, str]:
+        """
+        파싱 캐시에 없는 PDF/Excel 파일을 워커 프로세스에서 미리 파싱.
 
-        for domain_key, vendor_name in vendor_domains.items():
-            if domain_key in email_domain or domain_key in subject.lower():
-                return vendor_name
-        return None
+        결과는 ParseCache에 저장되어 이후 _parse_file /
+        _extract_quotes_from_excel 호출이 캐시에서 읽습니다.
+
+        Args:
+            paths: 첨부파일 경로
+
+        Returns:
+            실패(오류/타임아웃/크래시)한 파일 경로 → 오류 메시지
+        """
+        cache = self._get_parse_cache()
+        if not cache or ParseExecutor is None:
+            return {}
+
+        try:
+            jobs = []
+            for path in paths:
+                suffix = path.suffix.lower()
+                if suffix in (".xlsx", ".xls"):
+                    jobs.append((path, "v1_excel_options", self.EXCEL_EXTRACT_VERSION, QuoteAnalyzer._scan_excel_quotes))
+                elif suffix == ".pdf":
+                    jobs.append((
+                        path,
+                        "pdf",
+                        self._get_pdf_parser().cache_version,
+                        partial(parse_pdf, full_tables=self.full_tables),
+                    ))
+
+            executor = ParseExecutor(
+                max_workers=self.parse_workers,
+                timeout=self.PARSE_TIMEOUT,
+                memory_limit_mb=self.PARSE_MEMORY_LIMIT_MB,
+            )
+            return executor.warm_cache(cache, jobs)
+        except Exception as e:
+            # 워커 실행 불가 시 기존 순차 파싱으로 진행
+            print(f"  [WARN] Parse workers unavailable: {e}")
+            return {}
+
+    def _index_emails_by_vendor(self, email_map: dict) -> dict[str, list[str]]:
+        """첨부파일 있는 email을 vendor별로 인덱싱 (email당 vendor 감지 1회)."""
+        index = {}
+        for eid, email in email_map.items():
+            if not email.get("has_attachments"):
+                continue
+            vendor = self._detect_vendor_from_email(email)
+            if vendor:
+                index.setdefault(vendor, []).append(eid)
+        return index
+
+    def _detect_vendor_from_email(self, email: dict) -> Optional[str]:
+        """이메일에서 vendor 감지 (VendorResolver 공용)."""
+        vendor = get_vendor_resolver().resolve(email.get("sender", ""), email.get("subject", ""))
+        return vendor.name if vendor else None
 
     def _download_attachments(self, email_id: str) -> list[Path]:
         """
@@ -292,14 +430,37 @@ class QuoteAnalyzer:
         """
         downloader = self._get_downloader()
         attachments = downloader.get_quote_attachments(email_id)
+        return self._existing_paths(attachments)
+
+    def _download_attachments_batch(self, email_ids) -> dict[str, list[Path]]:
+        """
+        여러 이메일의 첨부파일을 배치 요청으로 다운로드.
+
+        Args:
+            email_ids: Gmail message ID 목록
+
+        Returns:
+            email_id → 파일 경로 리스트 (배치 실패한 email은 제외)
+        """
+        downloader = self._get_downloader()
+        try:
+            batched = downloader.get_quote_attachments_batch(email_ids)
+        except Exception:
+            return {}
+        return {
+            email_id: self._existing_paths(attachments)
+            for email_id, attachments in batched.items()
+        }
 
+    def _existing_paths(self, attachments) -> list[Path]:
+        """Attachment 목록에서 실제 존재하는 로컬 경로만 반환."""
         paths = []
         for att in attachments:
             if att.local_path:
                 path = Path(att.local_path)
                 if path.exists():
                     paths.append(path)
-
+                    self._display_names[path] = att.filename
         return paths
 
     def _parse_file(self, file_path: Path) -> str:
@@ -316,7 +477,11 @@ class QuoteAnalyzer:
 
         if suffix == ".pdf":
             parser = self._get_pdf_parser()
-            result = parser.extract_all(file_path)
+            cache = self._get_parse_cache()
+            if cache:
+                result = cache.cached_pdf(parser, file_path)
+            else:
+                result = parser.extract_all(file_path)
             text_parts = [result.get("text", "")]
 
             # 테이블 데이터도 텍스트로 변환
@@ -339,7 +504,11 @@ class QuoteAnalyzer:
 
         elif suffix in (".xlsx", ".xls"):
             parser = self._get_excel_parser()
-            sheets = parser.parse(file_path)
+            cache = self._get_parse_cache()
+            if cache:
+                sheets = cache.cached_excel(parser, file_path)
+            else:
+                sheets = parser.parse(file_path)
             text_parts = []
 
             for sheet_name, data in sheets.items():
@@ -375,27 +544,11 @@ class QuoteAnalyzer:
         Returns:
             QuoteOption 리스트
         """
-        import re
-
         extractor = self._get_quote_extractor()
+        # 통화는 스캐너 토큰에서 결정 ($ 접두사 → USD)
         options = extractor.extract_from_text(text)
 
-        # $ 접두사 금액을 원본 텍스트에서 추출하여 USD 보정
-        dollar_amounts = set()
-        for m in re.finditer(r'\$\s*([\d,]+(?:\.\d+)?)', text):
-            try:
-                amt = float(m.group(1).replace(",", ""))
-                dollar_amounts.add(amt)
-            except ValueError:
-                pass
-
         for opt in options:
-            # currency 보정: 원본에 $ 접두사가 있으면 USD
-            if opt.total_amount is not None:
-                opt_amt = float(opt.total_amount)
-                if opt_amt in dollar_amounts:
-                    opt.currency = "USD"
-
             # source_file에 vendor 정보 추가
             if not opt.source_file:
                 opt.source_file = f"attachment:{vendor}"
@@ -403,6 +556,34 @@ class QuoteAnalyzer:
         return options
 
     def _extract_quotes_from_excel(self, file_path: Path) -> list:
+        """
+        Excel 시트에서 견적 금액을 직접 추출 (내용 해시 기준 캐시).
+
+        Args:
+            file_path: Excel 파일 경로
+
+        Returns:
+            QuoteOption 리스트
+        """
+        cache = self._get_parse_cache()
+        if cache:
+            options = cache.get_or_compute(
+                file_path,
+                "v1_excel_options",
+                self.EXCEL_EXTRACT_VERSION,
+                lambda: self._scan_excel_quotes(file_path),
+            )
+        else:
+            options = self._scan_excel_quotes(file_path)
+
+        # 캐시는 내용 기준이므로 파일명은 매번 현재 첨부파일로 설정
+        display_name = self._display_name(file_path)
+        for opt in options:
+            opt.source_file = f"{display_name} - {opt.source_file}"
+        return options
+
+    @staticmethod
+    def _scan_excel_quotes(file_path: Path) -> list:
         """
         Excel 시트에서 견적 금액을 직접 추출.
 
@@ -415,10 +596,8 @@ class QuoteAnalyzer:
         Returns:
             QuoteOption 리스트
         """
-        try:
-            from openpyxl import load_workbook
-        except ImportError:
-            raise ImportError("openpyxl not available: pip install openpyxl")
+        if get_excel_parser is None:
+            raise ImportError("ExcelParser not available")
 
         # Import QuoteOption
         try:
@@ -430,15 +609,13 @@ class QuoteAnalyzer:
                 return []
 
         options = []
-        wb = load_workbook(file_path, data_only=True)
 
         # 키워드 패턴
         quote_keywords = ["총합", "정가", "금액", "할인", "이용", "annual", "total", "pricing"]
         discount_keywords = ["할인", "discount", "적용"]
 
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-
+        # 읽기 전용 스트리밍 (워크북 1회 로드, 시트별 행 순차 읽기)
+        for sheet_name, rows in get_excel_parser().iter_sheets(file_path):
             # 시트별 옵션명 추출
             sheet_option_name = sheet_name
 
@@ -447,7 +624,7 @@ class QuoteAnalyzer:
             regular_candidates = []
 
             # 각 행을 순회하며 키워드 + 숫자 셀 찾기
-            for row_idx, row in enumerate(ws.iter_rows(min_row=1, values_only=True), start=1):
+            for row_idx, row in enumerate(rows, start=1):
                 if not row:
                     continue
 
@@ -502,7 +679,7 @@ class QuoteAnalyzer:
                 option_name=option_name[:50],
                 total_amount=amount,
                 currency=currency,
-                source_file=f"{file_path.name} - {sheet_name}",
+                source_file=sheet_name,
                 extracted_at=datetime.now(),
                 extraction_method="excel_direct",
                 confidence=0.9,
@@ -582,14 +759,42 @@ class QuoteAnalyzer:
             return f"{amt:,.0f}원"
 
 
+@dataclass
+class ListsWritePlan:
+    """Slack Lists cell writes left after diffing against the list snapshot."""
+
+    cells: list[dict] = field(default_factory=list)
+    touched: dict[str, dict] = field(default_factory=dict)  # vendor -> changed field values
+    skipped: list[str] = field(default_factory=list)        # vendors already up to date
+    unknown: list[str] = field(default_factory=list)        # vendors without a list row
+
+    @property
+    def rows_touched(self) -> int:
+        return len(self.touched)
+
+    @property
+    def rows_skipped(self) -> int:
+        return len(self.skipped)
+
+    def __str__(self) -> str:
+        """String representation of the plan."""
+        text = f"Rows touched: {self.rows_touched}, Skipped: {self.rows_skipped}, Cells: {len(self.cells)}"
+        if self.unknown:
+            text += f", Unknown: {len(self.unknown)}"
+        return text
+
+
 class ListsSyncManager:
     """Manage synchronization with Slack Lists."""
 
+    # Cells per slackLists.items.update call (cells of several rows share one call)
+    MAX_CELLS_PER_UPDATE = 100
+
     def __init__(self):
-        """Initialize with both bot and user clients."""
-        self.bot_client = SlackClient()
+        """Initialize with both bot and user clients (shared per process)."""
+        self.bot_client = get_slack_client()
         try:
-            self.user_client = SlackUserClient()
+            self.user_client = get_slack_user_client()
         except Exception as e:
             print(f"Warning: User token not available, Lists API disabled: {e}")
             self.user_client = None
@@ -604,7 +809,9 @@ class ListsSyncManager:
         if not self.user_client:
             raise RuntimeError("User token required for Lists API")
 
-        result = self.user_client.get_list_items(LISTS_CONFIG["list_id"])
+        result = get_api_scheduler().call(
+            "slack", "slackLists.items.list", self.user_client.get_list_items, LISTS_CONFIG["list_id"]
+        )
 
         if not result.get("ok"):
             raise RuntimeError(f"Failed to fetch list items: {result}")
@@ -686,6 +893,119 @@ class ListsSyncManager:
             "notes": get_text_field(LISTS_CONFIG["columns"]["notes"]),
         }
 
+    @staticmethod
+    def _desired_values(
+        status: Optional[str] = None,
+        quote: Optional[str] = None,
+        last_contact: Optional[datetime] = None,
+        next_action: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> dict:
+        """Non-empty field values to write (last_contact as YYYY-MM-DD)."""
+        values = {}
+        if status and status in LISTS_CONFIG["status_options"]:
+            values["status"] = status
+        if quote:
+            values["quote"] = quote
+        if last_contact:
+            values["last_contact"] = last_contact.strftime("%Y-%m-%d")
+        if next_action:
+            values["next_action"] = next_action
+        if notes:
+            values["notes"] = notes
+        return values
+
+    @staticmethod
+    def _current_value(item: dict, field_name: str) -> str:
+        """Snapshot value in the same form as _desired_values."""
+        value = item.get(field_name)
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d")
+        return (value or "").strip()
+
+    @staticmethod
+    def _build_cell(field_name: str, row_id: str, value: str) -> dict:
+        """Build one slackLists.items.update cell."""
+        cell = {"column_id": LISTS_CONFIG["columns"][field_name], "row_id": row_id}
+        if field_name == "status":
+            cell["select"] = [LISTS_CONFIG["status_options"][value]]  # select는 배열 형식
+        elif field_name == "last_contact":
+            cell["date"] = [value]  # date도 배열 형식
+        else:
+            cell["rich_text"] = [{"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": value}]}]}]
+        return cell
+
+    def plan_updates(
+        self,
+        updates: Iterable[dict],
+        snapshot: Optional[list[dict]] = None,
+    ) -> ListsWritePlan:
+        """
+        Plan cell writes for several vendors.
+
+        Args:
+            updates: Dicts with vendor_name and update_item field kwargs
+                (status, quote, last_contact, next_action, notes)
+            snapshot: Current rows from get_list_items(); cells whose value
+                already matches are dropped (None = write all non-empty fields)
+
+        Returns:
+            ListsWritePlan with the remaining cells
+        """
+        by_name = {item["vendor_name"]: item for item in snapshot or []}
+        by_row = {item["row_id"]: item for item in snapshot or []}
+        plan = ListsWritePlan()
+
+        for update in updates:
+            fields = dict(update)
+            vendor_name = fields.pop("vendor_name")
+            row_id = LISTS_CONFIG["items"].get(vendor_name) or by_name.get(vendor_name, {}).get("row_id")
+            if not row_id:
+                plan.unknown.append(vendor_name)
+                continue
+
+            current = by_row.get(row_id) if snapshot is not None else None
+            changed = {
+                name: value
+                for name, value in self._desired_values(**fields).items()
+                if current is None or self._current_value(current, name) != value.strip()
+            }
+            if not changed:
+                plan.skipped.append(vendor_name)
+                continue
+
+            plan.touched.setdefault(vendor_name, {}).update(changed)
+            plan.cells.extend(self._build_cell(name, row_id, value) for name, value in changed.items())
+
+        return plan
+
+    def apply_plan(self, plan: ListsWritePlan) -> bool:
+        """
+        Send planned cells in as few slackLists.items.update calls as possible.
+
+        Returns:
+            True if every call succeeded (also for an empty plan)
+        """
+        if not plan.cells:
+            return True
+        if not self.user_client:
+            raise RuntimeError("User token required for Lists API")
+
+        ok = True
+        for i in range(0, len(plan.cells), self.MAX_CELLS_PER_UPDATE):
+            result = get_api_scheduler().call(
+                "slack",
+                "slackLists.items.update",
+                self.user_client._client.api_call,
+                "slackLists.items.update",
+                json={
+                    "list_id": LISTS_CONFIG["list_id"],
+                    "cells": plan.cells[i:i + self.MAX_CELLS_PER_UPDATE],
+                },
+            )
+            ok = result.data.get("ok", False) and ok
+        return ok
+
     def update_item(
         self,
         vendor_name: str,
@@ -698,6 +1018,9 @@ class ListsSyncManager:
         """
         Update a vendor item in Slack List.
 
+        Writes every given field; use plan_updates() with a snapshot to skip
+        unchanged cells and batch several vendors.
+
         Args:
             vendor_name: Name of vendor to update
             status: New status (must match status_options keys)
@@ -712,61 +1035,20 @@ class ListsSyncManager:
         if not self.user_client:
             raise RuntimeError("User token required for Lists API")
 
-        row_id = LISTS_CONFIG["items"].get(vendor_name)
-        if not row_id:
+        plan = self.plan_updates([{
+            "vendor_name": vendor_name,
+            "status": status,
+            "quote": quote,
+            "last_contact": last_contact,
+            "next_action": next_action,
+            "notes": notes,
+        }])
+        if plan.unknown:
             raise ValueError(f"Unknown vendor: {vendor_name}")
-
-        cells = []
-
-        if status:
-            option_id = LISTS_CONFIG["status_options"].get(status)
-            if option_id:
-                cells.append({
-                    "column_id": LISTS_CONFIG["columns"]["status"],
-                    "row_id": row_id,
-                    "select": [option_id],  # select는 배열 형식
-                })
-
-        if quote:
-            cells.append({
-                "column_id": LISTS_CONFIG["columns"]["quote"],
-                "row_id": row_id,
-                "rich_text": [{"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": quote}]}]}],
-            })
-
-        if last_contact:
-            cells.append({
-                "column_id": LISTS_CONFIG["columns"]["last_contact"],
-                "row_id": row_id,
-                "date": [last_contact.strftime("%Y-%m-%d")],  # date도 배열 형식
-            })
-
-        if next_action:
-            cells.append({
-                "column_id": LISTS_CONFIG["columns"]["next_action"],
-                "row_id": row_id,
-                "rich_text": [{"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": next_action}]}]}],
-            })
-
-        if notes:
-            cells.append({
-                "column_id": LISTS_CONFIG["columns"]["notes"],
-                "row_id": row_id,
-                "rich_text": [{"type": "rich_text", "elements": [{"type": "rich_text_section", "elements": [{"type": "text", "text": notes}]}]}],
-            })
-
-        if not cells:
+        if not plan.cells:
             return False
 
-        result = self.user_client._client.api_call(
-            "slackLists.items.update",
-            json={
-                "list_id": LISTS_CONFIG["list_id"],
-                "cells": cells,
-            },
-        )
-
-        return result.data.get("ok", False)
+        return self.apply_plan(plan)
 
     def generate_summary_message(self, items: list[dict]) -> str:
         """
@@ -838,7 +1120,10 @@ class ListsSyncManager:
 
         if update_existing and pinned_ts:
             # Update existing pinned message
-            result = self.bot_client._client.chat_update(
+            result = get_api_scheduler().call(
+                "slack",
+                "chat.update",
+                self.bot_client._client.chat_update,
                 channel=channel_id,
                 ts=pinned_ts,
                 text=message,
@@ -846,7 +1131,9 @@ class ListsSyncManager:
             return result.data.get("ts") if result.data.get("ok") else None
         else:
             # Post new message (fallback)
-            result = self.bot_client.send_message(channel_id, message)
+            result = get_api_scheduler().call(
+                "slack", "chat.postMessage", self.bot_client.send_message, channel_id, message
+            )
             return result.ts if result and result.ok else None
 
 
@@ -931,15 +1218,16 @@ class IncrementalSyncState:
 
     STATE_FILE = Path("C:/claude/wsoptv_ott/docs/management/.slacklist_state.json")
 
-    def __init__(self):
+    def __init__(self, state_file: Optional[Path] = None):
         """Load existing state or initialize new."""
+        self.state_file = state_file or self.STATE_FILE
         self.state = self._load_state()
 
     def _load_state(self) -> dict:
         """Load state from file or return default."""
-        if self.STATE_FILE.exists():
+        if self.state_file.exists():
             try:
-                return json.loads(self.STATE_FILE.read_text(encoding="utf-8"))
+                return json.loads(self.state_file.read_text(encoding="utf-8"))
             except Exception:
                 pass
         return self._default_state()
@@ -950,8 +1238,8 @@ class IncrementalSyncState:
             "version": "1.0",
             "last_sync": None,
             "processed": {
-                "gmail": {"last_email_date": None, "email_ids": []},
-                "slack": {"last_ts": None, "message_ts": []},
+                "gmail": {"last_email_date": None, "email_ids": [], "history_id": None},
+                "slack": {"last_ts": None, "message_ts": [], "cursors": {}},
             },
             "vendors": {},
             "pending_changes": [],
@@ -960,7 +1248,7 @@ class IncrementalSyncState:
     def save(self):
         """Save current state to file."""
         self.state["last_sync"] = datetime.now().isoformat()
-        self.STATE_FILE.write_text(
+        self.state_file.write_text(
             json.dumps(self.state, indent=2, ensure_ascii=False, default=str),
             encoding="utf-8",
         )
@@ -974,6 +1262,15 @@ class IncrementalSyncState:
         if email_id not in self.state["processed"]["gmail"]["email_ids"]:
             self.state["processed"]["gmail"]["email_ids"].append(email_id)
 
+    def get_gmail_history_id(self) -> Optional[str]:
+        """Get Gmail historyId checkpoint from the last saved sync."""
+        return self.state["processed"]["gmail"].get("history_id")
+
+    def update_gmail_history_id(self, history_id: Optional[str]):
+        """Update Gmail historyId checkpoint."""
+        if history_id:
+            self.state["processed"]["gmail"]["history_id"] = str(history_id)
+
     def is_slack_processed(self, ts: str) -> bool:
         """Check if Slack message was already processed."""
         return ts in self.state["processed"]["slack"]["message_ts"]
@@ -991,6 +1288,16 @@ class IncrementalSyncState:
         """Update last processed Slack timestamp."""
         self.state["processed"]["slack"]["last_ts"] = ts
 
+    def get_slack_cursor(self, channel_id: str) -> Optional[str]:
+        """Get newest fetched Slack ts for a channel (history 'oldest' cursor)."""
+        return self.state["processed"]["slack"].get("cursors", {}).get(channel_id)
+
+    def update_slack_cursor(self, channel_id: str, ts: Optional[str]):
+        """Advance a channel's Slack history cursor."""
+        current = self.get_slack_cursor(channel_id)
+        if ts and (current is None or float(ts) > float(current)):
+            self.state["processed"]["slack"].setdefault("cursors", {})[channel_id] = ts
+
     def add_pending_change(self, change: dict):
         """Add a pending change for user review."""
         change["detected_at"] = datetime.now().isoformat()
@@ -1032,26 +1339,142 @@ class IncrementalSyncState:
             "last_sync": self.state.get("last_sync"),
             "gmail_processed": len(self.state["processed"]["gmail"]["email_ids"]),
             "slack_processed": len(self.state["processed"]["slack"]["message_ts"]),
+            "gmail_history_id": self.state["processed"]["gmail"].get("history_id"),
             "vendors_tracked": len(self.state["vendors"]),
             "pending_changes": len(self.state["pending_changes"]),
         }
 
 
+class SqliteIncrementalSyncState(IncrementalSyncState):
+    """
+    SQLite-backed IncrementalSyncState.
+
+    Processed Gmail IDs / Slack ts are indexed rows instead of JSON lists,
+    and all changes are committed in one transaction on save().
+    """
+
+    STATE_FILE = IncrementalSyncState.STATE_FILE.with_suffix(".db")
+
+    def __init__(self, state_file: Optional[Path] = None):
+        """Open database, importing the JSON state on first use."""
+        self.state_file = state_file or self.STATE_FILE
+        self.store = SqliteStateStore(self.state_file)
+
+        json_file = IncrementalSyncState.STATE_FILE
+        is_new = self.store.get_meta("last_sync") is None and self.store.get_meta("migrated_from") is None
+        if is_new and json_file.exists():
+            counts = self.store.import_json_file(json_file)
+            print(f"  [INFO] Migrated {json_file.name} -> {self.state_file.name}: {counts}")
+
+    def save(self):
+        """Commit pending changes."""
+        self.store.set_meta("last_sync", datetime.now().isoformat())
+        self.store.commit()
+
+    def is_gmail_processed(self, email_id: str) -> bool:
+        """Check if email was already processed."""
+        return self.store.is_processed(KIND_EMAIL, email_id)
+
+    def mark_gmail_processed(self, email_id: str):
+        """Mark email as processed."""
+        self.store.mark_processed(KIND_EMAIL, [email_id])
+
+    def get_gmail_history_id(self) -> Optional[str]:
+        """Get Gmail historyId checkpoint from the last saved sync."""
+        return self.store.get_meta("gmail_history_id")
+
+    def update_gmail_history_id(self, history_id: Optional[str]):
+        """Update Gmail historyId checkpoint."""
+        if history_id:
+            self.store.set_meta("gmail_history_id", str(history_id))
+
+    def is_slack_processed(self, ts: str) -> bool:
+        """Check if Slack message was already processed."""
+        return self.store.is_processed(KIND_SLACK, ts)
+
+    def mark_slack_processed(self, ts: str):
+        """Mark Slack message as processed."""
+        self.store.mark_processed(KIND_SLACK, [ts])
+
+    def get_last_slack_ts(self) -> Optional[str]:
+        """Get last processed Slack timestamp."""
+        return self.store.get_meta("slack_last_ts")
+
+    def update_last_slack_ts(self, ts: str):
+        """Update last processed Slack timestamp."""
+        self.store.set_meta("slack_last_ts", ts)
+
+    def get_slack_cursor(self, channel_id: str) -> Optional[str]:
+        """Get newest fetched Slack ts for a channel (history 'oldest' cursor)."""
+        return self.store.get_meta(f"slack_cursor:{channel_id}")
+
+    def update_slack_cursor(self, channel_id: str, ts: Optional[str]):
+        """Advance a channel's Slack history cursor."""
+        current = self.get_slack_cursor(channel_id)
+        if ts and (current is None or float(ts) > float(current)):
+            self.store.set_meta(f"slack_cursor:{channel_id}", ts)
+
+    def add_pending_change(self, change: dict):
+        """Add a pending change for user review."""
+        change["detected_at"] = datetime.now().isoformat()
+        self.store.add_pending(change)
+
+    def get_pending_changes(self) -> list:
+        """Get all pending changes."""
+        return self.store.list_pending()
+
+    def clear_pending_changes(self):
+        """Clear pending changes after applying."""
+        self.store.clear_pending()
+
+    def update_vendor(self, vendor_name: str, updates: dict):
+        """Update vendor state."""
+        vendor = self.store.get_record("vendor_states", vendor_name) or {"changes_history": []}
+        vendor.setdefault("changes_history", [])
+        for key, value in updates.items():
+            if key != "changes_history":
+                old_value = vendor.get(key)
+                if old_value != value:
+                    vendor["changes_history"].append({
+                        "field": key,
+                        "old": old_value,
+                        "new": value,
+                        "changed_at": datetime.now().isoformat(),
+                    })
+                vendor[key] = value
+        self.store.put_record("vendor_states", vendor_name, vendor)
+
+    def get_vendor_state(self, vendor_name: str) -> Optional[dict]:
+        """Get current vendor state."""
+        return self.store.get_record("vendor_states", vendor_name)
+
+    def get_stats(self) -> dict:
+        """Get sync statistics."""
+        return {
+            "last_sync": self.store.get_meta("last_sync"),
+            "gmail_processed": self.store.count_processed(KIND_EMAIL),
+            "slack_processed": self.store.count_processed(KIND_SLACK),
+            "gmail_history_id": self.store.get_meta("gmail_history_id"),
+            "vendors_tracked": self.store.count_records("vendor_states"),
+            "pending_changes": self.store.count_pending(),
+        }
+
+
+def open_incremental_state(backend: str = "json") -> IncrementalSyncState:
+    """
+    Open incremental sync state.
+
+    Args:
+        backend: "json" (.slacklist_state.json) or "sqlite" (.slacklist_state.db)
+    """
+    if backend == "sqlite":
+        return SqliteIncrementalSyncState()
+    return IncrementalSyncState()
+
+
 class VendorChangeDetector:
     """Detect vendor-related changes from Gmail and Slack messages."""
 
-    # Vendor detection patterns (domain → vendor name)
-    VENDOR_DOMAINS = {
-        "brightcove": "Brightcove",
-        "megazone": "메가존클라우드",
-        "megazonecloud": "메가존클라우드",
-        "mz.co.kr": "메가존클라우드",
-        "vimeo": "Vimeo OTT",
-        "jrmax": "Vimeo OTT",  # 한국 대리점
-        "wecandeo": "맑음소프트 (WECANDEO)",
-        "malgum": "맑음소프트 (WECANDEO)",
-    }
-
     # Quote detection patterns for subject lines
     QUOTE_SUBJECT_PATTERNS = [
         "pricing proposal",
@@ -1112,46 +1535,88 @@ class VendorChangeDetector:
         "미팅", "회의", "연락", "확인", "검토", "요청", "피드백", "리마인더", "follow-up"
     ]
 
-    def __init__(self):
-        """Initialize detector with pattern cache."""
+    # Date-like content for action items (MM/DD, MM-DD)
+    ACTION_DATE_PATTERN = re.compile(r"(\d{1,2}[-/]\d{1,2}|\d{2}-\d{2})")
+
+    # Keyword categories, highest status priority first
+    CATEGORY_POSITIVE = "positive"
+    CATEGORY_NEGATIVE = "negative"
+    CATEGORY_NEUTRAL = "neutral"
+    CATEGORY_QUOTE = "quote"
+    CATEGORY_ACTION = "action"
+
+    _keyword_matcher = None
+
+    def __init__(self, resolver=None):
+        """
+        Initialize detector with pattern cache.
+
+        Args:
+            resolver: VendorResolver (default: shared resolver from wsoptv_sync_config.yaml)
+        """
         self._changes = []
+        self.resolver = resolver or get_vendor_resolver()
+
+    @classmethod
+    def get_keyword_matcher(cls) -> KeywordMatcher:
+        """Compiled matcher over all keyword tables (built once per class)."""
+        if cls.__dict__.get("_keyword_matcher") is None:
+            cls._keyword_matcher = KeywordMatcher({
+                cls.CATEGORY_POSITIVE: cls.POSITIVE_KEYWORDS,
+                cls.CATEGORY_NEGATIVE: cls.NEGATIVE_KEYWORDS,
+                cls.CATEGORY_NEUTRAL: cls.NEUTRAL_KEYWORDS,
+                cls.CATEGORY_QUOTE: cls.QUOTE_SUBJECT_PATTERNS,
+                cls.CATEGORY_ACTION: cls.ACTION_KEYWORDS,
+            })
+        return cls._keyword_matcher
+
+    def scan_keywords(self, text: str) -> list:
+        """
+        Find every status/quote/action keyword in one pass.
+
+        Args:
+            text: Message text
+
+        Returns:
+            List of KeywordHit (offsets refer to text.lower())
+        """
+        return self.get_keyword_matcher().find_all(text)
 
     def detect_vendor_from_email(self, sender: str, subject: str) -> Optional[str]:
         """Detect vendor from email sender or subject."""
-        email_domain = sender.split("@")[-1].lower() if "@" in sender else ""
-
-        for domain_key, vendor_name in self.VENDOR_DOMAINS.items():
-            if domain_key in email_domain or domain_key in subject.lower():
-                return vendor_name
-        return None
+        vendor = self.resolver.resolve(sender, subject)
+        return vendor.name if vendor else None
 
     def detect_status_change(
         self,
         text: str,
         is_vendor_email: bool = False,
+        hits: Optional[list] = None,
     ) -> Optional[tuple]:
         """
         Detect status change from text content.
 
+        Positive keywords win over negative ones; within a table the
+        first keyword in table order wins.
+
         Args:
             text: Message text to analyze
             is_vendor_email: True if this is an email FROM the vendor (not TO)
+            hits: Precomputed scan_keywords(text) result
 
         Returns:
             Tuple of (from_status, to_status, keyword, direction) or None
             direction: "positive", "negative", or None
         """
-        text_lower = text.lower()
-
-        # Check positive keywords first (higher priority)
-        for keyword, (from_status, to_status) in self.POSITIVE_KEYWORDS.items():
-            if keyword in text_lower:
-                return (from_status, to_status, keyword, "positive")
+        if hits is None:
+            hits = self.scan_keywords(text)
 
-        # Check negative keywords (requires explicit approval)
-        for keyword, (from_status, to_status) in self.NEGATIVE_KEYWORDS.items():
-            if keyword in text_lower:
-                return (from_status, to_status, keyword, "negative")
+        # Positive keywords first (higher priority), then negative (requires explicit approval)
+        hit = KeywordMatcher.first(hits, [self.CATEGORY_POSITIVE, self.CATEGORY_NEGATIVE])
+        if hit:
+            table = self.POSITIVE_KEYWORDS if hit.category == self.CATEGORY_POSITIVE else self.NEGATIVE_KEYWORDS
+            from_status, to_status = table[hit.keyword]
+            return (from_status, to_status, hit.keyword, hit.category)
 
         # If vendor sent us an email, that's a positive signal (active communication)
         # Don't suggest status decline just because neutral keywords exist
@@ -1167,6 +1632,7 @@ class VendorChangeDetector:
         body: str,
         has_attachments: bool = False,
         is_vendor_email: bool = False,
+        hits: Optional[list] = None,
     ) -> bool:
         """
         Detect quote/pricing signals from email.
@@ -1176,15 +1642,22 @@ class VendorChangeDetector:
             body: Email body text
             has_attachments: Whether email has attachments
             is_vendor_email: Whether email is from vendor
+            hits: Precomputed scan_keywords(f"{subject} {body}") result
 
         Returns:
             True if quote is detected (2+ indicators present)
         """
+        if hits is None:
+            hits = self.scan_keywords(f"{subject} {body}")
+
+        # Subject spans [0, subject_end) of the scanned text, body starts after the separator
+        subject_end = len(subject.lower())
+        quote_hits = [hit for hit in hits if hit.category == self.CATEGORY_QUOTE]
+
         indicators = 0
 
         # Indicator 1: Subject contains quote keywords
-        subject_lower = subject.lower()
-        if any(pattern in subject_lower for pattern in self.QUOTE_SUBJECT_PATTERNS):
+        if any(hit.end <= subject_end for hit in quote_hits):
             indicators += 1
 
         # Indicator 2: Has attachments (likely quote file)
@@ -1196,27 +1669,39 @@ class VendorChangeDetector:
             indicators += 1
 
         # Indicator 4: Body contains quote keywords
-        body_lower = body.lower()
-        if any(pattern in body_lower for pattern in self.QUOTE_SUBJECT_PATTERNS):
+        if any(hit.start > subject_end for hit in quote_hits):
             indicators += 1
 
         # Require 2+ indicators to avoid false positives
         return indicators >= 2
 
-    def detect_action_item(self, text: str) -> Optional[str]:
-        """Detect action item from text content."""
-        import re
+    def detect_action_item(self, text: str, hits: Optional[list] = None) -> Optional[str]:
+        """
+        Detect action item from text content.
+
+        Args:
+            text: Message text
+            hits: Precomputed scan_keywords(text) result
+
+        Returns:
+            First line with both a date and an action keyword (max 100 chars)
+        """
+        if hits is None:
+            hits = self.scan_keywords(text)
 
-        # Pattern: date-like content with action keyword
-        date_pattern = r"(\d{1,2}[-/]\d{1,2}|\d{2}-\d{2})"
-        action_pattern = "|".join(self.ACTION_KEYWORDS)
+        action_starts = sorted(hit.start for hit in hits if hit.category == self.CATEGORY_ACTION)
+        if not action_starts:
+            return None
 
-        if re.search(date_pattern, text) and re.search(action_pattern, text, re.IGNORECASE):
-            # Extract the action item portion
-            lines = text.split("\n")
-            for line in lines:
-                if re.search(date_pattern, line) and re.search(action_pattern, line, re.IGNORECASE):
+        # Lowercasing never adds/removes newlines, so lines align with hit offsets
+        offset = 0
+        for line, line_lower in zip(text.split("\n"), text.lower().split("\n")):
+            line_end = offset + len(line_lower)
+            i = bisect_right(action_starts, offset - 1)
+            if i < len(action_starts) and action_starts[i] < line_end:
+                if self.ACTION_DATE_PATTERN.search(line):
                     return line.strip()[:100]  # Limit to 100 chars
+            offset = line_end + 1
         return None
 
     def analyze_gmail_messages(self, emails: list[dict]) -> list[dict]:
@@ -1243,26 +1728,28 @@ class VendorChangeDetector:
 
             # Check if email is FROM the vendor (not TO the vendor)
             # Vendor email = positive signal (active communication)
-            sender_domain = sender.split("@")[-1].lower() if "@" in sender else ""
-            is_vendor_email = any(
-                domain_key in sender_domain
-                for domain_key in self.VENDOR_DOMAINS.keys()
-            )
+            is_vendor_email = self.resolver.resolve_address(sender) is not None
 
             change = {
                 "source": "gmail",
                 "vendor": vendor,
+                "email_id": email.get("id"),
                 "date": email.get("date"),
                 "subject": subject,
                 "is_vendor_email": is_vendor_email,
             }
 
+            # One keyword pass over subject + body feeds all detectors
+            full_text = f"{subject} {body}"
+            hits = self.scan_keywords(full_text)
+
             # Enhanced quote detection
             quote_detected = self.detect_quote_signal(
                 subject=subject,
                 body=body,
                 has_attachments=has_attachments,
                 is_vendor_email=is_vendor_email,
+                hits=hits,
             )
 
             if quote_detected:
@@ -1275,8 +1762,7 @@ class VendorChangeDetector:
                 }
 
             # Check for status change (with vendor email context)
-            full_text = f"{subject} {body}"
-            status_change = self.detect_status_change(full_text, is_vendor_email=is_vendor_email)
+            status_change = self.detect_status_change(full_text, is_vendor_email=is_vendor_email, hits=hits)
             if status_change and not quote_detected:
                 # Only apply text-based status change if quote signal didn't already detect it
                 change["status_change"] = {
@@ -1287,7 +1773,7 @@ class VendorChangeDetector:
                 }
 
             # Check for action item
-            action = self.detect_action_item(full_text)
+            action = self.detect_action_item(full_text, hits=hits)
             if action:
                 change["next_action"] = action
 
@@ -1317,25 +1803,9 @@ class VendorChangeDetector:
             else:
                 text = msg.get("text", "") if isinstance(msg, dict) else ""
 
-            # Detect vendor mentions in message
-            detected_vendor = None
-            for domain_key, vendor_name in self.VENDOR_DOMAINS.items():
-                if domain_key in text.lower() or vendor_name.lower() in text.lower():
-                    detected_vendor = vendor_name
-                    break
-
-            if not detected_vendor:
-                # Also check for vendor names in Korean
-                vendor_keywords = {
-                    "메가존": "메가존클라우드",
-                    "브라이트코브": "Brightcove",
-                    "비메오": "Vimeo OTT",
-                    "맑음소프트": "맑음소프트 (WECANDEO)",
-                }
-                for keyword, vendor_name in vendor_keywords.items():
-                    if keyword in text:
-                        detected_vendor = vendor_name
-                        break
+            # Detect vendor mentions in message (names + config keywords)
+            vendor = self.resolver.resolve_text(text)
+            detected_vendor = vendor.name if vendor else None
 
             if not detected_vendor:
                 continue
@@ -1351,7 +1821,8 @@ class VendorChangeDetector:
             }
 
             # Check for status change (Slack messages are internal, not vendor emails)
-            status_change = self.detect_status_change(text, is_vendor_email=False)
+            hits = self.scan_keywords(text)
+            status_change = self.detect_status_change(text, is_vendor_email=False, hits=hits)
             if status_change:
                 change["status_change"] = {
                     "from": status_change[0],
@@ -1361,7 +1832,7 @@ class VendorChangeDetector:
                 }
 
             # Check for action item
-            action = self.detect_action_item(text)
+            action = self.detect_action_item(text, hits=hits)
             if action:
                 change["next_action"] = action
 
@@ -1421,12 +1892,149 @@ class VendorChangeDetector:
         return merged
 
 
+# Gmail history에서 제외할 라벨 (임시보관/스팸)
+HISTORY_SKIP_LABELS = {"DRAFT", "SPAM", "TRASH"}
+
+# History 메시지 범위 (windowed search와 동일: wsoptv 라벨 또는 업체/키워드)
+HISTORY_SCOPE_LABEL = "wsoptv"
+HISTORY_SCOPE_PATTERN = re.compile(r"\b(?:wsoptv|wsop|rfp|ott)\b|스트리밍", re.IGNORECASE)
+
+
+def _get_gmail_history_id(gmail_client) -> Optional[str]:
+    """Get current mailbox historyId from Gmail profile."""
+    try:
+        profile = get_api_scheduler().call("gmail", "users.getProfile", gmail_client.get_profile)
+    except Exception:
+        return None
+    history_id = profile.get("historyId") if isinstance(profile, dict) else None
+    return str(history_id) if history_id else None
+
+
+def _get_gmail_label_id(gmail_client, name: str) -> Optional[str]:
+    """Gmail label ID for a label name (case-insensitive), or None."""
+    request = gmail_client.service.users().labels().list(userId="me")
+    response = get_api_scheduler().call("gmail", "labels.list", request.execute)
+    for label in response.get("labels", []):
+        if label.get("name", "").lower() == name.lower():
+            return label.get("id")
+    return None
+
+
+def _is_not_found(error) -> bool:
+    """Whether a Gmail API error is a 404 (message deleted since the history entry)."""
+    status = getattr(getattr(error, "resp", None), "status", None) or getattr(error, "status_code", None)
+    try:
+        return int(status) == 404
+    except (TypeError, ValueError):
+        return False
+
+
+def _filter_history_scope(
+    gmail_client, message_ids: list[str]
+) -> Optional[tuple[list[str], dict[str, Exception]]]:
+    """
+    Keep history message IDs that the windowed search would have found.
+
+    Fetches metadata (labels, From, Subject, snippet) in batches and keeps
+    messages carrying the wsoptv label, sent by a configured vendor, or
+    mentioning a vendor / WSOPTV keyword.
+
+    Returns:
+        (scoped message IDs in history order, fetch errors other than 404
+        by ID), or None if batched metadata fetches are unavailable and the
+        caller should fall back to search
+    """
+    if GmailBatchFetcher is None:
+        return None
+    if not message_ids:
+        return [], {}
+
+    try:
+        label_id = _get_gmail_label_id(gmail_client, HISTORY_SCOPE_LABEL)
+    except Exception:
+        label_id = None
+    resolver = get_vendor_resolver()
+    raw_messages, errors = GmailBatchFetcher(gmail_client).get_messages(
+        message_ids, format="metadata", metadata_headers=("From", "Subject")
+    )
+    # 404 = deleted between history and fetch; anything else (429/5xx/batch failure) must be retried
+    failed = {i: e for i, e in errors.items() if not _is_not_found(e)}
+
+    scoped = []
+    for message_id in message_ids:
+        raw = raw_messages.get(message_id)
+        if raw is None:
+            continue
+        if label_id and label_id in raw.get("labelIds", []):
+            scoped.append(message_id)
+            continue
+        sender = GmailBatchFetcher.get_header(raw, "From")
+        text = f"{GmailBatchFetcher.get_header(raw, 'Subject')} {raw.get('snippet', '')}"
+        if HISTORY_SCOPE_PATTERN.search(text) or resolver.resolve(sender, text):
+            scoped.append(message_id)
+    return scoped, failed
+
+
+def _fetch_gmail_history(gmail_client, start_history_id: str) -> Optional[tuple[list[str], str]]:
+    """
+    Fetch message IDs added since a historyId checkpoint.
+
+    Args:
+        gmail_client: GmailClient instance
+        start_history_id: historyId saved by the previous sync
+
+    Returns:
+        (message_ids, latest_history_id), or None if the cursor expired
+        and the caller should fall back to the date-windowed search
+    """
+    service = gmail_client.service
+    message_ids = []
+    seen = set()
+    latest_history_id = start_history_id
+    page_token = None
+
+    while True:
+        try:
+            request = service.users().history().list(
+                userId="me",
+                startHistoryId=start_history_id,
+                historyTypes=["messageAdded"],
+                pageToken=page_token,
+            )
+            response = get_api_scheduler().call("gmail", "history.list", request.execute)
+        except Exception as e:
+            # 404 = historyId가 만료됨 (보존 기간 초과)
+            if getattr(getattr(e, "resp", None), "status", None) == 404:
+                return None
+            raise
+
+        for record in response.get("history", []):
+            for added in record.get("messagesAdded", []):
+                message = added.get("message", {})
+                message_id = message.get("id")
+                if not message_id or message_id in seen:
+                    continue
+                if HISTORY_SKIP_LABELS.intersection(message.get("labelIds", [])):
+                    continue
+                seen.add(message_id)
+                message_ids.append(message_id)
+
+        latest_history_id = str(response.get("historyId") or latest_history_id)
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            break
+
+    return message_ids, latest_history_id
+
+
 def intelligent_update_slacklist(
     days: int = 7,
     dry_run: bool = False,
     auto_approve: bool = False,
     vendor_filter: Optional[str] = None,
     incremental: bool = True,
+    state_backend: str = "json",
+    full_tables: bool = False,
 ) -> dict:
     """
     Intelligently update Slack Lists based on Gmail and Slack message analysis.
@@ -1439,6 +2047,8 @@ def intelligent_update_slacklist(
         auto_approve: If True, apply changes without confirmation
         vendor_filter: Filter to specific vendor
         incremental: If True, only process new messages since last sync
+        state_backend: "json" or "sqlite" incremental state store
+        full_tables: Extract PDF tables from every page (default: price pages only)
 
     Returns:
         Dict with update results
@@ -1446,11 +2056,8 @@ def intelligent_update_slacklist(
     import sys
     sys.path.insert(0, str(Path(__file__).parents[2]))
 
-    from lib.gmail import GmailClient
-    from lib.slack import SlackClient
-
     # Load incremental state
-    sync_state = IncrementalSyncState()
+    sync_state = open_incremental_state(state_backend)
     stats = sync_state.get_stats()
 
     print(f"\n{'='*60}")
@@ -1476,43 +2083,85 @@ def intelligent_update_slacklist(
     # Step 1: Collect data
     print("\n[Step 1] Collecting data...")
 
-    # Gmail - search with multiple strategies to find vendor emails
+    # Gmail - history cursor (incremental) or multi-strategy search
     gmail_client = None
     try:
-        gmail_client = GmailClient()
-        from datetime import datetime, timedelta
+        gmail_client = get_gmail_client()
         after_date = (datetime.now() - timedelta(days=days)).strftime("%Y/%m/%d")
 
-        # Strategy 1: Label-based search (if label exists)
-        labeled_emails = gmail_client.list_emails(
-            query=f"label:wsoptv after:{after_date}",
-            max_results=100,
-        )
+        # Strategy 0: History API cursor - fetch only messages added since last sync
+        all_emails = None
+        start_history_id = sync_state.get_gmail_history_id() if incremental else None
+        if start_history_id:
+            history = _fetch_gmail_history(gmail_client, start_history_id)
+            if history is None:
+                print("  [INFO] Gmail history cursor expired, falling back to search")
+            else:
+                message_ids, latest_history_id = history
+                new_ids = [i for i in message_ids if not sync_state.is_gmail_processed(i)]
+                scope = _filter_history_scope(gmail_client, new_ids)
+                if scope is None:
+                    print("  [INFO] Gmail batch fetcher unavailable, falling back to search")
+                else:
+                    scoped_ids, failed = scope
+                    all_emails = []
+                    for message_id in scoped_ids:
+                        try:
+                            all_emails.append(
+                                get_api_scheduler().call("gmail", "messages.get", gmail_client.get_email, message_id)
+                            )
+                        except Exception as e:
+                            if not _is_not_found(e):  # 404 = deleted between history and fetch
+                                failed[message_id] = e
+                    print(
+                        f"  [INFO] Gmail history: {len(message_ids)} added since cursor {start_history_id}, "
+                        f"{len(scoped_ids)} in scope"
+                    )
+                    if failed:
+                        # Keep the cursor so the next run re-reads these; fetched ones are skipped as processed
+                        print(f"  [WARN] Gmail history: {len(failed)} message(s) failed to fetch, cursor not advanced")
+                    else:
+                        sync_state.update_gmail_history_id(latest_history_id)
+
+        if all_emails is None:
+            # Checkpoint before searching so nothing arriving mid-search is missed
+            sync_state.update_gmail_history_id(_get_gmail_history_id(gmail_client))
+
+            # Strategy 1: Label-based search (if label exists)
+            labeled_emails = get_api_scheduler().call(
+                "gmail",
+                "messages.list",
+                gmail_client.list_emails,
+                query=f"label:wsoptv after:{after_date}",
+                max_results=100,
+            )
 
-        # Strategy 2: Keyword-based search (catches unlabeled emails)
-        keyword_queries = [
-            f"(WSOPTV OR WSOP) after:{after_date}",
-            f"(from:brightcove OR from:megazone OR from:vimeo) after:{after_date}",
-            f"(RFP OR OTT OR 스트리밍) after:{after_date}",
-        ]
+            # Strategy 2: Keyword-based search (catches unlabeled emails)
+            keyword_queries = [
+                f"(WSOPTV OR WSOP) after:{after_date}",
+                f"(from:brightcove OR from:megazone OR from:vimeo) after:{after_date}",
+                f"(RFP OR OTT OR 스트리밍) after:{after_date}",
+            ]
 
-        keyword_emails = []
-        seen_ids = {getattr(e, "id", None) or getattr(e, "message_id", "") for e in labeled_emails}
+            keyword_emails = []
+            seen_ids = {getattr(e, "id", None) or getattr(e, "message_id", "") for e in labeled_emails}
 
-        for kw_query in keyword_queries:
-            try:
-                kw_results = gmail_client.list_emails(query=kw_query, max_results=50)
-                for email in kw_results:
-                    email_id = getattr(email, "id", None) or getattr(email, "message_id", "")
-                    if email_id and email_id not in seen_ids:
-                        keyword_emails.append(email)
-                        seen_ids.add(email_id)
-            except Exception:
-                pass  # Continue with other queries if one fails
+            for kw_query in keyword_queries:
+                try:
+                    kw_results = get_api_scheduler().call(
+                        "gmail", "messages.list", gmail_client.list_emails, query=kw_query, max_results=50
+                    )
+                    for email in kw_results:
+                        email_id = getattr(email, "id", None) or getattr(email, "message_id", "")
+                        if email_id and email_id not in seen_ids:
+                            keyword_emails.append(email)
+                            seen_ids.add(email_id)
+                except Exception:
+                    pass  # Continue with other queries if one fails
 
-        all_emails = list(labeled_emails) + keyword_emails
-        if keyword_emails:
-            print(f"  [INFO] Found {len(keyword_emails)} unlabeled emails via keyword search")
+            all_emails = list(labeled_emails) + keyword_emails
+            if keyword_emails:
+                print(f"  [INFO] Found {len(keyword_emails)} unlabeled emails via keyword search")
 
         # Filter out already processed emails in incremental mode
         if incremental:
@@ -1534,11 +2183,17 @@ def intelligent_update_slacklist(
 
     # Slack
     try:
-        slack_client = SlackClient()
-        all_slack_messages = slack_client.get_history(
-            channel=LISTS_CONFIG["channel_id"],
-            limit=200,
-        )
+        slack_client = get_slack_client()
+        channel_id = LISTS_CONFIG["channel_id"]
+
+        # Page forward from the channel cursor (incremental) or the day window
+        oldest = to_slack_ts(datetime.now() - timedelta(days=days))
+        cursor = sync_state.get_slack_cursor(channel_id) if incremental else None
+        if cursor and float(cursor) > float(oldest):
+            oldest = cursor
+        all_slack_messages = fetch_history(slack_client, channel_id, oldest=oldest)
+        if incremental:
+            sync_state.update_slack_cursor(channel_id, newest_ts(all_slack_messages))
 
         # Filter out already processed messages in incremental mode
         if incremental:
@@ -1559,6 +2214,7 @@ def intelligent_update_slacklist(
         slack_messages = []
 
     # Current Slack Lists
+    manager = None
     try:
         manager = ListsSyncManager()
         current_items = manager.get_list_items()
@@ -1620,6 +2276,9 @@ def intelligent_update_slacklist(
 
     if not merged:
         print("\n[OK] No changes detected")
+        # Advance processed IDs / history cursor even when nothing changed
+        if incremental and not dry_run:
+            sync_state.save()
         return results
 
     # Step 2.5: Analyze quote attachments
@@ -1631,7 +2290,7 @@ def intelligent_update_slacklist(
     if has_quote_changes and AttachmentDownloader is not None:
         print("\n[Step 2.5] Analyzing quote attachments...")
         try:
-            analyzer = QuoteAnalyzer(gmail_client=gmail_client)
+            analyzer = QuoteAnalyzer(gmail_client=gmail_client, full_tables=full_tables)
             quote_analysis = analyzer.analyze_quote_emails(
                 gmail_formatted, gmail_changes
             )
@@ -1751,6 +2410,49 @@ def intelligent_update_slacklist(
 
     results["changes_detected"] = updates
 
+    if manager is None:
+        # Lists client failed in Step 1 - nothing to diff against or write to (state not saved)
+        print("\n[SKIP] Slack Lists unavailable - Changes NOT applied")
+        return results
+
+    # Diff against the current list: only changed cells are written, in one batched call
+    write_updates = []
+    for update in updates:
+        fields = update["fields"]
+
+        # Parse last_contact date if present
+        last_contact_dt = None
+        if fields.get("last_contact"):
+            lc = fields["last_contact"]
+            if isinstance(lc, datetime):
+                last_contact_dt = lc
+            elif isinstance(lc, str):
+                try:
+                    from dateutil.parser import parse
+                    last_contact_dt = parse(lc)
+                except Exception:
+                    pass
+
+        write_updates.append({
+            "vendor_name": update["vendor"],
+            "quote": fields.get("quote"),
+            "next_action": fields.get("next_action"),
+            "last_contact": last_contact_dt,
+        })
+
+    plan = manager.plan_updates(write_updates, snapshot=current_items)
+    results["write_plan"] = {
+        "rows_touched": plan.rows_touched,
+        "rows_skipped": plan.rows_skipped,
+        "cells": len(plan.cells),
+    }
+    print(f"\n[Plan] {plan}")
+    for vendor in plan.skipped:
+        print(f"  [SKIP] {vendor}: already up to date")
+    for vendor in plan.unknown:
+        print(f"  [ERR] {vendor}: Unknown vendor")
+        results["errors"].append(f"{vendor}: Unknown vendor")
+
     if dry_run:
         print("\n[DRY RUN] Changes NOT applied")
         return results
@@ -1762,38 +2464,17 @@ def intelligent_update_slacklist(
 
     print("\n[Step 4] Applying updates...")
 
-    for update in updates:
-        vendor = update["vendor"]
-        fields = update["fields"]
-
-        try:
-            # Parse last_contact date if present
-            last_contact_dt = None
-            if fields.get("last_contact"):
-                lc = fields["last_contact"]
-                if isinstance(lc, datetime):
-                    last_contact_dt = lc
-                elif isinstance(lc, str):
-                    try:
-                        from dateutil.parser import parse
-                        last_contact_dt = parse(lc)
-                    except Exception:
-                        pass
-
-            success = manager.update_item(
-                vendor_name=vendor,
-                quote=fields.get("quote"),
-                next_action=fields.get("next_action"),
-                last_contact=last_contact_dt,
-            )
-            if success:
-                results["changes_applied"].append(update)
-                print(f"  [OK] {vendor} updated")
-            else:
-                print(f"  [FAIL] {vendor} update failed")
-        except Exception as e:
-            print(f"  [ERR] {vendor}: {e}")
-            results["errors"].append(f"{vendor}: {e}")
+    try:
+        if manager.apply_plan(plan):
+            for update in updates:
+                if update["vendor"] in plan.touched:
+                    results["changes_applied"].append(update)
+                    print(f"  [OK] {update['vendor']} updated")
+        else:
+            print(f"  [FAIL] Update failed ({', '.join(plan.touched)})")
+    except Exception as e:
+        print(f"  [ERR] Update: {e}")
+        results["errors"].append(f"Update: {e}")
 
     # Step 5: Update summary
     print("\n[Step 5] Updating summary message...")
@@ -1812,7 +2493,7 @@ def intelligent_update_slacklist(
     # Save incremental state
     if incremental and not dry_run:
         sync_state.save()
-        print("\n[Step 6] State saved to .slacklist_state.json")
+        print(f"\n[Step 6] State saved to {sync_state.state_file.name}")
 
     print(f"\n{'='*60}")
     print("[DONE] Complete")
@@ -1821,11 +2502,97 @@ def intelligent_update_slacklist(
     print(f"  Applied: {len(results['changes_applied'])} changes")
     if results["errors"]:
         print(f"  Errors: {len(results['errors'])}")
+    throttled = get_api_scheduler().summary()
+    if throttled:
+        print("  Rate limits:")
+        for line in throttled.splitlines():
+            print(f"    - {line}")
     print(f"{'='*60}\n")
 
     return results
 
 
+def _run_tests() -> bool:
+    """인라인 테스트 - ListsSyncManager 쓰기 계획 (API 호출 없음)."""
+    passed = 0
+    failed = 0
+
+    def _assert(test_name, condition, detail=""):
+        nonlocal passed, failed
+        if condition:
+            print(f"  PASS: {test_name}")
+            passed += 1
+        else:
+            print(f"  FAIL: {test_name} - {detail}")
+            failed += 1
+
+    calls = []
+
+    class FakeResponse:
+        data = {"ok": True}
+
+    class FakeWebClient:
+        def api_call(self, method, json=None):
+            calls.append((method, len(json["cells"])))
+            return FakeResponse()
+
+    class FakeUserClient:
+        _client = FakeWebClient()
+
+    manager = ListsSyncManager.__new__(ListsSyncManager)  # 클라이언트 생성 없이
+    manager.user_client = FakeUserClient()
+
+    items = LISTS_CONFIG["items"]
+    snapshot = [
+        {"row_id": items["Brightcove"], "vendor_name": "Brightcove", "status": "협상 중", "quote": "$10K",
+         "last_contact": datetime(2026, 1, 2), "next_action": "견적 검토", "notes": ""},
+        {"row_id": items["Vimeo OTT"], "vendor_name": "Vimeo OTT", "status": "검토 중", "quote": "",
+         "last_contact": None, "next_action": "", "notes": ""},
+        {"row_id": "RecSNAPSHOTONLY", "vendor_name": "신규업체", "status": "", "quote": "",
+         "last_contact": None, "next_action": "", "notes": ""},
+    ]
+
+    print("=== ListsSyncManager Plan Tests ===\n")
+
+    print("[Test 1] 변경 없는 행 skip / 변경 셀만 touch / unknown")
+    plan = manager.plan_updates([
+        {"vendor_name": "Brightcove", "status": "협상 중", "quote": "$10K ",
+         "last_contact": datetime(2026, 1, 2, 15, 30), "next_action": "견적 검토"},
+        {"vendor_name": "Vimeo OTT", "status": "검토 중", "quote": "$42.5K", "next_action": None},
+        {"vendor_name": "신규업체", "notes": "첫 연락"},
+        {"vendor_name": "없는업체", "quote": "$1"},
+    ], snapshot=snapshot)
+    _assert("Brightcove skip", plan.skipped == ["Brightcove"], f"실제: {plan.skipped}")
+    _assert("Vimeo quote만 touch", plan.touched.get("Vimeo OTT") == {"quote": "$42.5K"}, f"실제: {plan.touched}")
+    _assert("스냅샷 row_id 사용", any(c["row_id"] == "RecSNAPSHOTONLY" for c in plan.cells), f"실제: {plan.cells}")
+    _assert("unknown 보고", plan.unknown == ["없는업체"], f"실제: {plan.unknown}")
+    _assert("집계", (plan.rows_touched, plan.rows_skipped, len(plan.cells)) == (2, 1, 2), f"실제: {plan}")
+
+    print("\n[Test 2] 스냅샷 없으면 전체 필드 쓰기 (update_item 동작)")
+    plan = manager.plan_updates([{"vendor_name": "Brightcove", "status": "협상 중", "quote": "$10K"}])
+    _assert("2셀", len(plan.cells) == 2, f"실제: {plan.cells}")
+    _assert("select 배열", plan.cells[0].get("select") == [LISTS_CONFIG["status_options"]["협상 중"]], f"실제: {plan.cells[0]}")
+    plan = manager.plan_updates([{"vendor_name": "Brightcove", "status": "없는상태"}])
+    _assert("미정의 상태 무시", not plan.cells and plan.skipped == ["Brightcove"], f"실제: {plan}")
+
+    print("\n[Test 3] MAX_CELLS_PER_UPDATE 초과 시 분할")
+    plan = manager.plan_updates([
+        {"vendor_name": name, "quote": "q", "next_action": "a", "notes": "n"} for name in items
+    ])
+    manager.MAX_CELLS_PER_UPDATE = 5
+    calls.clear()
+    ok = manager.apply_plan(plan)
+    _assert("성공", ok)
+    _assert("12셀 → 5/5/2", [n for _, n in calls] == [5, 5, 2], f"실제: {calls}")
+
+    print("\n[Test 4] 빈 계획은 호출 없음")
+    calls.clear()
+    _assert("호출 0회", manager.apply_plan(ListsWritePlan()) and not calls, f"실제: {calls}")
+
+    print(f"\n=== Results: {passed}/{passed + failed} passed ===")
+    return failed == 0
+
+
 def main():
     """CLI entry point."""
     import argparse
@@ -1879,16 +2646,36 @@ def main():
         action="store_true",
         help="Show sync state status",
     )
+    parser.add_argument(
+        "--state-backend",
+        choices=["json", "sqlite"],
+        default="json",
+        help="Incremental state store (sqlite imports the JSON state on first use)",
+    )
+    parser.add_argument(
+        "--full-tables",
+        action="store_true",
+        help="Extract PDF tables from every page (default: pages with amounts/total keywords only)",
+    )
+
+    parser.add_argument(
+        "--test",
+        action="store_true",
+        help="Run inline self-tests (no API calls)",
+    )
 
     args = parser.parse_args()
 
-    if args.status:
-        state = IncrementalSyncState()
+    if args.test:
+        sys.exit(0 if _run_tests() else 1)
+    elif args.status:
+        state = open_incremental_state(args.state_backend)
         stats = state.get_stats()
         print("\n[SYNC STATE]")
         print(f"  Last sync: {stats['last_sync'] or 'Never'}")
         print(f"  Gmail processed: {stats['gmail_processed']}")
         print(f"  Slack processed: {stats['slack_processed']}")
+        print(f"  Gmail history cursor: {stats['gmail_history_id'] or 'None'}")
         print(f"  Vendors tracked: {stats['vendors_tracked']}")
         print(f"  Pending changes: {stats['pending_changes']}")
     elif args.intelligent_update:
@@ -1898,6 +2685,8 @@ def main():
             auto_approve=args.yes,
             vendor_filter=args.vendor,
             incremental=not args.full,
+            state_backend=args.state_backend,
+            full_tables=args.full_tables,
         )
     elif args.post_summary:
         post_daily_summary(dry_run=args.dry_run)
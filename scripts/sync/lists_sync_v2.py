@@ -16,10 +16,14 @@ Usage:
 
 import json
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import typer
 from rich.console import Console
@@ -40,7 +44,6 @@ sys.path.insert(0, str(_script_dir))
 
 # Core imports
 from lib.gmail import GmailClient
-from lib.slack import SlackClient
 
 # Handle imports for both direct run and module run
 try:
@@ -58,10 +61,15 @@ try:
     from .analyzers.thread_analyzer import ThreadAnalyzer
     from .analyzers.status_inferencer import StatusInferencer
     from .collectors.attachment_downloader import AttachmentDownloader
+    from .collectors.attachment_filter import AttachmentFilter
     from .parsers.pdf_parser import PDFParser, get_pdf_parser
     from .parsers.excel_parser import ExcelParser, get_excel_parser
+    from .parsers.parse_cache import ParseCache
+    from .parsers.parse_executor import ParseExecutor, parse_excel, parse_pdf
     from .extractors.quote_extractor import QuoteExtractor, get_quote_extractor
-    from .lists_sync import ListsSyncManager, LISTS_CONFIG
+    from .lists_sync import ListsSyncManager, ListsWritePlan, LISTS_CONFIG
+    from .state_store import SqliteStateStore, is_sqlite_path, KIND_EMAIL, KIND_THREAD
+    from .client_registry import get_api_scheduler, get_gmail_client
 except ImportError:
     # When run directly
     from config_models import ProjectConfig
@@ -77,10 +85,15 @@ except ImportError:
     from analyzers.thread_analyzer import ThreadAnalyzer
     from analyzers.status_inferencer import StatusInferencer
     from collectors.attachment_downloader import AttachmentDownloader
+    from collectors.attachment_filter import AttachmentFilter
     from parsers.pdf_parser import PDFParser, get_pdf_parser
     from parsers.excel_parser import ExcelParser, get_excel_parser
+    from parsers.parse_cache import ParseCache
+    from parsers.parse_executor import ParseExecutor, parse_excel, parse_pdf
     from extractors.quote_extractor import QuoteExtractor, get_quote_extractor
-    from lists_sync import ListsSyncManager, LISTS_CONFIG
+    from lists_sync import ListsSyncManager, ListsWritePlan, LISTS_CONFIG
+    from state_store import SqliteStateStore, is_sqlite_path, KIND_EMAIL, KIND_THREAD
+    from client_registry import get_api_scheduler, get_gmail_client
 
 # CLI app
 app = typer.Typer(help="Slack Lists Sync v2 - 4-Layer Pipeline")
@@ -196,6 +209,97 @@ class SyncStateV2:
         }
 
 
+class SqliteSyncStateV2(SyncStateV2):
+    """
+    SQLite-backed SyncStateV2.
+
+    Processed IDs live in an indexed table (no 1000/500 truncation) and
+    changes are committed in one transaction on save().
+    """
+
+    def __init__(self, state_file: Path):
+        """Open database, importing the sibling JSON state on first use."""
+        self.state_file = state_file
+        self.store = SqliteStateStore(state_file)
+
+        json_file = state_file.with_suffix(".json")
+        is_new = self.store.get_meta("last_sync") is None and self.store.get_meta("migrated_from") is None
+        if is_new and json_file.exists():
+            counts = self.store.import_json_file(json_file)
+            console.print(f"[dim]Migrated {json_file.name} -> {state_file.name}: {counts}[/dim]")
+
+    def save(self):
+        """Commit pending changes."""
+        self.store.set_meta("last_sync", datetime.now().isoformat())
+        self.store.commit()
+
+    def is_email_processed(self, email_id: str) -> bool:
+        """Check if email was already processed."""
+        return self.store.is_processed(KIND_EMAIL, email_id)
+
+    def mark_email_processed(self, email_id: str):
+        """Mark email as processed."""
+        self.store.mark_processed(KIND_EMAIL, [email_id])
+
+    def is_thread_processed(self, thread_id: str) -> bool:
+        """Check if thread was already processed."""
+        return self.store.is_processed(KIND_THREAD, thread_id)
+
+    def mark_thread_processed(self, thread_id: str):
+        """Mark thread as processed."""
+        self.store.mark_processed(KIND_THREAD, [thread_id])
+
+    def get_vendor_state(self, vendor_name: str) -> Optional[dict]:
+        """Get stored vendor state."""
+        return self.store.get_record("vendor_states", vendor_name)
+
+    def update_vendor_state(self, vendor_name: str, data: dict):
+        """Update vendor state."""
+        current = self.store.get_record("vendor_states", vendor_name) or {}
+        current.update(data)
+        current["updated_at"] = datetime.now().isoformat()
+        self.store.put_record("vendor_states", vendor_name, current)
+
+    def add_quote(self, vendor_name: str, quote_data: dict):
+        """Add or update vendor quote."""
+        self.store.put_record("quotes", vendor_name, quote_data)
+
+    def get_quote(self, vendor_name: str) -> Optional[dict]:
+        """Get vendor quote."""
+        return self.store.get_record("quotes", vendor_name)
+
+    def add_pending_transition(self, transition: dict):
+        """Add pending status transition for review."""
+        transition["detected_at"] = datetime.now().isoformat()
+        self.store.add_pending(transition)
+
+    def get_pending_transitions(self) -> List[dict]:
+        """Get all pending transitions."""
+        return self.store.list_pending()
+
+    def clear_pending_transitions(self):
+        """Clear pending transitions after applying."""
+        self.store.clear_pending()
+
+    def get_stats(self) -> dict:
+        """Get sync statistics."""
+        return {
+            "last_sync": self.store.get_meta("last_sync"),
+            "processed_emails": self.store.count_processed(KIND_EMAIL),
+            "processed_threads": self.store.count_processed(KIND_THREAD),
+            "vendors_tracked": self.store.count_records("vendor_states"),
+            "quotes_stored": self.store.count_records("quotes"),
+            "pending_transitions": self.store.count_pending(),
+        }
+
+
+def open_sync_state(state_file: Path) -> SyncStateV2:
+    """Open sync state, using SQLite for .db/.sqlite paths and JSON otherwise."""
+    if is_sqlite_path(state_file):
+        return SqliteSyncStateV2(state_file)
+    return SyncStateV2(state_file)
+
+
 # =============================================================================
 # Quote Aggregator (Layer 3)
 # =============================================================================
@@ -203,39 +307,67 @@ class SyncStateV2:
 class QuoteAggregator:
     """Aggregate quotes from multiple sources."""
 
-    def __init__(self, config: ProjectConfig):
-        """Initialize with config."""
+    def __init__(self, config: ProjectConfig, full_tables: bool = False):
+        """
+        Initialize with config.
+
+        Args:
+            config: Project configuration
+            full_tables: Extract PDF tables from every page (default: price pages only)
+        """
         self.config = config
-        self.pdf_parser = get_pdf_parser()
+        self.full_tables = full_tables
+        self.pdf_parser = PDFParser(full_tables=True) if full_tables else get_pdf_parser()
         self.excel_parser = get_excel_parser()
         self.quote_extractor = get_quote_extractor()
+        self.parse_cache = ParseCache(config.attachments_dir)
+        self.parse_executor = ParseExecutor(
+            max_workers=config.parse_workers,
+            timeout=config.parse_timeout_sec,
+            memory_limit_mb=config.parse_memory_limit_mb,
+        )
 
     def aggregate_from_attachments(
         self,
         attachments: List[Attachment],
         vendor_name: str,
+        errors: Optional[List[str]] = None,
     ) -> VendorQuote:
         """
         Aggregate quote data from attachments.
 
+        Files missing from the parse cache are parsed in worker processes
+        first (per-file timeout, memory cap, crash isolation).
+
         Args:
             attachments: List of downloaded attachments
             vendor_name: Vendor name for the quote
+            errors: Optional list to collect per-file parse errors
 
         Returns:
             VendorQuote with all extracted options
         """
         all_options: List[QuoteOption] = []
 
-        for att in attachments:
-            if not att.local_path or not Path(att.local_path).exists():
-                continue
+        local = [
+            att for att in attachments
+            if att.local_path and Path(att.local_path).exists()
+        ]
+        parse_errors = self._parse_in_workers(local)
 
-            try:
-                options = self._extract_from_attachment(att)
-                all_options.extend(options)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to parse {att.filename}: {e}[/yellow]")
+        for att in local:
+            error = parse_errors.get(Path(att.local_path))
+            if error is None:
+                try:
+                    options = self._extract_from_attachment(att)
+                    all_options.extend(options)
+                    continue
+                except Exception as e:
+                    error = str(e)
+
+            console.print(f"[yellow]Warning: Failed to parse {att.filename}: {error}[/yellow]")
+            if errors is not None:
+                errors.append(f"Parse error ({att.filename}): {error}")
 
         # Deduplicate by amount
         unique_options = self._deduplicate_options(all_options)
@@ -246,40 +378,72 @@ class QuoteAggregator:
             received_date=datetime.now() if unique_options else None,
         )
 
+    def _parse_in_workers(self, attachments: List[Attachment]) -> Dict[Path, str]:
+        """Pre-parse uncached PDF/Excel files in worker processes."""
+        jobs = []
+        for att in attachments:
+            path = Path(att.local_path)
+            if att.file_type == "pdf":
+                jobs.append((
+                    path,
+                    "pdf",
+                    self.pdf_parser.cache_version,
+                    partial(parse_pdf, full_tables=self.full_tables),
+                ))
+            elif att.file_type == "excel":
+                jobs.append((path, "excel", self.excel_parser.VERSION, parse_excel))
+
+        return self.parse_executor.warm_cache(self.parse_cache, jobs)
+
     def _extract_from_attachment(self, att: Attachment) -> List[QuoteOption]:
-        """Extract quotes from a single attachment."""
+        """Extract quotes from a single attachment (cached by content hash)."""
         path = Path(att.local_path)
+        version = ":".join((
+            self.pdf_parser.cache_version,
+            self.excel_parser.VERSION,
+            self.quote_extractor.VERSION,
+        ))
+
+        if att.file_type in ("pdf", "excel"):
+            options = self.parse_cache.get_or_compute(
+                path,
+                f"quote_options:{att.file_type}",
+                version,
+                lambda: self._parse_options(path, att.file_type),
+            )
+        else:
+            options = []
+
+        # source_file is per attachment, not per content
+        for opt in options:
+            opt.source_file = att.filename
+
+        # Update attachment parse status
+        att.parsed = True
+        att.parse_result = {"options_found": len(options)}
+
+        return options
+
+    def _parse_options(self, path: Path, file_type: str) -> List[QuoteOption]:
+        """Parse a PDF/Excel file and extract quote options."""
         options = []
 
-        if att.file_type == "pdf":
+        if file_type == "pdf":
             # Extract from PDF
-            pdf_data = self.pdf_parser.extract_all(path)
+            pdf_data = self.parse_cache.cached_pdf(self.pdf_parser, path)
 
             # Try tables first (more structured)
             for table in pdf_data.get("tables", []):
-                table_opts = self.quote_extractor.extract_from_table(table)
-                for opt in table_opts:
-                    opt.source_file = att.filename
-                options.extend(table_opts)
+                options.extend(self.quote_extractor.extract_from_table(table))
 
             # Fallback to text
             if not options:
-                text_opts = self.quote_extractor.extract_from_text(pdf_data.get("text", ""))
-                for opt in text_opts:
-                    opt.source_file = att.filename
-                options.extend(text_opts)
+                options.extend(self.quote_extractor.extract_from_text(pdf_data.get("text", "")))
 
-        elif att.file_type == "excel":
+        elif file_type == "excel":
             # Extract from Excel
-            sheets = self.excel_parser.parse(path)
-            excel_opts = self.quote_extractor.extract_from_excel(sheets)
-            for opt in excel_opts:
-                opt.source_file = att.filename
-            options.extend(excel_opts)
-
-        # Update attachment parse status
-        att.parsed = True
-        att.parse_result = {"options_found": len(options)}
+            sheets = self.parse_cache.cached_excel(self.excel_parser, path)
+            options.extend(self.quote_extractor.extract_from_excel(sheets))
 
         return options
 
@@ -308,6 +472,47 @@ class SlackListsWriter:
         """Initialize with config."""
         self.config = config
         self.manager = ListsSyncManager()
+        self._snapshot: Optional[List[dict]] = None
+        self._lock = threading.Lock()
+
+    def _get_snapshot(self) -> Optional[List[dict]]:
+        """Current list rows (fetched once per writer; None if unavailable)."""
+        if self._snapshot is None:
+            try:
+                self._snapshot = self.manager.get_list_items()
+            except Exception as e:
+                console.print(f"[yellow]Warning: List snapshot unavailable, writing all fields: {e}[/yellow]")
+                return None
+        return self._snapshot
+
+    def _vendor_update(self, vendor_state: VendorState) -> dict:
+        """update_item field kwargs for a vendor state."""
+        quote_text = vendor_state.quote_summary
+        return {
+            "vendor_name": vendor_state.vendor_name,
+            "status": self._map_status(vendor_state.status),
+            "quote": quote_text if quote_text != "미수령" else None,
+            "last_contact": vendor_state.last_contact,
+            "next_action": vendor_state.next_action,
+        }
+
+    def _apply(self, plan: ListsWritePlan) -> bool:
+        """Apply a plan and fold the written values into the snapshot."""
+        success = self.manager.apply_plan(plan)
+        if success and self._snapshot is not None:
+            by_name = {item["vendor_name"]: item for item in self._snapshot}
+            for vendor_name, values in plan.touched.items():
+                if vendor_name in by_name:
+                    by_name[vendor_name].update(values)
+        return success
+
+    def plan_vendors(self, vendor_states: List[VendorState]) -> ListsWritePlan:
+        """Plan writes for vendor states, dropping cells that already match the list."""
+        with self._lock:
+            return self.manager.plan_updates(
+                [self._vendor_update(state) for state in vendor_states],
+                snapshot=self._get_snapshot(),
+            )
 
     def update_vendor(
         self,
@@ -315,52 +520,71 @@ class SlackListsWriter:
         dry_run: bool = False,
     ) -> bool:
         """
-        Update vendor in Slack Lists.
+        Update vendor in Slack Lists (unchanged cells are skipped).
 
         Args:
             vendor_state: Vendor state to write
             dry_run: If True, only preview changes
 
         Returns:
-            True if successful (or dry_run)
+            True if successful (or dry_run / nothing to change)
         """
         vendor_name = vendor_state.vendor_name
 
-        # Map status to Slack option
-        status_text = self._map_status(vendor_state.status)
-
-        # Format quote
-        quote_text = vendor_state.quote_summary
-
-        # Format last contact
-        last_contact = vendor_state.last_contact
-
-        # Format next action
-        next_action = vendor_state.next_action
-
         if dry_run:
+            status_text = self._map_status(vendor_state.status)
             console.print(f"[dim]Would update {vendor_name}:[/dim]")
             console.print(f"  Status: {status_text}")
-            console.print(f"  Quote: {quote_text}")
-            if last_contact:
-                console.print(f"  Last Contact: {last_contact.strftime('%Y-%m-%d')}")
-            if next_action:
-                console.print(f"  Next Action: {next_action}")
+            console.print(f"  Quote: {vendor_state.quote_summary}")
+            if vendor_state.last_contact:
+                console.print(f"  Last Contact: {vendor_state.last_contact.strftime('%Y-%m-%d')}")
+            if vendor_state.next_action:
+                console.print(f"  Next Action: {vendor_state.next_action}")
             return True
 
         try:
-            success = self.manager.update_item(
-                vendor_name=vendor_name,
-                status=status_text,
-                quote=quote_text if quote_text != "미수령" else None,
-                last_contact=last_contact,
-                next_action=next_action,
-            )
-            return success
+            plan = self.plan_vendors([vendor_state])
+            if plan.unknown:
+                raise ValueError(f"Unknown vendor: {vendor_name}")
+            with self._lock:
+                return self._apply(plan)
         except Exception as e:
             console.print(f"[red]Error updating {vendor_name}: {e}[/red]")
             return False
 
+    def update_vendors(
+        self,
+        vendor_states: List[VendorState],
+        dry_run: bool = False,
+    ) -> ListsWritePlan:
+        """
+        Update several vendors with batched writes of changed cells only.
+
+        Args:
+            vendor_states: Vendor states to write
+            dry_run: If True, only report the plan
+
+        Returns:
+            The executed (or previewed) write plan
+        """
+        plan = self.plan_vendors(vendor_states)
+        console.print(f"  Write plan: {plan}")
+        for vendor_name in plan.unknown:
+            console.print(f"[yellow]Warning: Unknown vendor {vendor_name}, not in Slack List[/yellow]")
+
+        if dry_run:
+            for vendor_name, values in plan.touched.items():
+                console.print(f"[dim]Would update {vendor_name}: {values}[/dim]")
+            return plan
+
+        try:
+            with self._lock:
+                if not self._apply(plan):
+                    console.print("[red]Error: Slack Lists update failed[/red]")
+        except Exception as e:
+            console.print(f"[red]Error updating Slack Lists: {e}[/red]")
+        return plan
+
     def _map_status(self, status: VendorStatus) -> Optional[str]:
         """Map VendorStatus to Slack Lists status option."""
         mapping = {
@@ -392,27 +616,35 @@ class SlackListsWriter:
 class SyncPipeline:
     """Main 4-layer sync pipeline."""
 
+    # Max vendors waiting between pipelined layers
+    PIPELINE_QUEUE_SIZE = 4
+
     def __init__(
         self,
         config_path: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
+        full_tables: bool = False,
     ):
         """
         Initialize pipeline.
 
         Args:
             config_path: Path to YAML config file
+            max_concurrency: Concurrent vendor searches (overrides config)
+            full_tables: Extract PDF tables from every page (default: price pages only)
         """
         # Load config
         if config_path is None:
             config_path = _wsoptv_root / "wsoptv_sync_config.yaml"
 
         self.config = ProjectConfig.from_yaml(config_path)
+        self.max_concurrency = max(1, max_concurrency or self.config.max_concurrency)
 
         # Initialize state
-        self.state = SyncStateV2(self.config.state_file)
+        self.state = open_sync_state(self.config.state_file)
 
-        # Initialize clients
-        self.gmail_client = GmailClient()
+        # Initialize clients (shared per process)
+        self.gmail_client = get_gmail_client()
 
         # Initialize components
         self.thread_analyzer = ThreadAnalyzer(self.gmail_client, self.config)
@@ -420,8 +652,10 @@ class SyncPipeline:
         self.attachment_downloader = AttachmentDownloader(
             self.gmail_client,
             self.config.attachments_dir,
+            max_workers=self.max_concurrency,
+            attachment_filter=AttachmentFilter(self.config.attachment_filter),
         )
-        self.quote_aggregator = QuoteAggregator(self.config)
+        self.quote_aggregator = QuoteAggregator(self.config, full_tables=full_tables)
         self.slack_writer = SlackListsWriter(self.config)
 
     def sync_vendor_states(
@@ -430,6 +664,7 @@ class SyncPipeline:
         vendor_filter: Optional[str] = None,
         dry_run: bool = False,
         full_scan: bool = False,
+        pipelined: bool = False,
     ) -> Dict:
         """
         Main sync workflow.
@@ -439,6 +674,8 @@ class SyncPipeline:
             vendor_filter: Filter to specific vendor
             dry_run: Preview changes without applying
             full_scan: Process all emails, ignore incremental state
+            pipelined: Stream each vendor through the layers as soon as its
+                input is ready (default: each layer finishes for all vendors first)
 
         Returns:
             Results dict with counts and details
@@ -453,12 +690,38 @@ class SyncPipeline:
 
         console.print(Panel(
             f"[bold]Slack Lists Sync v2[/bold]\n"
-            f"Mode: {'FULL' if full_scan else 'INCREMENTAL'}\n"
+            f"Mode: {'FULL' if full_scan else 'INCREMENTAL'}"
+            f"{' (PIPELINED)' if pipelined else ''}\n"
             f"Days: {days}\n"
             f"Vendor: {vendor_filter or 'All'}",
             title="Sync Configuration",
         ))
 
+        if pipelined:
+            vendor_states, transitions = self._sync_pipelined(days, vendor_filter, dry_run, full_scan, results)
+        else:
+            vendor_states, transitions = self._sync_layered(days, vendor_filter, dry_run, full_scan, results)
+
+        # Save state
+        if not dry_run:
+            self.state.save()
+            console.print("[green]State saved[/green]")
+
+        # Display results
+        results["api_stats"] = get_api_scheduler().stats()
+        self._display_results(results, vendor_states, transitions)
+
+        return results
+
+    def _sync_layered(
+        self,
+        days: int,
+        vendor_filter: Optional[str],
+        dry_run: bool,
+        full_scan: bool,
+        results: Dict,
+    ) -> Tuple[Dict[str, VendorState], List[StatusTransition]]:
+        """Run the four layers one after another for all vendors."""
         # Layer 1: Collect emails
         with Progress(
             TextColumn("[bold blue]>>>[/bold blue]"),
@@ -512,27 +775,236 @@ class SyncPipeline:
             results["vendors_processed"] = len(vendor_states)
             progress.update(task, completed=True)
 
-        # Save state
+        return vendor_states, transitions
+
+    def _sync_pipelined(
+        self,
+        days: int,
+        vendor_filter: Optional[str],
+        dry_run: bool,
+        full_scan: bool,
+        results: Dict,
+    ) -> Tuple[Dict[str, VendorState], List[StatusTransition]]:
+        """
+        Stream vendors through the layers.
+
+        Gmail searches (Layer 1), thread fetches (Layer 2) and Slack writes
+        (Layer 4) run in worker threads connected by bounded queues, so the
+        first vendor can be written while others are still being collected.
+        State store access and status inference (Layer 3) stay on this
+        thread, which handles stage events in completion order - the SQLite
+        state connection may only be used by the thread that opened it.
+        """
+        queries = self._vendor_queries(days, vendor_filter)
+        vendor_states: Dict[str, VendorState] = {}
+        transitions: List[StatusTransition] = []
+        thread_ids_by_vendor: Dict[str, List[str]] = {}
+        emails_by_vendor: Dict[str, List] = {}
+        transition_by_vendor: Dict[str, StatusTransition] = {}
+        email_count = 0
+
+        # Workers -> coordinator (unbounded: workers never block on it)
+        events: queue.Queue = queue.Queue()
+        # Coordinator -> workers (bounded: back-pressure between layers)
+        to_analyze: queue.Queue = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        to_write: queue.Queue = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+
+        def analyze_worker():
+            while True:
+                item = to_analyze.get()
+                if item is None:
+                    return
+                vendor_name, thread_ids = item
+                try:
+                    events.put(("analyzed", vendor_name, self.thread_analyzer.analyze_many(thread_ids)))
+                except Exception as e:
+                    events.put(("failed", vendor_name, ("Layer 2", e)))
+
+        def write_worker():
+            while True:
+                state = to_write.get()
+                if state is None:
+                    return
+                try:
+                    if self.slack_writer.update_vendor(state, dry_run):
+                        events.put(("written", state.vendor_name, None))
+                    else:
+                        events.put(("failed", state.vendor_name, ("Layer 4", "Slack Lists update failed")))
+                except Exception as e:
+                    events.put(("failed", state.vendor_name, ("Layer 4", e)))
+
+        def search(query: str) -> List:
+            return get_api_scheduler().call(
+                "gmail", "messages.list", self._worker_gmail_client().list_emails, query=query, max_results=50
+            )
+
+        workers = [
+            threading.Thread(target=analyze_worker, name="sync-analyze", daemon=True),
+            threading.Thread(target=write_worker, name="sync-write", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+
+        pending = len(queries)  # Vendors not yet written, skipped or failed
+        try:
+            with Progress(
+                TextColumn("[bold blue]>>>[/bold blue]"),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                console=console,
+            ) as progress, ThreadPoolExecutor(
+                max_workers=max(1, min(self.max_concurrency, len(queries))),
+                thread_name_prefix="gmail-search",
+            ) as pool:
+                layer1 = progress.add_task("[cyan]Layer 1: Collecting emails...", total=len(queries))
+                layer2 = progress.add_task("[cyan]Layer 2: Analyzing...", total=0)
+                layer3 = progress.add_task("[cyan]Layer 3: Processing...", total=0)
+                layer4 = progress.add_task("[cyan]Layer 4: Writing to Slack...", total=0)
+
+                for vendor_name, query in queries:
+                    future = pool.submit(search, query)
+                    future.add_done_callback(
+                        lambda f, name=vendor_name: events.put(("collected", name, f))
+                    )
+
+                while pending:
+                    kind, vendor_name, payload = events.get()
+
+                    if kind == "collected":
+                        progress.advance(layer1)
+                        try:
+                            emails = payload.result()
+                        except Exception as e:
+                            console.print(f"[yellow]Warning: Failed to fetch emails for {vendor_name}: {e}[/yellow]")
+                            pending -= 1
+                            continue
+
+                        emails = self._filter_new_emails(emails, full_scan)
+                        if not emails:
+                            pending -= 1
+                            continue
+
+                        email_count += len(emails)
+                        # Marked processed only once written, so a failed vendor is retried next run
+                        emails_by_vendor[vendor_name] = emails
+                        thread_ids_by_vendor[vendor_name] = self._thread_ids(emails)
+                        for task in (layer2, layer3, layer4):
+                            progress.update(task, total=len(thread_ids_by_vendor))
+                        to_analyze.put((vendor_name, thread_ids_by_vendor[vendor_name]))
+
+                    elif kind == "analyzed":
+                        # Thread marks / pending transitions are recorded once written (like emails)
+                        state = self._build_vendor_state(
+                            vendor_name, thread_ids_by_vendor[vendor_name], payload, mark_processed=False
+                        )
+                        vendor_states[vendor_name] = state
+                        results["threads_analyzed"] += len(state.threads)
+                        progress.advance(layer2)
+
+                        transition = self._process_status_change(vendor_name, state, queue_pending=False)
+                        if transition:
+                            transitions.append(transition)
+                            transition_by_vendor[vendor_name] = transition
+                        progress.advance(layer3)
+
+                        to_write.put(state)
+
+                    elif kind == "written":
+                        self._mark_emails_processed(emails_by_vendor[vendor_name])
+                        self._mark_threads_processed(vendor_states[vendor_name].threads)
+                        if vendor_name in transition_by_vendor:
+                            self._queue_pending_transition(vendor_name, transition_by_vendor[vendor_name])
+                        if not dry_run:
+                            self._store_vendor_state(vendor_name, vendor_states[vendor_name])
+                        results["vendors_processed"] += 1
+                        progress.advance(layer4)
+                        pending -= 1
+
+                    else:  # failed
+                        layer, error = payload
+                        console.print(f"[yellow]Warning: {layer} failed for {vendor_name}: {error}[/yellow]")
+                        results["errors"].append(f"{vendor_name} ({layer}): {error}")
+                        pending -= 1
+        finally:
+            to_analyze.put(None)
+            to_write.put(None)
+            for worker in workers:
+                worker.join()
+
+        results["status_changes"] = transitions
+        console.print(f"  Found {email_count} emails from {len(thread_ids_by_vendor)} vendors")
+        console.print(f"  Analyzed {results['threads_analyzed']} threads")
+        console.print(f"  Detected {len(transitions)} status changes")
+
+        # Refresh summary
         if not dry_run:
-            self.state.save()
-            console.print("[green]State saved[/green]")
+            self.slack_writer.refresh_summary()
 
-        # Display results
-        self._display_results(results, vendor_states, transitions)
+        return vendor_states, transitions
 
-        return results
+    def _worker_gmail_client(self) -> GmailClient:
+        """
+        Get a GmailClient for the current worker thread.
 
-    def _collect_vendor_emails(
+        googleapiclient's HTTP transport is not thread-safe, so each worker
+        thread uses its own registry client instead of sharing self.gmail_client.
+        """
+        return get_gmail_client()
+
+    def _search_vendors(
+        self,
+        queries: List[Tuple[str, str]],
+        max_results: int,
+    ) -> List[Tuple[str, List, Optional[Exception]]]:
+        """
+        Run per-vendor Gmail searches with bounded concurrency.
+
+        Args:
+            queries: (vendor_name, gmail_query) pairs
+            max_results: Max results per query
+
+        Returns:
+            (vendor_name, emails, error) tuples in the same order as queries
+        """
+        if self.max_concurrency == 1 or len(queries) <= 1:
+            results = []
+            for vendor_name, query in queries:
+                try:
+                    emails = get_api_scheduler().call(
+                        "gmail", "messages.list", self.gmail_client.list_emails, query=query, max_results=max_results
+                    )
+                    results.append((vendor_name, emails, None))
+                except Exception as e:
+                    results.append((vendor_name, [], e))
+            return results
+
+        def search(query: str) -> List:
+            return get_api_scheduler().call(
+                "gmail", "messages.list", self._worker_gmail_client().list_emails, query=query, max_results=max_results
+            )
+
+        workers = min(self.max_concurrency, len(queries))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gmail-search") as pool:
+            futures = [pool.submit(search, query) for _, query in queries]
+
+            results = []
+            for (vendor_name, _), future in zip(queries, futures):
+                try:
+                    results.append((vendor_name, future.result(), None))
+                except Exception as e:
+                    results.append((vendor_name, [], e))
+            return results
+
+    def _vendor_queries(
         self,
         days: int,
         vendor_filter: Optional[str],
-        full_scan: bool,
-    ) -> Dict[str, List]:
-        """Collect emails grouped by vendor."""
-        vendor_emails: Dict[str, List] = {}
-
+    ) -> List[Tuple[str, str]]:
+        """Build per-vendor Gmail queries as (vendor_name, query) pairs."""
         after_date = (datetime.now() - timedelta(days=days)).strftime("%Y/%m/%d")
 
+        queries: List[Tuple[str, str]] = []
         for vendor in self.config.vendors:
             if vendor_filter and vendor_filter.lower() not in vendor.name.lower():
                 continue
@@ -540,25 +1012,38 @@ class SyncPipeline:
             # Build query for vendor domains
             domain_queries = [f"from:{d}" for d in vendor.domains]
             domain_queries.extend([f"to:{d}" for d in vendor.domains])
-            query = f"({' OR '.join(domain_queries)}) after:{after_date}"
+            queries.append((vendor.name, f"({' OR '.join(domain_queries)}) after:{after_date}"))
+        return queries
+
+    def _filter_new_emails(self, emails: List, full_scan: bool) -> List:
+        """Filter out processed emails in incremental mode."""
+        if full_scan:
+            return emails
+        return [
+            e for e in emails
+            if not self.state.is_email_processed(
+                getattr(e, "id", "") or getattr(e, "message_id", "")
+            )
+        ]
 
-            try:
-                emails = self.gmail_client.list_emails(query=query, max_results=50)
-
-                # Filter out processed emails in incremental mode
-                if not full_scan:
-                    emails = [
-                        e for e in emails
-                        if not self.state.is_email_processed(
-                            getattr(e, "id", "") or getattr(e, "message_id", "")
-                        )
-                    ]
+    def _collect_vendor_emails(
+        self,
+        days: int,
+        vendor_filter: Optional[str],
+        full_scan: bool,
+    ) -> Dict[str, List]:
+        """Collect emails grouped by vendor."""
+        vendor_emails: Dict[str, List] = {}
 
-                if emails:
-                    vendor_emails[vendor.name] = emails
+        queries = self._vendor_queries(days, vendor_filter)
+        for vendor_name, emails, error in self._search_vendors(queries, max_results=50):
+            if error is not None:
+                console.print(f"[yellow]Warning: Failed to fetch emails for {vendor_name}: {error}[/yellow]")
+                continue
 
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to fetch emails for {vendor.name}: {e}[/yellow]")
+            emails = self._filter_new_emails(emails, full_scan)
+            if emails:
+                vendor_emails[vendor_name] = emails
 
         return vendor_emails
 
@@ -570,58 +1055,87 @@ class SyncPipeline:
         vendor_states: Dict[str, VendorState] = {}
 
         for vendor_name, emails in vendor_emails.items():
-            # Get existing state or create new
-            stored = self.state.get_vendor_state(vendor_name)
-            status = VendorStatus(stored.get("status", "initial_contact")) if stored else VendorStatus.INITIAL_CONTACT
-
-            # Analyze threads
-            thread_ids = set()
-            for email in emails:
-                tid = getattr(email, "thread_id", None)
-                if tid:
-                    thread_ids.add(tid)
-
-                # Mark email processed
-                email_id = getattr(email, "id", "") or getattr(email, "message_id", "")
-                if email_id:
-                    self.state.mark_email_processed(email_id)
-
-            # Analyze each thread
-            threads: List[EmailThread] = []
-            for tid in thread_ids:
-                try:
-                    thread = self.thread_analyzer.analyze(tid)
-                    threads.append(thread)
-                    self.state.mark_thread_processed(tid)
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Thread {tid} analysis failed: {e}[/yellow]")
-
-            # Find latest contact date
-            last_contact = None
-            for thread in threads:
-                if thread.last_date and (last_contact is None or thread.last_date > last_contact):
-                    last_contact = thread.last_date
-
-            # Get stored quote
-            stored_quote = self.state.get_quote(vendor_name)
-            quote = VendorQuote(vendor=vendor_name)
-            if stored_quote:
-                quote = VendorQuote(
-                    vendor=vendor_name,
-                    options=[QuoteOption(**o) for o in stored_quote.get("options", [])],
-                    received_date=datetime.fromisoformat(stored_quote["received_date"]) if stored_quote.get("received_date") else None,
-                )
+            thread_ids = self._mark_emails_processed(emails)
 
-            vendor_states[vendor_name] = VendorState(
-                vendor_name=vendor_name,
-                status=status,
-                threads=threads,
-                quote=quote,
-                last_contact=last_contact,
-            )
+            # Analyze threads (batched Gmail requests)
+            analyzed = self.thread_analyzer.analyze_many(thread_ids)
+            vendor_states[vendor_name] = self._build_vendor_state(vendor_name, thread_ids, analyzed)
 
         return vendor_states
 
+    @staticmethod
+    def _thread_ids(emails: List) -> List[str]:
+        """Thread IDs of emails (sorted, unique)."""
+        return sorted({tid for tid in (getattr(e, "thread_id", None) for e in emails) if tid})
+
+    def _mark_emails_processed(self, emails: List) -> List[str]:
+        """Mark emails processed and return their thread IDs (sorted)."""
+        for email in emails:
+            email_id = getattr(email, "id", "") or getattr(email, "message_id", "")
+            if email_id:
+                self.state.mark_email_processed(email_id)
+
+        return self._thread_ids(emails)
+
+    def _mark_threads_processed(self, threads: List[EmailThread]):
+        """Mark analyzed threads processed."""
+        for thread in threads:
+            self.state.mark_thread_processed(thread.thread_id)
+
+    def _build_vendor_state(
+        self,
+        vendor_name: str,
+        thread_ids: List[str],
+        analyzed: Dict[str, EmailThread],
+        mark_processed: bool = True,
+    ) -> VendorState:
+        """
+        Build a VendorState from analyzed threads and stored state.
+
+        Args:
+            vendor_name: Vendor name
+            thread_ids: Thread IDs collected for the vendor
+            analyzed: Analysis results by thread ID
+            mark_processed: Mark analyzed threads processed now (False = caller marks them after writing)
+        """
+        # Get existing state or create new
+        stored = self.state.get_vendor_state(vendor_name)
+        status = VendorStatus(stored.get("status", "initial_contact")) if stored else VendorStatus.INITIAL_CONTACT
+
+        threads: List[EmailThread] = []
+        for tid in thread_ids:
+            if tid not in analyzed:
+                console.print(f"[yellow]Warning: Thread {tid} analysis failed[/yellow]")
+                continue
+            threads.append(analyzed[tid])
+
+        if mark_processed:
+            self._mark_threads_processed(threads)
+
+        # Find latest contact date
+        last_contact = None
+        for thread in threads:
+            if thread.last_date and (last_contact is None or thread.last_date > last_contact):
+                last_contact = thread.last_date
+
+        # Get stored quote
+        stored_quote = self.state.get_quote(vendor_name)
+        quote = VendorQuote(vendor=vendor_name)
+        if stored_quote:
+            quote = VendorQuote(
+                vendor=vendor_name,
+                options=[QuoteOption(**o) for o in stored_quote.get("options", [])],
+                received_date=datetime.fromisoformat(stored_quote["received_date"]) if stored_quote.get("received_date") else None,
+            )
+
+        return VendorState(
+            vendor_name=vendor_name,
+            status=status,
+            threads=threads,
+            quote=quote,
+            last_contact=last_contact,
+        )
+
     def _process_status_changes(
         self,
         vendor_states: Dict[str, VendorState],
@@ -630,49 +1144,78 @@ class SyncPipeline:
         transitions: List[StatusTransition] = []
 
         for vendor_name, state in vendor_states.items():
-            transition = self.status_inferencer.infer_vendor_status(state)
-
+            transition = self._process_status_change(vendor_name, state)
             if transition:
                 transitions.append(transition)
 
-                # Handle transition
-                if transition.requires_approval:
-                    self.state.add_pending_transition({
-                        "vendor": vendor_name,
-                        "from": transition.from_status.value,
-                        "to": transition.to_status.value,
-                        "trigger": transition.trigger,
-                        "confidence": transition.confidence,
-                    })
-                else:
-                    # Auto-apply positive transitions
-                    state.status = transition.to_status
-
         return transitions
 
+    def _process_status_change(
+        self,
+        vendor_name: str,
+        state: VendorState,
+        queue_pending: bool = True,
+    ) -> Optional[StatusTransition]:
+        """
+        Infer and apply (or queue for approval) one vendor's status change.
+
+        Args:
+            vendor_name: Vendor name
+            state: Vendor state (status updated for auto-applied transitions)
+            queue_pending: Queue approval-required transitions now
+                (False = caller queues them after writing)
+        """
+        transition = self.status_inferencer.infer_vendor_status(state)
+
+        if transition:
+            # Handle transition
+            if transition.requires_approval:
+                if queue_pending:
+                    self._queue_pending_transition(vendor_name, transition)
+            else:
+                # Auto-apply positive transitions
+                state.status = transition.to_status
+
+        return transition
+
+    def _queue_pending_transition(self, vendor_name: str, transition: StatusTransition):
+        """Queue an approval-required transition (no-op for auto-applied ones)."""
+        if not transition.requires_approval:
+            return
+        self.state.add_pending_transition({
+            "vendor": vendor_name,
+            "from": transition.from_status.value,
+            "to": transition.to_status.value,
+            "trigger": transition.trigger,
+            "confidence": transition.confidence,
+        })
+
     def _write_to_slack(
         self,
         vendor_states: Dict[str, VendorState],
         transitions: List[StatusTransition],
         dry_run: bool,
     ):
-        """Write states to Slack Lists."""
-        for vendor_name, state in vendor_states.items():
-            # Update vendor state
-            self.slack_writer.update_vendor(state, dry_run)
-
-            # Store state
-            if not dry_run:
-                self.state.update_vendor_state(vendor_name, {
-                    "status": state.status.value,
-                    "last_contact": state.last_contact.isoformat() if state.last_contact else None,
-                    "has_negotiation": state.has_active_negotiation,
-                })
+        """Write states to Slack Lists (changed cells only, batched)."""
+        self.slack_writer.update_vendors(list(vendor_states.values()), dry_run)
+
+        # Store state
+        if not dry_run:
+            for vendor_name, state in vendor_states.items():
+                self._store_vendor_state(vendor_name, state)
 
         # Refresh summary
         if not dry_run:
             self.slack_writer.refresh_summary()
 
+    def _store_vendor_state(self, vendor_name: str, state: VendorState):
+        """Persist a vendor state written to Slack."""
+        self.state.update_vendor_state(vendor_name, {
+            "status": state.status.value,
+            "last_contact": state.last_contact.isoformat() if state.last_contact else None,
+            "has_negotiation": state.has_active_negotiation,
+        })
+
     def _display_results(
         self,
         results: Dict,
@@ -705,6 +1248,21 @@ class SyncPipeline:
                 approval = " [yellow](needs approval)[/yellow]" if t.requires_approval else ""
                 console.print(f"  {t.from_status.value} -> {t.to_status.value} (trigger: {t.trigger}){approval}")
 
+        # Show API throttling (only methods that waited or were rate-limited)
+        throttled = {
+            method: s for method, s in get_api_scheduler().stats().items()
+            if s["throttled_seconds"] or s["rate_limited"]
+        }
+        if throttled:
+            api_table = Table(title="API Rate Limits")
+            api_table.add_column("Method", style="cyan")
+            api_table.add_column("Calls", justify="right")
+            api_table.add_column("Rate-limited", justify="right")
+            api_table.add_column("Throttled", justify="right")
+            for method, s in throttled.items():
+                api_table.add_row(method, str(s["calls"]), str(s["rate_limited"]), f"{s['throttled_seconds']:.1f}s")
+            console.print(api_table)
+
     def analyze_threads(
         self,
         vendor_filter: Optional[str] = None,
@@ -762,31 +1320,40 @@ class SyncPipeline:
         # First collect emails with attachments
         after_date = (datetime.now() - timedelta(days=days)).strftime("%Y/%m/%d")
 
+        queries: List[Tuple[str, str]] = []
         for vendor in self.config.vendors:
             if vendor_filter and vendor_filter.lower() not in vendor.name.lower():
                 continue
 
-            console.print(f"Extracting quotes for [cyan]{vendor.name}[/cyan]...")
-
             # Build query
             domain_queries = [f"from:{d}" for d in vendor.domains]
-            query = f"({' OR '.join(domain_queries)}) has:attachment after:{after_date}"
+            queries.append((vendor.name, f"({' OR '.join(domain_queries)}) has:attachment after:{after_date}"))
 
-            try:
-                emails = self.gmail_client.list_emails(query=query, max_results=20)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to fetch emails: {e}[/yellow]")
+        for vendor_name, emails, error in self._search_vendors(queries, max_results=20):
+            console.print(f"Extracting quotes for [cyan]{vendor_name}[/cyan]...")
+
+            if error is not None:
+                console.print(f"[yellow]Warning: Failed to fetch emails: {error}[/yellow]")
                 continue
 
             # Download and parse attachments
             all_attachments: List[Attachment] = []
 
-            for email in emails:
-                email_id = getattr(email, "id", "") or getattr(email, "message_id", "")
-                if not email_id:
-                    continue
-
-                attachments = self.attachment_downloader.get_quote_attachments(email_id)
+            email_ids = [
+                getattr(email, "id", "") or getattr(email, "message_id", "")
+                for email in emails
+            ]
+            email_ids = [eid for eid in email_ids if eid]
+            batched = self.attachment_downloader.get_quote_attachments_batch(email_ids)
+
+            for email_id in email_ids:
+                attachments = batched.get(email_id)
+                if attachments is None:
+                    try:
+                        attachments = self.attachment_downloader.get_quote_attachments(email_id)
+                    except Exception as e:
+                        console.print(f"[yellow]Warning: Failed to download attachments for {email_id}: {e}[/yellow]")
+                        continue
                 all_attachments.extend(attachments)
 
             console.print(f"  Downloaded {len(all_attachments)} attachments")
@@ -794,14 +1361,14 @@ class SyncPipeline:
             # Aggregate quotes
             quote = self.quote_aggregator.aggregate_from_attachments(
                 all_attachments,
-                vendor.name,
+                vendor_name,
             )
 
             if quote.options:
-                results[vendor.name] = quote
+                results[vendor_name] = quote
 
                 # Store in state
-                self.state.add_quote(vendor.name, {
+                self.state.add_quote(vendor_name, {
                     "options": [o.model_dump() for o in quote.options],
                     "received_date": quote.received_date.isoformat() if quote.received_date else None,
                 })
@@ -825,6 +1392,9 @@ def sync(
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview changes without applying"),
     full: bool = typer.Option(False, "--full", help="Full scan (ignore incremental state)"),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config file"),
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", help="Concurrent vendor searches (default: config)"),
+    full_tables: bool = typer.Option(False, "--full-tables", help="Extract PDF tables from every page (default: price pages only)"),
+    pipelined: bool = typer.Option(False, "--pipelined", help="Stream each vendor through all layers as soon as it is collected"),
 ):
     """
     Sync vendor states to Slack Lists.
@@ -832,12 +1402,13 @@ def sync(
     Main workflow that collects Gmail, analyzes threads, infers status changes,
     and updates Slack Lists.
     """
-    pipeline = SyncPipeline(config)
+    pipeline = SyncPipeline(config, max_concurrency=concurrency, full_tables=full_tables)
     pipeline.sync_vendor_states(
         days=days,
         vendor_filter=vendor,
         dry_run=dry_run,
         full_scan=full,
+        pipelined=pipelined,
     )
 
 
@@ -846,7 +1417,7 @@ def status():
     """Show current sync state and statistics."""
     config_path = _wsoptv_root / "wsoptv_sync_config.yaml"
     config = ProjectConfig.from_yaml(config_path)
-    state = SyncStateV2(config.state_file)
+    state = open_sync_state(config.state_file)
     stats = state.get_stats()
 
     table = Table(title="Sync State v2")
@@ -886,9 +1457,11 @@ def analyze_attachments_cmd(
     vendor: Optional[str] = typer.Option(None, "--vendor", "-v", help="Filter to specific vendor"),
     days: int = typer.Option(30, "--days", "-d", help="Number of days to look back"),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config file"),
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", help="Concurrent vendor searches (default: config)"),
+    full_tables: bool = typer.Option(False, "--full-tables", help="Extract PDF tables from every page (default: price pages only)"),
 ):
     """Extract quotes from vendor attachments."""
-    pipeline = SyncPipeline(config)
+    pipeline = SyncPipeline(config, max_concurrency=concurrency, full_tables=full_tables)
     pipeline.extract_quotes(vendor_filter=vendor, days=days)
 
 
@@ -901,7 +1474,7 @@ def approve_transitions(
     """Approve pending status transitions."""
     config_path = config or _wsoptv_root / "wsoptv_sync_config.yaml"
     proj_config = ProjectConfig.from_yaml(config_path)
-    state = SyncStateV2(proj_config.state_file)
+    state = open_sync_state(proj_config.state_file)
     pending = state.get_pending_transitions()
 
     if not pending:
@@ -973,10 +1546,41 @@ def clear_state(
 
     if proj_config.state_file.exists():
         proj_config.state_file.unlink()
+        # SQLite WAL side files
+        for suffix in ("-wal", "-shm"):
+            side_file = proj_config.state_file.with_name(proj_config.state_file.name + suffix)
+            if side_file.exists():
+                side_file.unlink()
         console.print("[green]State cleared[/green]")
     else:
         console.print("[yellow]No state file found[/yellow]")
 
 
+@app.command("migrate-state")
+def migrate_state(
+    source: Path = typer.Argument(..., help="JSON state file to import"),
+    target: Optional[Path] = typer.Option(None, "--to", help="SQLite file (default: source with .db suffix)"),
+):
+    """Import a JSON sync state file into the SQLite state store."""
+    target = target or source.with_suffix(".db")
+    if not is_sqlite_path(target):
+        console.print(f"[red]Target must end with .db/.sqlite: {target}[/red]")
+        raise typer.Exit(1)
+    if not source.exists():
+        console.print(f"[red]Source not found: {source}[/red]")
+        raise typer.Exit(1)
+
+    store = SqliteStateStore(target)
+    try:
+        counts = store.import_json_file(source)
+    finally:
+        store.close()
+
+    console.print(f"[green]Imported {source} -> {target}[/green]")
+    for key, value in counts.items():
+        console.print(f"  {key}: {value}")
+    console.print("[dim]Set state_file in the YAML config to the .db path to use it.[/dim]")
+
+
 if __name__ == "__main__":
     app()
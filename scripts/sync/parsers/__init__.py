@@ -1,5 +1,6 @@
 """Parsers for document content extraction."""
 from .pdf_parser import PDFParser
 from .excel_parser import ExcelParser
+from .parse_cache import ParseCache
 
-__all__ = ["PDFParser", "ExcelParser"]
+__all__ = ["PDFParser", "ExcelParser", "ParseCache"]
@@ -1,7 +1,8 @@
 """Excel parser for spreadsheet data extraction."""
 
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     import pandas as pd
@@ -19,62 +20,100 @@ except ImportError:
 class ExcelParser:
     """Extract data from Excel files."""
 
+    # Bump when output changes (invalidates ParseCache entries)
+    VERSION = "2"
+
     def __init__(self):
         """Initialize parser."""
         if not HAS_OPENPYXL and not HAS_PANDAS:
             print("Warning: openpyxl/pandas not installed. Install with: pip install openpyxl pandas")
 
-    def parse(self, path: Path) -> Dict[str, Union[List, "pd.DataFrame"]]:
+    def iter_sheets(self, path: Path) -> Iterator[Tuple[str, Iterator[tuple]]]:
         """
-        Parse all sheets from Excel file.
+        Open the workbook once in read-only mode and yield rows lazily.
+
+        Rows of a sheet must be consumed before advancing to the next
+        sheet. Legacy .xls files (not readable by openpyxl) are read once
+        through pandas.
 
         Args:
             path: Path to Excel file
 
-        Returns:
-            Dict mapping sheet name to DataFrame (or list of lists)
+        Yields:
+            (sheet_name, row tuples) per worksheet
         """
-        if HAS_PANDAS:
-            return self._parse_with_pandas(path)
-        elif HAS_OPENPYXL:
-            return self._parse_with_openpyxl(path)
+        if HAS_OPENPYXL and Path(path).suffix.lower() != ".xls":
+            wb = load_workbook(path, read_only=True, data_only=True)
+            try:
+                for ws in wb.worksheets:
+                    # Read-only mode trusts the stored <dimension>; exporters often write a stale one
+                    ws.reset_dimensions()
+                    yield ws.title, ws.iter_rows(values_only=True)
+            finally:
+                wb.close()
+        elif HAS_PANDAS:
+            all_sheets = pd.read_excel(path, sheet_name=None, header=None)
+            for sheet_name, df in all_sheets.items():
+                yield sheet_name, (
+                    tuple(None if pd.isna(v) else v for v in row)
+                    for row in df.itertuples(index=False, name=None)
+                )
         else:
             raise ImportError("openpyxl or pandas required: pip install openpyxl pandas")
 
-    def _parse_with_pandas(self, path: Path) -> Dict[str, "pd.DataFrame"]:
-        """Parse using pandas."""
-        excel_file = pd.ExcelFile(path)
-        sheets = {}
-
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            sheets[sheet_name] = df
+    def parse(self, path: Path) -> Dict[str, Union[List, "pd.DataFrame"]]:
+        """
+        Parse all sheets from Excel file in a single streaming pass.
 
-        return sheets
+        Args:
+            path: Path to Excel file
 
-    def _parse_with_openpyxl(self, path: Path) -> Dict[str, List]:
-        """Parse using openpyxl (fallback)."""
-        wb = load_workbook(path, data_only=True)
+        Returns:
+            Dict mapping sheet name to DataFrame (or list of lists)
+        """
         sheets = {}
-
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-            data = []
-            for row in ws.iter_rows(values_only=True):
-                data.append(list(row))
-            sheets[sheet_name] = data
-
+        for sheet_name, rows in self.iter_sheets(path):
+            data = self._trim_rows(rows)
+            sheets[sheet_name] = self._to_dataframe(data) if HAS_PANDAS else data
         return sheets
 
+    @staticmethod
+    def _trim_rows(rows) -> List[List]:
+        """Materialize rows, dropping trailing empty rows and columns."""
+        data = [list(row) for row in rows]
+        while data and all(v is None for v in data[-1]):
+            data.pop()
+
+        width = 0
+        for row in data:
+            for i in range(len(row) - 1, -1, -1):
+                if row[i] is not None:
+                    width = max(width, i + 1)
+                    break
+        return [row[:width] + [None] * (width - len(row)) for row in data]
+
+    @staticmethod
+    def _to_dataframe(data: List[List]) -> "pd.DataFrame":
+        """Build a DataFrame with the first row as header (read_excel style)."""
+        if not data:
+            return pd.DataFrame()
+
+        columns = []
+        seen = {}
+        for i, name in enumerate(data[0]):
+            name = f"Unnamed: {i}" if name is None else name
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+
+        return pd.DataFrame(data[1:], columns=columns)
+
     def get_sheet_names(self, path: Path) -> List[str]:
         """Get list of sheet names."""
-        if HAS_PANDAS:
-            excel_file = pd.ExcelFile(path)
-            return excel_file.sheet_names
-        elif HAS_OPENPYXL:
-            wb = load_workbook(path, read_only=True)
-            return wb.sheetnames
-        return []
+        return [sheet_name for sheet_name, _rows in self.iter_sheets(path)]
 
     def parse_sheet(self, path: Path, sheet_name: str) -> Union[List, "pd.DataFrame"]:
         """
@@ -87,8 +126,11 @@ class ExcelParser:
         Returns:
             DataFrame or list of lists
         """
-        sheets = self.parse(path)
-        return sheets.get(sheet_name)
+        for name, rows in self.iter_sheets(path):
+            if name == sheet_name:
+                data = self._trim_rows(rows)
+                return self._to_dataframe(data) if HAS_PANDAS else data
+        return None
 
     def find_table_region(
         self,
@@ -109,11 +151,16 @@ class ExcelParser:
             header_keywords = ["합계", "total", "금액", "amount", "견적"]
 
         if HAS_PANDAS and isinstance(data, pd.DataFrame):
-            # Find row containing keywords
-            for idx, row in data.iterrows():
-                row_str = " ".join(str(v).lower() for v in row.values if v is not None)
-                if any(kw.lower() in row_str for kw in header_keywords):
-                    return data.iloc[idx:].reset_index(drop=True)
+            try:
+                from extractors.quote_extractor import row_text_lower
+            except ImportError:
+                from ..extractors.quote_extractor import row_text_lower
+
+            # Find first row containing keywords (column-wise string ops)
+            pattern = "|".join(re.escape(kw.lower()) for kw in header_keywords)
+            matches = row_text_lower(data).str.contains(pattern, regex=True).to_numpy().nonzero()[0]
+            if len(matches):
+                return data.iloc[matches[0]:].reset_index(drop=True)
             return data
 
         # List-based approach
@@ -0,0 +1,168 @@
+"""Persistent parse-result cache keyed by file content hash."""
+
+import hashlib
+import pickle
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_results (
+    content_hash TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version TEXT NOT NULL,
+    data BLOB NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (content_hash, kind)
+) WITHOUT ROWID;
+"""
+
+# Content-addressed blob names (see AttachmentDownloader.BLOB_DIR)
+_SHA256_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ParseCache:
+    """
+    Cache parser/extractor output per file content.
+
+    Rows are keyed by (content_hash, kind) and tagged with the producing
+    parser/extractor version; a version mismatch is treated as a miss and
+    the row is overwritten. Values are pickled (local cache written only
+    by this process), so DataFrames and QuoteOptions round-trip exactly.
+    """
+
+    DB_FILE = ".parse_cache.db"
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file, or a directory to place DB_FILE in
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / self.DB_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._hash_memo: Dict[str, str] = {}
+
+    def close(self):
+        """Close the connection."""
+        self._conn.close()
+
+    def content_hash(self, path: Path) -> str:
+        """
+        SHA-256 of a file.
+
+        Blobs from the content-addressed attachment cache are already
+        named by their hash, so they are not re-read.
+        """
+        path = Path(path)
+        if _SHA256_NAME.match(path.stem):
+            return path.stem
+
+        key = f"{path.resolve()}:{path.stat().st_mtime_ns}"
+        if key not in self._hash_memo:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._hash_memo[key] = digest.hexdigest()
+        return self._hash_memo[key]
+
+    def get_or_compute(
+        self,
+        path: Path,
+        kind: str,
+        version: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached result for a file, computing and storing it on a miss.
+
+        Args:
+            path: Source file
+            kind: Result type (e.g. "pdf", "excel", "quote_options")
+            version: Version of the code producing the result
+            compute: Produces the result on a miss
+
+        Returns:
+            Cached or freshly computed result (a fresh copy on every hit)
+        """
+        found, result = self.lookup(path, kind, version)
+        if found:
+            return result
+
+        result = compute()
+        self.store(path, kind, version, result)
+        return result
+
+    def lookup(self, path: Path, kind: str, version: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            (found, result) - result is None when not found
+        """
+        content_hash = self.content_hash(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, data FROM parse_results WHERE content_hash = ? AND kind = ?",
+                (content_hash, kind),
+            ).fetchone()
+        if row and row[0] == version:
+            try:
+                result = pickle.loads(row[1])
+                self.hits += 1
+                return True, result
+            except Exception:
+                pass  # Corrupt/incompatible row - recompute
+
+        self.misses += 1
+        return False, None
+
+    def store(self, path: Path, kind: str, version: str, result: Any):
+        """Store a result for a file's content."""
+        content_hash = self.content_hash(path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_results (content_hash, kind, version, data, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (content_hash, kind, version, pickle.dumps(result), datetime.now().isoformat()),
+            )
+            self._conn.commit()
+
+    def contains(self, path: Path, kind: str, version: str) -> bool:
+        """Check for a current-version entry without loading it."""
+        content_hash = self.content_hash(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM parse_results WHERE content_hash = ? AND kind = ?",
+                (content_hash, kind),
+            ).fetchone()
+        return bool(row) and row[0] == version
+
+    def cached_pdf(self, parser, path: Path) -> dict:
+        """PDFParser.extract_all through the cache."""
+        return self.get_or_compute(path, "pdf", parser.cache_version, lambda: parser.extract_all(path))
+
+    def cached_excel(self, parser, path: Path) -> dict:
+        """ExcelParser.parse through the cache."""
+        return self.get_or_compute(path, "excel", parser.VERSION, lambda: parser.parse(path))
+
+    def clear(self):
+        """Delete all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM parse_results")
+            self._conn.commit()
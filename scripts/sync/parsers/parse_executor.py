@@ -0,0 +1,196 @@
+"""Isolated attachment parsing in worker processes."""
+
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:  # Windows
+    HAS_RESOURCE = False
+
+
+def parse_pdf(path: Path, full_tables: bool = False) -> dict:
+    """Worker task: PDFParser.extract_all."""
+    try:
+        from .pdf_parser import PDFParser, get_pdf_parser
+    except ImportError:
+        from parsers.pdf_parser import PDFParser, get_pdf_parser
+    parser = PDFParser(full_tables=True) if full_tables else get_pdf_parser()
+    return parser.extract_all(path)
+
+
+def parse_excel(path: Path) -> dict:
+    """Worker task: ExcelParser.parse."""
+    try:
+        from .excel_parser import get_excel_parser
+    except ImportError:
+        from parsers.excel_parser import get_excel_parser
+    return get_excel_parser().parse(path)
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]):
+    """Cap the worker's address space (POSIX only)."""
+    if not memory_limit_mb or not HAS_RESOURCE:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, func: Callable, args: tuple, memory_limit_mb: Optional[int]):
+    """Run one task in the child and send (ok, result_or_error) back."""
+    try:
+        _apply_memory_limit(memory_limit_mb)
+        conn.send((True, func(*args)))
+    except MemoryError:
+        conn.send((False, f"memory limit exceeded ({memory_limit_mb}MB)"))
+    except BaseException as e:
+        conn.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class ParseExecutor:
+    """
+    Run parse tasks in separate processes with per-task limits.
+
+    Each task gets its own process, so a hung or crashing parser
+    (scanned brochures, broken xref tables) is killed on timeout without
+    affecting other files. At most max_workers processes run at once.
+    """
+
+    DEFAULT_TIMEOUT = 120
+    DEFAULT_MEMORY_LIMIT_MB = 1024
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        memory_limit_mb: Optional[int] = DEFAULT_MEMORY_LIMIT_MB,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Concurrent worker processes (default: CPU count, 0 = run inline)
+            timeout: Wall-clock seconds per task
+            memory_limit_mb: Address-space cap per worker (POSIX only, None = no cap)
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max(0, max_workers)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._context = multiprocessing.get_context()
+
+    def run(
+        self,
+        tasks: Iterable[Tuple[Hashable, Callable, tuple]],
+    ) -> Tuple[Dict[Hashable, Any], Dict[Hashable, str]]:
+        """
+        Execute tasks.
+
+        Args:
+            tasks: (key, picklable top-level function, args) tuples
+
+        Returns:
+            (results by key, error messages by key)
+        """
+        pending = list(tasks)
+        results: Dict[Hashable, Any] = {}
+        errors: Dict[Hashable, str] = {}
+
+        if self.max_workers == 0:
+            # Inline mode (debugging) - no isolation or limits
+            for key, func, args in pending:
+                try:
+                    results[key] = func(*args)
+                except Exception as e:
+                    errors[key] = f"{type(e).__name__}: {e}"
+            return results, errors
+
+        running = {}  # reader -> (key, process, deadline)
+        pending.reverse()
+
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                key, func, args = pending.pop()
+                reader, writer = self._context.Pipe(duplex=False)
+                process = self._context.Process(
+                    target=_worker_main,
+                    args=(writer, func, args, self.memory_limit_mb),
+                    daemon=True,
+                )
+                process.start()
+                writer.close()  # Child holds the only writer: EOF on crash
+                running[reader] = (key, process, time.monotonic() + self.timeout)
+
+            next_deadline = min(deadline for _key, _proc, deadline in running.values())
+            for reader in wait(list(running), timeout=max(0.0, next_deadline - time.monotonic())):
+                key, process, _deadline = running.pop(reader)
+                try:
+                    ok, payload = reader.recv()
+                except (EOFError, OSError):
+                    ok, payload = False, None
+                reader.close()
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+
+                if ok:
+                    results[key] = payload
+                else:
+                    errors[key] = payload or f"worker crashed (exit code {process.exitcode})"
+
+            now = time.monotonic()
+            for reader, (key, process, deadline) in list(running.items()):
+                if deadline <= now:
+                    process.kill()
+                    process.join()
+                    reader.close()
+                    del running[reader]
+                    errors[key] = f"timeout after {self.timeout:g}s"
+
+        return results, errors
+
+    def warm_cache(
+        self,
+        cache,
+        jobs: Iterable[Tuple[Path, str, str, Callable]],
+    ) -> Dict[Path, str]:
+        """
+        Parse files missing from a ParseCache in worker processes.
+
+        Results are stored in the cache, so the caller's normal
+        cache-backed parsing path picks them up without re-parsing.
+
+        Args:
+            cache: ParseCache instance
+            jobs: (path, kind, version, worker function taking path) tuples
+
+        Returns:
+            Error messages by path for files that failed, timed out or crashed
+        """
+        tasks = []
+        meta = {}
+        for path, kind, version, func in jobs:
+            key = (Path(path), kind)
+            if key in meta or cache.contains(path, kind, version):
+                continue
+            meta[key] = version
+            tasks.append((key, func, (Path(path),)))
+
+        results, errors = self.run(tasks)
+
+        for (path, kind), result in results.items():
+            cache.store(path, kind, meta[(path, kind)], result)
+
+        return {path: message for (path, _kind), message in errors.items()}
@@ -1,7 +1,8 @@
 """PDF parser for text and table extraction."""
 
+import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 try:
     import pdfplumber
@@ -16,34 +17,140 @@ except ImportError:
     HAS_PANDAS = False
 
 
+# Price hints beyond QuoteExtractor patterns (table headers, bare grouped numbers)
+PRICE_HINT_PATTERNS = [
+    r"\d{1,3}(?:,\d{3})+",
+    r"[$₩]",
+    r"금액|단가|견적|amount|price|pricing|cost",
+]
+
+_price_page_pattern = None
+
+
+def _get_price_page_pattern():
+    """Combined amount/keyword regex for cheap page pruning."""
+    global _price_page_pattern
+    if _price_page_pattern is None:
+        try:
+            from extractors.quote_extractor import QuoteExtractor
+        except ImportError:
+            from ..extractors.quote_extractor import QuoteExtractor
+
+        patterns = [entry[0] for entry in QuoteExtractor.AMOUNT_PATTERNS]
+        patterns += [re.escape(kw) for kw in QuoteExtractor.TOTAL_KEYWORDS]
+        patterns += PRICE_HINT_PATTERNS
+        _price_page_pattern = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    return _price_page_pattern
+
+
 class PDFParser:
     """Extract text and tables from PDF files."""
 
-    def __init__(self):
-        """Initialize parser."""
+    # Bump when output changes (invalidates ParseCache entries)
+    VERSION = "2"
+
+    def __init__(self, full_tables: bool = False):
+        """
+        Initialize parser.
+
+        Args:
+            full_tables: Run table detection on every page. By default only
+                pages whose text contains candidate amounts or total
+                keywords are scanned for tables.
+        """
         if not HAS_PDFPLUMBER:
             print("Warning: pdfplumber not installed. Install with: pip install pdfplumber")
-
-    def extract_text(self, path: Path) -> str:
+        self.full_tables = full_tables
+
+    @property
+    def cache_version(self) -> str:
+        """ParseCache version tag (pruned and full table output differ)."""
+        return f"{self.VERSION}-{'full' if self.full_tables else 'pruned'}"
+
+    @staticmethod
+    def is_price_page(text: str) -> bool:
+        """Cheap check whether a page may contain pricing tables."""
+        return bool(text) and _get_price_page_pattern().search(text) is not None
+
+    def iter_pages(
+        self,
+        path: Path,
+        text: bool = True,
+        tables: bool = True,
+    ) -> Iterator[dict]:
         """
-        Extract all text from PDF.
+        Open the PDF once and yield per-page results.
+
+        Stopping iteration early closes the document, so callers can
+        skip the remaining pages. Unless full_tables is set, table
+        detection (the most expensive step) only runs on pages that pass
+        is_price_page(); the page text is extracted for that check.
 
         Args:
             path: Path to PDF file
+            text: Extract page text
+            tables: Extract page tables
 
-        Returns:
-            Extracted text content
+        Yields:
+            Dict with 'page_number', 'page_count', 'width', 'height',
+            'text', 'tables' and 'tables_scanned' keys
         """
         if not HAS_PDFPLUMBER:
             raise ImportError("pdfplumber required: pip install pdfplumber")
 
-        text_parts = []
         with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+            page_count = len(pdf.pages)
+            for page_number, page in enumerate(pdf.pages, start=1):
+                need_text = text or (tables and not self.full_tables)
+                page_text = (page.extract_text() or "") if need_text else ""
+                scan_tables = tables and (self.full_tables or self.is_price_page(page_text))
+                page_tables = []
+                if scan_tables:
+                    page_tables = [
+                        self._to_table(table)
+                        for table in page.extract_tables()
+                        if table and len(table) > 1  # Has header + data
+                    ]
+
+                yield {
+                    "page_number": page_number,
+                    "page_count": page_count,
+                    "width": page.width,
+                    "height": page.height,
+                    "text": page_text if text else "",
+                    "tables": page_tables,
+                    "tables_scanned": scan_tables,
+                }
+
+                # Release cached layout objects of finished pages
+                close = getattr(page, "close", None)
+                if close:
+                    close()
+
+    @staticmethod
+    def _to_table(table: List[List]):
+        """Convert raw table rows to a DataFrame (or keep list of lists)."""
+        if HAS_PANDAS:
+            header = table[0]
+            data = table[1:]
+            return pd.DataFrame(data, columns=header)
+        return table
 
+    def extract_text(self, path: Path) -> str:
+        """
+        Extract all text from PDF.
+
+        Args:
+            path: Path to PDF file
+
+        Returns:
+            Extracted text content
+        """
+        text_parts = [
+            page["text"]
+            for page in self.iter_pages(path, tables=False)
+            if page["text"]
+        ]
         return "\n\n".join(text_parts)
 
     def extract_tables(self, path: Path) -> List:
@@ -56,49 +163,36 @@ class PDFParser:
         Returns:
             List of pandas DataFrames (or list of lists if pandas not available)
         """
-        if not HAS_PDFPLUMBER:
-            raise ImportError("pdfplumber required: pip install pdfplumber")
-
         tables = []
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                page_tables = page.extract_tables()
-                for table in page_tables:
-                    if table and len(table) > 1:  # Has header + data
-                        if HAS_PANDAS:
-                            # Convert to DataFrame
-                            header = table[0]
-                            data = table[1:]
-                            df = pd.DataFrame(data, columns=header)
-                            tables.append(df)
-                        else:
-                            tables.append(table)
-
+        for page in self.iter_pages(path, text=False):
+            tables.extend(page["tables"])
         return tables
 
     def extract_all(self, path: Path) -> dict:
         """
-        Extract both text and tables.
+        Extract text and tables in a single pass over the document.
 
         Args:
             path: Path to PDF file
 
         Returns:
-            Dict with 'text' and 'tables' keys
+            Dict with 'text', 'tables' and 'page_count' keys
         """
-        return {
-            "text": self.extract_text(path),
-            "tables": self.extract_tables(path),
-            "page_count": self._get_page_count(path),
-        }
+        text_parts = []
+        tables = []
+        page_count = 0
 
-    def _get_page_count(self, path: Path) -> int:
-        """Get number of pages in PDF."""
-        if not HAS_PDFPLUMBER:
-            return 0
+        for page in self.iter_pages(path):
+            page_count = page["page_count"]
+            if page["text"]:
+                text_parts.append(page["text"])
+            tables.extend(page["tables"])
 
-        with pdfplumber.open(path) as pdf:
-            return len(pdf.pages)
+        return {
+            "text": "\n\n".join(text_parts),
+            "tables": tables,
+            "page_count": page_count,
+        }
 
 
 # Singleton instance
@@ -0,0 +1,298 @@
+"""Cached Slack workspace directories (users, channels)."""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+try:
+    from .client_registry import get_api_scheduler
+except ImportError:
+    from client_registry import get_api_scheduler
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "docs" / "management"
+
+
+class SlackUserDirectory:
+    """
+    User id -> name lookups served from a bulk-loaded directory.
+
+    The whole workspace is loaded with paginated users.list calls (tier 2,
+    ~200 users per call) instead of one users.info call per unseen id,
+    and persisted to a JSON cache with a TTL. Ids missing from the
+    snapshot get a single users.info lookup; ids Slack reports as not
+    found / not visible (bots, other workspaces) are negatively cached so
+    they are not re-queried on every message. Ids whose lookup failed
+    transiently (timeouts, 5xx, 429) are skipped for the rest of the run
+    only.
+    """
+
+    CACHE_FILE = ".slack_users.json"
+    DEFAULT_TTL_HOURS = 24
+    NEGATIVE_TTL_HOURS = 24
+    # users.info errors meaning the id is not a (visible) user
+    NEGATIVE_ERRORS = {"user_not_found", "user_not_visible"}
+    PAGE_SIZE = 200
+
+    def __init__(
+        self,
+        client,
+        cache_path: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+    ):
+        """
+        Initialize directory.
+
+        Args:
+            client: SlackClient (or slack_sdk WebClient)
+            cache_path: JSON cache file (None = memory only)
+            ttl_hours: Max age of the bulk snapshot before reloading
+        """
+        self.client = client
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = timedelta(hours=ttl_hours)
+        self.negative_ttl = timedelta(hours=self.NEGATIVE_TTL_HOURS)
+        self._fetched_at: Optional[datetime] = None
+        self._users: Dict[str, dict] = {}
+        self._missing: Dict[str, str] = {}  # user_id -> failed_at (ISO)
+        self._failed: Set[str] = set()  # Transient lookup failures (this run only, not persisted)
+        self._refreshed = False
+        self._dirty = False
+        self._load()
+
+    @property
+    def _web(self):
+        return getattr(self.client, "_client", self.client)
+
+    def _load(self):
+        """Load the cache file (ignored if missing or corrupt)."""
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            self._fetched_at = datetime.fromisoformat(data["fetched_at"]) if data.get("fetched_at") else None
+            self._users = data.get("users", {})
+            self._missing = data.get("missing", {})
+        except Exception:
+            self._fetched_at, self._users, self._missing = None, {}, {}
+
+    def save(self):
+        """Write the cache file if anything changed."""
+        if not self.cache_path or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(
+            json.dumps({
+                "fetched_at": self._fetched_at.isoformat() if self._fetched_at else None,
+                "users": self._users,
+                "missing": self._missing,
+            }, indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        self._dirty = False
+
+    @staticmethod
+    def _entry(member: dict) -> dict:
+        profile = member.get("profile") or {}
+        return {
+            "name": member.get("name", ""),
+            "display_name": profile.get("display_name", ""),
+            "real_name": member.get("real_name") or profile.get("real_name", ""),
+            "deleted": bool(member.get("deleted")),
+        }
+
+    def is_stale(self) -> bool:
+        """Whether the bulk snapshot is missing or older than the TTL."""
+        return self._fetched_at is None or datetime.now() - self._fetched_at > self.ttl
+
+    def refresh(self):
+        """Reload all users with paginated users.list calls."""
+        users: Dict[str, dict] = {}
+        cursor = None
+        while True:
+            params = {"limit": self.PAGE_SIZE}
+            if cursor:
+                params["cursor"] = cursor
+            response = get_api_scheduler().call("slack", "users.list", self._web.users_list, **params)
+            data = getattr(response, "data", response)
+            for member in data.get("members", []):
+                if member.get("id"):
+                    users[member["id"]] = self._entry(member)
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                break
+
+        self._users = users
+        self._missing = {}
+        self._fetched_at = datetime.now()
+        self._refreshed = True
+        self._dirty = True
+        self.save()
+
+    def _ensure_fresh(self):
+        """Reload a stale snapshot (at most once per instance; failures fall back to the cache)."""
+        if self._refreshed or not self.is_stale():
+            return
+        self._refreshed = True
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"Warning: users.list failed, using cached directory: {e}")
+
+    def _is_known_missing(self, user_id: str) -> bool:
+        failed_at = self._missing.get(user_id)
+        if not failed_at:
+            return False
+        try:
+            return datetime.now() - datetime.fromisoformat(failed_at) <= self.negative_ttl
+        except ValueError:
+            return False
+
+    def get(self, user_id: str) -> Optional[dict]:
+        """
+        User entry for an id.
+
+        Returns:
+            Dict with name/display_name/real_name/deleted, or None if unknown
+        """
+        if not user_id:
+            return None
+        self._ensure_fresh()
+
+        if user_id in self._users:
+            return self._users[user_id]
+        if user_id in self._failed or self._is_known_missing(user_id):
+            return None
+
+        # Joined after the snapshot (or not a user) - one lookup
+        try:
+            response = get_api_scheduler().call("slack", "users.info", self._web.users_info, user=user_id)
+            data = getattr(response, "data", response)
+            self._users[user_id] = self._entry(data["user"])
+            self._missing.pop(user_id, None)
+        except Exception as e:
+            # Only definite misses are cached; transient errors (timeouts, 5xx, 429) are retried next run
+            if self._error_code(e) not in self.NEGATIVE_ERRORS:
+                self._failed.add(user_id)
+                return None
+            self._missing[user_id] = datetime.now().isoformat()
+        self._dirty = True
+        return self._users.get(user_id)
+
+    @staticmethod
+    def _error_code(error: Exception) -> Optional[str]:
+        """Slack API error code of a SlackApiError ("user_not_found", ...)."""
+        data = getattr(getattr(error, "response", None), "data", None)
+        return data.get("error") if isinstance(data, dict) else None
+
+    def get_name(self, user_id: str) -> str:
+        """Display name, falling back to username and then the id."""
+        user = self.get(user_id)
+        if not user:
+            return user_id
+        return user.get("display_name") or user.get("name") or user_id
+
+
+class SlackChannelDirectory:
+    """
+    Channel id -> name lookups resolved one channel at a time.
+
+    Names are looked up with conversations.info for the requested id only
+    (instead of paging conversations.list over the whole workspace) and
+    persisted to a JSON cache; each entry expires after the TTL. If a
+    refresh fails, the stale entry is still served.
+    """
+
+    CACHE_FILE = ".slack_channels.json"
+    DEFAULT_TTL_HOURS = 24 * 7
+
+    def __init__(
+        self,
+        client,
+        cache_path: Optional[Path] = None,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+    ):
+        """
+        Initialize directory.
+
+        Args:
+            client: SlackClient (or slack_sdk WebClient)
+            cache_path: JSON cache file (None = memory only)
+            ttl_hours: Max age of a channel entry before re-fetching
+        """
+        self.client = client
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = timedelta(hours=ttl_hours)
+        self._channels: Dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def _web(self):
+        return getattr(self.client, "_client", self.client)
+
+    def _load(self):
+        """Load the cache file (ignored if missing or corrupt)."""
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            self._channels = json.loads(self.cache_path.read_text(encoding="utf-8")).get("channels", {})
+        except Exception:
+            self._channels = {}
+
+    def save(self):
+        """Write the cache file if anything changed."""
+        if not self.cache_path or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(
+            json.dumps({"channels": self._channels}, indent=2, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        self._dirty = False
+
+    def _is_fresh(self, entry: dict) -> bool:
+        try:
+            return datetime.now() - datetime.fromisoformat(entry["fetched_at"]) <= self.ttl
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def get(self, channel_id: str) -> Optional[dict]:
+        """
+        Channel entry for an id (fetched with conversations.info when missing or expired).
+
+        Returns:
+            Dict with id/name/is_private/is_archived, or None if unknown
+        """
+        if not channel_id:
+            return None
+        entry = self._channels.get(channel_id)
+        if entry and self._is_fresh(entry):
+            return entry
+
+        try:
+            response = get_api_scheduler().call("slack", "conversations.info", self._web.conversations_info, channel=channel_id)
+            data = getattr(response, "data", response)
+            channel = data["channel"]
+        except Exception as e:
+            if entry:
+                return entry
+            print(f"Warning: conversations.info failed for {channel_id}: {e}")
+            return None
+
+        entry = {
+            "id": channel_id,
+            "name": channel.get("name", ""),
+            "is_private": bool(channel.get("is_private")),
+            "is_archived": bool(channel.get("is_archived")),
+            "fetched_at": datetime.now().isoformat(),
+        }
+        self._channels[channel_id] = entry
+        self._dirty = True
+        self.save()
+        return entry
+
+    def get_name(self, channel_id: str) -> str:
+        """Channel name, falling back to the id."""
+        entry = self.get(channel_id)
+        return (entry.get("name") if entry else None) or channel_id
@@ -0,0 +1,147 @@
+"""Cursor-based incremental Slack channel history."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .client_registry import get_api_scheduler
+except ImportError:
+    from client_registry import get_api_scheduler
+
+
+@dataclass
+class HistoryMessage:
+    """Channel message from conversations.history (SlackMessage-compatible fields)."""
+
+    ts: str
+    user: Optional[str] = None
+    text: str = ""
+    thread_ts: Optional[str] = None
+    subtype: Optional[str] = None
+
+    @property
+    def timestamp(self) -> Optional[datetime]:
+        """Message time (local)."""
+        try:
+            return datetime.fromtimestamp(float(self.ts))
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def from_api(cls, raw: dict) -> "HistoryMessage":
+        """Build from a raw API message dict."""
+        return cls(
+            ts=raw.get("ts", ""),
+            user=raw.get("user") or raw.get("bot_id"),
+            text=raw.get("text", ""),
+            thread_ts=raw.get("thread_ts"),
+            subtype=raw.get("subtype"),
+        )
+
+
+def to_slack_ts(dt: datetime) -> str:
+    """Convert a datetime to a Slack ts string."""
+    return f"{dt.timestamp():.6f}"
+
+
+def newest_ts(messages: Iterable) -> Optional[str]:
+    """Largest ts among messages (None if empty)."""
+    timestamps = [getattr(m, "ts", None) for m in messages]
+    timestamps = [ts for ts in timestamps if ts]
+    return max(timestamps, key=float) if timestamps else None
+
+
+def fetch_history(
+    client,
+    channel_id: str,
+    oldest: Optional[str] = None,
+    latest: Optional[str] = None,
+    page_size: int = 200,
+) -> List[HistoryMessage]:
+    """
+    Fetch channel history newer than `oldest`, following pagination cursors.
+
+    The time window is applied server-side (oldest/latest are exclusive),
+    so an incremental run only transfers new messages, and long backfills
+    are not truncated by a fixed limit. Pages are paced by the shared
+    ApiScheduler (tier 3) and retried on rate limits.
+
+    Args:
+        client: SlackClient (or slack_sdk WebClient)
+        channel_id: Channel ID
+        oldest: Only messages after this ts
+        latest: Only messages before this ts
+        page_size: Messages per API call (Slack max 1000, recommended 200)
+
+    Returns:
+        Messages, newest first (API order)
+    """
+    web = getattr(client, "_client", client)
+    messages: List[HistoryMessage] = []
+    cursor = None
+
+    while True:
+        params = {"channel": channel_id, "limit": page_size}
+        if oldest:
+            params["oldest"] = oldest
+        if latest:
+            params["latest"] = latest
+        if cursor:
+            params["cursor"] = cursor
+
+        response = get_api_scheduler().call("slack", "conversations.history", web.conversations_history, **params)
+        data = getattr(response, "data", response)
+        messages.extend(HistoryMessage.from_api(m) for m in data.get("messages", []))
+
+        cursor = (data.get("response_metadata") or {}).get("next_cursor")
+        if not data.get("has_more") or not cursor:
+            break
+
+    return messages
+
+
+class SlackCursorStore:
+    """Per-channel 'oldest' ts cursors persisted in a JSON file."""
+
+    CURSOR_FILE = ".slack_cursors.json"
+
+    def __init__(self, path: Path):
+        """
+        Open cursor store.
+
+        Args:
+            path: JSON file, or a directory to place CURSOR_FILE in
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / self.CURSOR_FILE
+        self.path = path
+        self._cursors: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        if self.path.exists():
+            try:
+                return json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                pass
+        return {}
+
+    def get(self, channel_id: str) -> Optional[str]:
+        """Newest ts already synced for a channel."""
+        return self._cursors.get(channel_id)
+
+    def update(self, channel_id: str, ts: Optional[str]):
+        """Advance a channel cursor (never moves backwards)."""
+        if not ts:
+            return
+        current = self._cursors.get(channel_id)
+        if current is None or float(ts) > float(current):
+            self._cursors[channel_id] = ts
+
+    def save(self):
+        """Write cursors to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._cursors, indent=2), encoding="utf-8")
@@ -20,13 +20,19 @@ _wsoptv_root = _script_dir.parents[1]
 _claude_root = _script_dir.parents[2]
 sys.path.insert(0, str(_claude_root))
 
-from lib.slack import SlackClient, SlackMessage, SlackUser  # noqa: E402
+from lib.slack import SlackClient, SlackMessage  # noqa: E402
 
 # Import models from same directory
 try:
     from .models import SyncResult
+    from .client_registry import get_slack_channel_directory, get_slack_client
+    from .slack_history import SlackCursorStore, fetch_history, newest_ts, to_slack_ts
+    from .slack_directory import SlackUserDirectory
 except ImportError:
     from models import SyncResult
+    from client_registry import get_slack_channel_directory, get_slack_client
+    from slack_history import SlackCursorStore, fetch_history, newest_ts, to_slack_ts
+    from slack_directory import SlackUserDirectory
 
 
 class PatternDetector:
@@ -143,21 +149,13 @@ class MarkdownParser:
 class SlackLogFormatter:
     """Format Slack messages to SLACK-LOG.md format."""
 
-    def __init__(self, client: SlackClient):
+    def __init__(self, client: SlackClient, users: Optional[SlackUserDirectory] = None):
         self.client = client
-        self._user_cache: dict[str, SlackUser] = {}
+        self.users = users or SlackUserDirectory(client)
 
     def _get_user_name(self, user_id: str) -> str:
-        """Get user display name with caching."""
-        if user_id not in self._user_cache:
-            try:
-                user = self.client.get_user(user_id)
-                self._user_cache[user_id] = user
-            except Exception:
-                return user_id
-
-        user = self._user_cache[user_id]
-        return user.display_name or user.name or user_id
+        """Get user display name from the cached user directory."""
+        return self.users.get_name(user_id)
 
     def format_message(
         self,
@@ -215,15 +213,20 @@ def sync_slack_to_log(
     channel_id: str = "C09TX3M1J2W",
     days: int = 7,
     dry_run: bool = False,
+    full: bool = False,
 ) -> SyncResult:
     """
     Sync Slack channel to SLACK-LOG.md.
 
+    Only messages newer than the channel's stored cursor (and within the
+    day window) are fetched; the cursor advances after a successful write.
+
     Args:
         log_path: Path to SLACK-LOG.md
         channel_id: Slack channel ID
         days: Number of days to fetch
         dry_run: If True, only show what would be added
+        full: Ignore the stored cursor and backfill the whole day window
 
     Returns:
         SyncResult with counts
@@ -231,23 +234,23 @@ def sync_slack_to_log(
     result = SyncResult()
 
     # Initialize client
-    client = SlackClient()
-    formatter = SlackLogFormatter(client)
-
-    # Get channel name
-    channels = client.list_channels(include_private=True)
-    channel_name = next(
-        (ch.name for ch in channels if ch.id == channel_id),
-        channel_id,
-    )
-
-    # Fetch messages
-    print(f"Fetching messages from #{channel_name} (last {days} days)...")
-    messages = client.get_history(channel_id, limit=1000)
-
-    # Filter by date range
-    cutoff_date = datetime.now() - timedelta(days=days)
-    messages = [msg for msg in messages if msg.timestamp and msg.timestamp >= cutoff_date]
+    client = get_slack_client()
+    users = SlackUserDirectory(client, log_path.parent / SlackUserDirectory.CACHE_FILE)
+    formatter = SlackLogFormatter(client, users)
+
+    # Get channel name (cached conversations.info, no workspace-wide listing)
+    channel_name = get_slack_channel_directory().get_name(channel_id)
+
+    # Fetch messages (server-side window: after cutoff and after the stored cursor)
+    cursors = SlackCursorStore(log_path.parent / SlackCursorStore.CURSOR_FILE)
+    oldest = to_slack_ts(datetime.now() - timedelta(days=days))
+    cursor = None if full else cursors.get(channel_id)
+    if cursor and float(cursor) > float(oldest):
+        oldest = cursor
+        print(f"Fetching messages from #{channel_name} (since cursor {cursor})...")
+    else:
+        print(f"Fetching messages from #{channel_name} (last {days} days)...")
+    messages = fetch_history(client, channel_id, oldest=oldest)
 
     print(f"Found {len(messages)} messages")
 
@@ -300,6 +303,7 @@ def sync_slack_to_log(
         formatted = formatter.format_date_section(date, msgs)
         new_entries.append((date, formatted))
         result.added += len(msgs)
+    users.save()
 
     if dry_run:
         print("\n=== DRY RUN ===")
@@ -345,6 +349,10 @@ def sync_slack_to_log(
     log_path.write_text(log_content, encoding="utf-8")
     print(f"\nSynced to {log_path}")
 
+    # Advance cursor only after the log is written
+    cursors.update(channel_id, newest_ts(messages))
+    cursors.save()
+
     return result
 
 
@@ -409,6 +417,11 @@ def main():
         action="store_true",
         help="Show what would be synced without writing",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the stored cursor and backfill the whole --days window",
+    )
 
     args = parser.parse_args()
 
@@ -417,6 +430,7 @@ def main():
         channel_id=args.channel,
         days=args.days,
         dry_run=args.dry_run,
+        full=args.full,
     )
 
     print(f"\n{result}")
@@ -0,0 +1,268 @@
+"""SQLite storage engine for incremental sync state."""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# Processed ID kinds
+KIND_EMAIL = "email"
+KIND_THREAD = "thread"
+KIND_SLACK = "slack"
+
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS processed_ids (
+    kind TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    processed_at TEXT NOT NULL,
+    PRIMARY KEY (kind, item_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS vendor_states (
+    vendor TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quotes (
+    vendor TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data TEXT NOT NULL,
+    detected_at TEXT NOT NULL
+);
+"""
+
+# vendor_states / quotes share the same row layout
+_RECORD_TABLES = ("vendor_states", "quotes")
+
+
+def is_sqlite_path(path: Path) -> bool:
+    """Check if a state file path selects the SQLite backend."""
+    return Path(path).suffix.lower() in SQLITE_SUFFIXES
+
+
+class SqliteStateStore:
+    """
+    SQLite-backed key/value and processed-ID store.
+
+    Writes are buffered in an open transaction until commit(), so callers
+    keep the JSON state semantics where nothing persists until save().
+    """
+
+    SCHEMA_VERSION = "1"
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the database.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if self.get_meta("schema_version") is None:
+            self.set_meta("schema_version", self.SCHEMA_VERSION)
+            self.commit()
+
+    def close(self):
+        """Close the connection (uncommitted changes are discarded)."""
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Transactions
+    # ------------------------------------------------------------------
+
+    def commit(self):
+        """Commit pending changes."""
+        self._conn.commit()
+
+    def rollback(self):
+        """Discard pending changes."""
+        self._conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """Commit on success, roll back on error."""
+        try:
+            yield self
+        except Exception:
+            self._conn.rollback()
+            raise
+        else:
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Meta
+    # ------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Get a meta value."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: Optional[str]):
+        """Set a meta value."""
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ------------------------------------------------------------------
+    # Processed IDs
+    # ------------------------------------------------------------------
+
+    def is_processed(self, kind: str, item_id: str) -> bool:
+        """Check if an ID of the given kind was processed."""
+        row = self._conn.execute(
+            "SELECT 1 FROM processed_ids WHERE kind = ? AND item_id = ?",
+            (kind, item_id),
+        ).fetchone()
+        return row is not None
+
+    def mark_processed(self, kind: str, item_ids: Iterable[str]):
+        """Mark IDs of the given kind as processed (idempotent)."""
+        now = datetime.now().isoformat()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO processed_ids (kind, item_id, processed_at) VALUES (?, ?, ?)",
+            ((kind, item_id, now) for item_id in item_ids if item_id),
+        )
+
+    def count_processed(self, kind: str) -> int:
+        """Count processed IDs of the given kind."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM processed_ids WHERE kind = ?", (kind,)
+        ).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Vendor states / quotes
+    # ------------------------------------------------------------------
+
+    def get_record(self, table: str, vendor: str) -> Optional[dict]:
+        """Get a vendor row from vendor_states or quotes."""
+        self._check_table(table)
+        row = self._conn.execute(
+            f"SELECT data FROM {table} WHERE vendor = ?", (vendor,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_record(self, table: str, vendor: str, data: dict):
+        """Insert or replace a vendor row in vendor_states or quotes."""
+        self._check_table(table)
+        self._conn.execute(
+            f"INSERT INTO {table} (vendor, data, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(vendor) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+            (vendor, json.dumps(data, ensure_ascii=False, default=str), datetime.now().isoformat()),
+        )
+
+    def count_records(self, table: str) -> int:
+        """Count rows in vendor_states or quotes."""
+        self._check_table(table)
+        return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @staticmethod
+    def _check_table(table: str):
+        if table not in _RECORD_TABLES:
+            raise ValueError(f"Unknown record table: {table}")
+
+    # ------------------------------------------------------------------
+    # Pending transitions
+    # ------------------------------------------------------------------
+
+    def add_pending(self, data: dict):
+        """Append a pending transition/change."""
+        self._conn.execute(
+            "INSERT INTO pending_transitions (data, detected_at) VALUES (?, ?)",
+            (
+                json.dumps(data, ensure_ascii=False, default=str),
+                data.get("detected_at") or datetime.now().isoformat(),
+            ),
+        )
+
+    def list_pending(self) -> List[dict]:
+        """List pending transitions in insertion order."""
+        rows = self._conn.execute("SELECT data FROM pending_transitions ORDER BY id").fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def count_pending(self) -> int:
+        """Count pending transitions."""
+        return self._conn.execute("SELECT COUNT(*) FROM pending_transitions").fetchone()[0]
+
+    def clear_pending(self):
+        """Delete all pending transitions."""
+        self._conn.execute("DELETE FROM pending_transitions")
+
+    # ------------------------------------------------------------------
+    # Migration
+    # ------------------------------------------------------------------
+
+    def import_json_state(self, state: dict) -> dict:
+        """
+        Import a JSON state file (v1 .slacklist_state.json or v2 .sync_state_v2.json).
+
+        Args:
+            state: Parsed JSON state
+
+        Returns:
+            Dict with imported counts
+        """
+        processed = state.get("processed", {})
+        gmail = processed.get("gmail", {})
+        slack = processed.get("slack", {})
+
+        email_ids = list(state.get("processed_emails", [])) + list(gmail.get("email_ids", []))
+        thread_ids = list(state.get("processed_threads", []))
+        slack_ts = list(slack.get("message_ts", []))
+        vendors = state.get("vendor_states") or state.get("vendors") or {}
+        quotes = state.get("quotes", {})
+        pending = state.get("pending_transitions") or state.get("pending_changes") or []
+
+        with self.transaction():
+            self.mark_processed(KIND_EMAIL, email_ids)
+            self.mark_processed(KIND_THREAD, thread_ids)
+            self.mark_processed(KIND_SLACK, slack_ts)
+            for vendor, data in vendors.items():
+                self.put_record("vendor_states", vendor, data)
+            for vendor, data in quotes.items():
+                self.put_record("quotes", vendor, data)
+            for item in pending:
+                self.add_pending(item)
+            for key, value in (
+                ("last_sync", state.get("last_sync")),
+                ("gmail_history_id", gmail.get("history_id")),
+                ("gmail_last_email_date", gmail.get("last_email_date")),
+                ("slack_last_ts", slack.get("last_ts")),
+            ):
+                if value:
+                    self.set_meta(key, str(value))
+
+        return {
+            "emails": len(set(email_ids)),
+            "threads": len(set(thread_ids)),
+            "slack": len(set(slack_ts)),
+            "vendors": len(vendors),
+            "quotes": len(quotes),
+            "pending": len(pending),
+        }
+
+    def import_json_file(self, json_path: Path) -> dict:
+        """Import a JSON state file from disk and record its origin."""
+        state = json.loads(Path(json_path).read_text(encoding="utf-8"))
+        counts = self.import_json_state(state)
+        self.set_meta("migrated_from", str(json_path))
+        self.commit()
+        return counts
@@ -0,0 +1,140 @@
+"""Vendor resolution from sender addresses and message text."""
+
+import threading
+from email.utils import parseaddr
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    from .keyword_matcher import KeywordMatcher
+except ImportError:
+    from keyword_matcher import KeywordMatcher
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "wsoptv_sync_config.yaml"
+
+
+class VendorResolver:
+    """
+    Resolve vendors from config `vendors` entries.
+
+    - Sender addresses are parsed once and their domain suffixes looked up
+      in a hash map ("mail.brightcove.com" -> "brightcove.com"); entries
+      without a dot (e.g. "jrmax") match any domain label.
+    - Subject/body hints (vendor names + keywords) go through one
+      KeywordMatcher; on multiple hits the earlier vendor in config wins.
+    - Resolved addresses are memoized.
+    """
+
+    ADDRESS_CACHE_SIZE = 4096
+
+    def __init__(self, vendors: Iterable):
+        """
+        Build lookup tables.
+
+        Args:
+            vendors: VendorMapping list (name, domains, keywords)
+        """
+        self.vendors = list(vendors)
+        self._by_name = {v.name.lower(): v for v in self.vendors}
+        self._domains: Dict[str, object] = {}
+        self._labels: Dict[str, object] = {}
+        self._matcher = KeywordMatcher()
+
+        for index, vendor in enumerate(self.vendors):
+            for domain in vendor.domains:
+                domain = domain.lower().strip().lstrip("@")
+                table = self._domains if "." in domain else self._labels
+                table.setdefault(domain, vendor)  # First vendor in config wins
+            for keyword in [vendor.name, *getattr(vendor, "keywords", [])]:
+                self._matcher.add(index, keyword)
+
+        self._categories = list(range(len(self.vendors)))
+        self._resolve_address = lru_cache(maxsize=self.ADDRESS_CACHE_SIZE)(self._lookup_address)
+
+    @classmethod
+    def from_yaml(cls, path: Optional[Path] = None) -> "VendorResolver":
+        """Build from a sync config file (default: wsoptv_sync_config.yaml)."""
+        try:
+            from .config_models import ProjectConfig
+        except ImportError:
+            from config_models import ProjectConfig
+        return cls(ProjectConfig.from_yaml(Path(path or DEFAULT_CONFIG_PATH)).vendors)
+
+    @staticmethod
+    def parse_address(sender: str) -> Tuple[str, str]:
+        """
+        Split a sender header into (address, domain), both lowercased.
+
+        Accepts "Name <user@domain>" as well as bare addresses.
+        """
+        _name, address = parseaddr(sender or "")
+        address = (address or sender or "").strip().lower()
+        domain = address.rsplit("@", 1)[-1].strip(" .>") if "@" in address else ""
+        return address, domain
+
+    def resolve_domain(self, domain: str):
+        """Vendor for a domain (or any parent domain / matching label)."""
+        labels = domain.lower().split(".") if domain else []
+        for i in range(len(labels) - 1):
+            vendor = self._domains.get(".".join(labels[i:]))
+            if vendor:
+                return vendor
+        if self._labels:
+            for label in labels:
+                vendor = self._labels.get(label)
+                if vendor:
+                    return vendor
+        return None
+
+    def _lookup_address(self, sender: str):
+        return self.resolve_domain(self.parse_address(sender)[1])
+
+    def resolve_address(self, sender: str):
+        """
+        Vendor for a sender/recipient header (memoized).
+
+        Args:
+            sender: "Name <user@domain>" or bare address
+
+        Returns:
+            VendorMapping or None
+        """
+        return self._resolve_address(sender or "")
+
+    def resolve_text(self, *texts: str):
+        """Vendor mentioned in subject/body text (one matcher pass per text)."""
+        for text in texts:
+            if not text:
+                continue
+            hit = KeywordMatcher.first(self._matcher.iter_hits(text), self._categories)
+            if hit:
+                return self.vendors[hit.category]
+        return None
+
+    def resolve(self, sender: str = "", subject: str = "", body: str = ""):
+        """
+        Resolve by sender domain first, then subject, then body hints.
+
+        Returns:
+            VendorMapping or None
+        """
+        return self.resolve_address(sender) or self.resolve_text(subject, body)
+
+    def get_by_name(self, name: str):
+        """Vendor by exact (case-insensitive) name."""
+        return self._by_name.get((name or "").lower())
+
+
+# Singleton instance
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_vendor_resolver(config_path: Optional[Path] = None) -> VendorResolver:
+    """Get singleton VendorResolver built from the sync config."""
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = VendorResolver.from_yaml(config_path)
+    return _resolver